@@ -1,12 +1,19 @@
 import pandas as pd
+import numpy as np
 import re
 import json
 import logging
 import argparse
+import multiprocessing
+import os
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Iterable, Iterator, List, Tuple
 from datetime import datetime
 import warnings
+from keyword_matcher import get_keyword_matcher
+from sentiment_cache import get_sentiment_cache, score_texts_cached
 warnings.filterwarnings('ignore')
 
 # 키워드 그룹 정의
@@ -53,6 +60,10 @@ except ImportError:
     logger.warning("HuggingFace transformers가 설치되지 않았습니다. 텍스트 분석 기능을 사용할 수 없습니다.")
 
 
+# 연속 공백 패턴 (preprocess / preprocess_series 공용)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
 def preprocess(text: str) -> str:
     """
     한국어 리뷰 텍스트 전처리
@@ -64,7 +75,7 @@ def preprocess(text: str) -> str:
         return ""
     
     # 공백 정규화 및 연속 공백 제거
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = WHITESPACE_PATTERN.sub(' ', text.strip())
     
     # 필요시 추가 전처리: 이모지, URL, 특수문자 처리 등
     # text = re.sub(r'http\S+', '', text)  # URL 제거 (선택사항)
@@ -72,6 +83,40 @@ def preprocess(text: str) -> str:
     return text
 
 
+def preprocess_series(texts: pd.Series) -> pd.Series:
+    """
+    리뷰 텍스트 Series 전처리 (preprocess의 벡터 버전, 결과 동일)
+    
+    같은 원문은 factorize로 한 번만 pandas 문자열 연산으로 처리하고 결과를 모든 행에 broadcast
+    (문자열이 아니거나 결측값이면 빈 문자열)
+    """
+    codes, uniques = pd.factorize(texts)
+    values = np.asarray(uniques, dtype=object)
+    is_text = np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=len(values))
+    
+    # 마지막 칸은 결측값(코드 -1)용 빈 문자열
+    cleaned = np.full(len(values) + 1, "", dtype=object)
+    if is_text.any():
+        cleaned[:-1][is_text] = (
+            pd.Series(values[is_text], dtype=object)
+            .str.strip()
+            .str.replace(WHITESPACE_PATTERN, ' ', regex=True)
+            .to_numpy()
+        )
+    return pd.Series(cleaned[codes], index=texts.index, dtype=object)
+
+
+def dedup_stats(clean_texts: pd.Series) -> Dict:
+    """전처리된 텍스트의 중복 통계 (texts: 전체 수, unique_texts: 고유 텍스트 수, dedup_ratio: 중복 비율)"""
+    total = len(clean_texts)
+    unique = int(clean_texts.nunique())
+    return {
+        "texts": total,
+        "unique_texts": unique,
+        "dedup_ratio": round(1 - unique / total, 4) if total else 0.0,
+    }
+
+
 def rating_to_score(rating: int) -> float:
     """
     별점(1-5)을 감정 스코어(-1.0 ~ 1.0)로 변환
@@ -80,6 +125,18 @@ def rating_to_score(rating: int) -> float:
     return mapping.get(int(rating), 0.0)
 
 
+def ratings_to_scores(ratings) -> np.ndarray:
+    """
+    별점 배열을 감정 스코어 배열로 변환 (rating_to_score의 벡터 버전)
+    
+    소수 별점은 rating_to_score와 같이 정수 부분만 사용하고,
+    1~5 범위 밖이거나 숫자가 아닌 값, 결측값은 0.0
+    """
+    values = np.trunc(pd.to_numeric(pd.Series(ratings), errors='coerce').to_numpy(dtype=np.float64))
+    in_range = (values >= 1) & (values <= 5)
+    return np.where(in_range, (values - 3) / 2, 0.0)
+
+
 # HuggingFace 모델 전역 변수
 _sentiment_pipeline = None
 
@@ -154,6 +211,59 @@ def load_sentiment_model(model_name: Optional[str] = None, use_gpu: bool = False
         return None
 
 
+# 모델 입력 최대 토큰 수 (KcELECTRA 등 BERT 계열 기준)
+MAX_MODEL_TOKENS = 512
+
+# 감정 스코어 캐시 키에 포함되는 HuggingFace 분석 방식 버전 (스코어 계산 방식 변경 시 올림)
+HF_SCORE_VERSION = "v1"
+
+
+def _max_input_length(pipeline_obj) -> int:
+    """파이프라인 토크나이저의 최대 입력 길이 (알 수 없으면 MAX_MODEL_TOKENS)"""
+    tokenizer = getattr(pipeline_obj, 'tokenizer', None)
+    model_max_length = getattr(tokenizer, 'model_max_length', None) or MAX_MODEL_TOKENS
+    return min(int(model_max_length), MAX_MODEL_TOKENS)
+
+
+def _label_to_score(result) -> float:
+    """
+    pipeline 결과를 감정 스코어(-1.0 ~ 1.0)로 변환
+    결과 형식: {'label': 'POSITIVE', 'score': 0.9} 또는 {'label': 'LABEL_1', 'score': 0.9}
+    (단일 텍스트 입력 시 [{'label': ..., 'score': ...}] 리스트로 반환됨)
+    """
+    if isinstance(result, list):
+        if not result:
+            return 0.0
+        result = result[0]
+    
+    if not isinstance(result, dict):
+        return 0.0
+    
+    label = str(result.get('label', '')).upper()
+    score = float(result.get('score', 0.0))
+    
+    # 라벨에 따른 감정 스코어 변환
+    # 긍정 라벨: POSITIVE, 긍정, LABEL_1, 1 등
+    # 부정 라벨: NEGATIVE, 부정, LABEL_0, 0 등
+    
+    if any(keyword in label for keyword in ['POS', '긍정', 'LABEL_1', '1', 'POSITIVE']):
+        # 긍정: 0~1 점수를 -1~1로 변환 (0.5 기준)
+        return (score - 0.5) * 2  # 0.5 -> 0, 1.0 -> 1.0, 0.0 -> -1.0
+    elif any(keyword in label for keyword in ['NEG', '부정', 'LABEL_0', '0', 'NEGATIVE']):
+        # 부정: 점수를 반전하여 -1~0 범위로 변환
+        return -(score - 0.5) * 2  # 0.5 -> 0, 1.0 -> -1.0, 0.0 -> 1.0
+    else:
+        # 라벨을 알 수 없는 경우, 점수 기반으로 추정
+        # 높은 점수면 긍정, 낮은 점수면 부정으로 가정
+        return (score - 0.5) * 2
+
+
+def get_model_name(pipeline_obj) -> str:
+    """파이프라인에 로드된 모델 이름 (캐시 키용)"""
+    model = getattr(pipeline_obj, 'model', None)
+    return str(getattr(model, 'name_or_path', None) or 'unknown')
+
+
 def analyze_text_sentiment(text: str, pipeline_obj=None) -> Optional[float]:
     """
     HuggingFace를 사용하여 텍스트 감성분석 수행
@@ -166,47 +276,97 @@ def analyze_text_sentiment(text: str, pipeline_obj=None) -> Optional[float]:
         return 0.0
     
     try:
-        # 텍스트 길이 제한 (모델 최대 길이 고려)
-        max_length = 512
-        if len(text) > max_length:
-            text = text[:max_length]
-        
-        # 감성분석 수행
-        result = pipeline_obj(text)
-        
-        # 결과 파싱
-        # pipeline 결과 형식: {'label': 'POSITIVE', 'score': 0.9} 또는 {'label': 'LABEL_1', 'score': 0.9}
-        
-        if isinstance(result, dict):
-            label = str(result.get('label', '')).upper()
-            score = float(result.get('score', 0.0))
-            
-            # 라벨에 따른 감정 스코어 변환
-            # 긍정 라벨: POSITIVE, 긍정, LABEL_1, 1 등
-            # 부정 라벨: NEGATIVE, 부정, LABEL_0, 0 등
-            
-            if any(keyword in label for keyword in ['POS', '긍정', 'LABEL_1', '1', 'POSITIVE']):
-                # 긍정: 0~1 점수를 -1~1로 변환 (0.5 기준)
-                return (score - 0.5) * 2  # 0.5 -> 0, 1.0 -> 1.0, 0.0 -> -1.0
-            elif any(keyword in label for keyword in ['NEG', '부정', 'LABEL_0', '0', 'NEGATIVE']):
-                # 부정: 점수를 반전하여 -1~0 범위로 변환
-                return -(score - 0.5) * 2  # 0.5 -> 0, 1.0 -> -1.0, 0.0 -> 1.0
-            else:
-                # 라벨을 알 수 없는 경우, 점수 기반으로 추정
-                # 높은 점수면 긍정, 낮은 점수면 부정으로 가정
-                return (score - 0.5) * 2
-        
-        elif isinstance(result, list) and len(result) > 0:
-            # 리스트 형태인 경우 첫 번째 결과 사용
-            return analyze_text_sentiment(text, pipeline_obj)
+        # 텍스트 길이 제한 (모델 최대 토큰 수 기준으로 잘라냄)
+        with torch.inference_mode():
+            result = pipeline_obj(text, truncation=True, max_length=_max_input_length(pipeline_obj))
         
-        return 0.0
+        return _label_to_score(result)
         
     except Exception as e:
         logger.debug(f"텍스트 분석 중 오류: {e}")
         return None
 
 
+def _token_lengths(texts: List[str], pipeline_obj, max_length: int) -> List[int]:
+    """텍스트별 토큰 수 (토크나이저가 없으면 문자 수로 근사)"""
+    tokenizer = getattr(pipeline_obj, 'tokenizer', None)
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(texts, truncation=True, max_length=max_length)
+            return [len(ids) for ids in encoded['input_ids']]
+        except Exception as e:
+            logger.debug(f"토큰 길이 계산 실패, 문자 수로 대체: {e}")
+    return [min(len(text), max_length) for text in texts]
+
+
+def analyze_texts_sentiment(texts: List[str], pipeline_obj=None, batch_size: int = 32,
+                            max_tokens: int = 8192) -> List[Optional[float]]:
+    """
+    HuggingFace 배치 감성분석
+    토큰 길이순으로 정렬한 뒤 패딩 포함 토큰 수가 max_tokens 이하인 배치로 묶어
+    추론하고, 결과는 입력 순서대로 반환
+    
+    Args:
+        texts: 분석할 텍스트 리스트
+        pipeline_obj: load_sentiment_model()로 로드한 파이프라인
+        batch_size: 배치당 최대 텍스트 수
+        max_tokens: 배치당 최대 토큰 수 (배치 크기 × 배치 내 최장 토큰 수)
+    
+    Returns:
+        텍스트별 감정 스코어 리스트 (-1.0 ~ 1.0, 분석 실패 시 None)
+    """
+    scores: List[Optional[float]] = [None] * len(texts)
+    if not HF_AVAILABLE or pipeline_obj is None:
+        return scores
+    
+    # 빈 텍스트는 중립 처리
+    pending = []
+    for i, text in enumerate(texts):
+        if not text or len(text.strip()) == 0:
+            scores[i] = 0.0
+        else:
+            pending.append(i)
+    if not pending:
+        return scores
+    
+    max_length = _max_input_length(pipeline_obj)
+    lengths = _token_lengths([texts[i] for i in pending], pipeline_obj, max_length)
+    order = sorted(zip(pending, lengths), key=lambda item: item[1])
+    
+    # 길이가 비슷한 텍스트끼리 배치 구성 (정렬되어 있으므로 마지막 항목이 최장)
+    batches = []
+    current = []
+    for i, length in order:
+        if current and (len(current) >= batch_size or (len(current) + 1) * length > max_tokens):
+            batches.append(current)
+            current = []
+        current.append(i)
+    if current:
+        batches.append(current)
+    
+    logger.info(f"배치 감성분석: 텍스트 {len(pending)}개, 배치 {len(batches)}개")
+    
+    done = 0
+    for batch in batches:
+        batch_texts = [texts[i] for i in batch]
+        try:
+            with torch.inference_mode():
+                results = pipeline_obj(batch_texts, batch_size=len(batch_texts),
+                                       truncation=True, max_length=max_length)
+            for i, result in zip(batch, results):
+                scores[i] = _label_to_score(result)
+        except Exception as e:
+            # 배치 실패 시 개별 분석으로 대체
+            logger.debug(f"배치 분석 중 오류, 개별 분석으로 대체: {e}")
+            for i in batch:
+                scores[i] = analyze_text_sentiment(texts[i], pipeline_obj)
+        
+        done += len(batch)
+        logger.info(f"텍스트 분석 진행 중: {done}/{len(pending)}")
+    
+    return scores
+
+
 def calculate_hybrid_sentiment(rating_score: float, text_score: Optional[float], 
                               rating_weight: float = 0.3, text_weight: float = 0.7) -> float:
     """
@@ -221,7 +381,7 @@ def calculate_hybrid_sentiment(rating_score: float, text_score: Optional[float],
     Returns:
         결합된 감정 스코어 (-1.0 ~ 1.0)
     """
-    if text_score is None:
+    if text_score is None or pd.isna(text_score):
         # 텍스트 분석이 불가능한 경우 별점만 사용
         return rating_score
     
@@ -237,6 +397,53 @@ def calculate_hybrid_sentiment(rating_score: float, text_score: Optional[float],
     return max(-1.0, min(1.0, hybrid_score))
 
 
+def hybrid_sentiment_scores(rating_scores, text_scores, rating_weight: float = 0.3,
+                            text_weight: float = 0.7) -> np.ndarray:
+    """
+    별점 / 텍스트 스코어 배열을 결합한 하이브리드 감정 스코어 배열 (calculate_hybrid_sentiment의 벡터 버전)
+    
+    Args:
+        rating_scores: 별점 기반 스코어 배열
+        text_scores: 텍스트 분석 스코어 배열 (분석하지 못한 리뷰는 None 또는 NaN)
+        rating_weight / text_weight: 별점 / 텍스트 가중치 (합이 1이 되도록 정규화)
+    
+    Returns:
+        텍스트 스코어가 있으면 가중 평균을 -1.0 ~ 1.0으로 제한한 값, 없으면 별점 스코어
+    """
+    rating_scores = np.asarray(rating_scores, dtype=np.float64)
+    text_scores = pd.to_numeric(pd.Series(text_scores, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+    
+    total_weight = rating_weight + text_weight
+    rating_weight = rating_weight / total_weight
+    text_weight = text_weight / total_weight
+    
+    hybrid = np.clip(rating_scores * rating_weight + text_scores * text_weight, -1.0, 1.0)
+    return np.where(np.isnan(text_scores), rating_scores, hybrid)
+
+
+def load_keywords(keywords_path: str) -> pd.DataFrame:
+    """
+    키워드 CSV 파일 로드 (헤더 없이 한 줄에 키워드 하나)
+    """
+    if not Path(keywords_path).exists():
+        raise FileNotFoundError(f"키워드 파일을 찾을 수 없습니다: {keywords_path}")
+    
+    keywords = pd.read_csv(keywords_path, header=None, names=['keyword'])
+    keywords = keywords.dropna()
+    logger.info(f"키워드 데이터 로드 완료: {len(keywords)}개")
+    return keywords
+
+
+# 리뷰 CSV 필수 컬럼
+REQUIRED_REVIEW_COLUMNS = ['review_id', 'text', 'rating']
+
+
+def _check_review_columns(reviews: pd.DataFrame):
+    missing_cols = [col for col in REQUIRED_REVIEW_COLUMNS if col not in reviews.columns]
+    if missing_cols:
+        raise ValueError(f"필수 컬럼이 없습니다: {missing_cols}")
+
+
 def load_data(reviews_path: str, keywords_path: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     CSV 파일 로드 및 검증
@@ -250,18 +457,10 @@ def load_data(reviews_path: str, keywords_path: str) -> Tuple[pd.DataFrame, pd.D
         logger.info(f"리뷰 데이터 로드 완료: {len(reviews)}개")
         
         # 필수 컬럼 검증
-        required_cols = ['review_id', 'text', 'rating']
-        missing_cols = [col for col in required_cols if col not in reviews.columns]
-        if missing_cols:
-            raise ValueError(f"필수 컬럼이 없습니다: {missing_cols}")
+        _check_review_columns(reviews)
         
         # 키워드 데이터 로드
-        if not Path(keywords_path).exists():
-            raise FileNotFoundError(f"키워드 파일을 찾을 수 없습니다: {keywords_path}")
-        
-        keywords = pd.read_csv(keywords_path, header=None, names=['keyword'])
-        keywords = keywords.dropna()
-        logger.info(f"키워드 데이터 로드 완료: {len(keywords)}개")
+        keywords = load_keywords(keywords_path)
         
         return reviews, keywords
     
@@ -270,75 +469,421 @@ def load_data(reviews_path: str, keywords_path: str) -> Tuple[pd.DataFrame, pd.D
         raise
 
 
-def match_keywords(reviews: pd.DataFrame, keywords: pd.DataFrame) -> pd.DataFrame:
+def iter_review_chunks(reviews_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
     """
-    리뷰 텍스트에서 키워드 매칭
-    개선사항: 정규식 사용, 대소문자 무시, 단어 경계 고려
+    리뷰 CSV 파일을 chunksize 행씩 읽기 (파일 전체를 메모리에 올리지 않음)
+    
+    Yields:
+        리뷰 청크 DataFrame (첫 청크에서 필수 컬럼 검증)
     """
-    rows = []
+    if not Path(reviews_path).exists():
+        raise FileNotFoundError(f"리뷰 파일을 찾을 수 없습니다: {reviews_path}")
+    
+    with pd.read_csv(reviews_path, chunksize=chunksize) as reader:
+        for i, chunk in enumerate(reader):
+            if i == 0:
+                _check_review_columns(chunk)
+            yield chunk
+
+
+# 매칭 결과에 붙일 리뷰 컬럼과 컬럼이 없을 때의 기본값
+MATCH_COLUMN_DEFAULTS = {
+    "review_id": None,
+    "app_id": None,
+    "sentiment_score": 0.0,
+    "rating_score": 0.0,
+    "text_score": None,
+    "rating": None,
+    "text": "",
+}
+
+
+def _keyword_entries(keyword_df: pd.DataFrame) -> List[Tuple[str, Optional[str]]]:
+    """키워드 DataFrame을 (keyword, keyword_group) 목록으로 변환 (keyword_group 컬럼은 선택)"""
+    keywords = [str(kw).strip() for kw in keyword_df["keyword"]]
+    if "keyword_group" in keyword_df.columns:
+        groups = [str(group).strip() for group in keyword_df["keyword_group"]]
+    else:
+        groups = [None] * len(keywords)
+    return list(zip(keywords, groups))
+
+
+def _tagged_keyword_match_table(reviews: pd.DataFrame, keyword_col: str,
+                                entries: List[Tuple[str, Optional[str]]]) -> pd.DataFrame:
+    """리뷰에 이미 태깅된 키워드(쉼표 구분)를 키워드 목록과 조인하여 매칭 테이블 생성"""
+    tagged = reviews[keyword_col].astype(str).str.strip()
+    tagged = pd.DataFrame({
+        "row": np.arange(len(reviews), dtype=np.int64),
+        "keyword": tagged.where(tagged.str.len() > 0).str.split(","),
+    }).explode("keyword").dropna(subset=["keyword"])
+    tagged["keyword"] = tagged["keyword"].str.strip()
+    tagged = tagged.drop_duplicates()
+    
+    keyword_ids = pd.DataFrame({
+        "keyword": [kw for kw, _ in entries],
+        "kw_id": np.arange(len(entries), dtype=np.int32),
+    })
+    table = tagged.merge(keyword_ids, on="keyword", how="inner")[["row", "kw_id"]]
+    return table.sort_values(["row", "kw_id"], kind="stable").reset_index(drop=True)
+
+
+def build_match_table(reviews: pd.DataFrame, keyword_df: pd.DataFrame,
+                      use_tagged_keywords: bool = False) -> pd.DataFrame:
+    """
+    키워드×리뷰 매칭 테이블 생성 (정수 인덱스만 보관)
+    
+    Args:
+        reviews: 리뷰 데이터 (clean_text 컬럼 필요, 태깅 키워드 사용 시 keyword/keywords 컬럼)
+        keyword_df: 키워드 데이터 (keyword 컬럼 필수, keyword_group 컬럼 선택)
+        use_tagged_keywords: 리뷰에 keyword/keywords 컬럼이 있으면 텍스트 대신 사용
+    
+    Returns:
+        row (리뷰 위치), kw_id (keyword_df 행 위치) 컬럼을 가진 DataFrame
+    """
+    entries = _keyword_entries(keyword_df)
+    
+    if use_tagged_keywords and ('keyword' in reviews.columns or 'keywords' in reviews.columns):
+        keyword_col = 'keyword' if 'keyword' in reviews.columns else 'keywords'
+        return _tagged_keyword_match_table(reviews, keyword_col, entries)
     
-    for _, kw_row in keywords.iterrows():
-        kw = str(kw_row["keyword"]).strip()
+    # 같은 텍스트는 한 번만 스캔하고 매칭 결과를 같은 텍스트의 모든 리뷰에 broadcast
+    text_codes, unique_texts = pd.factorize(reviews["clean_text"])
+    matcher = get_keyword_matcher(entries)
+    hits = matcher.match_texts(list(unique_texts))
+    
+    row_parts = []
+    kw_id_parts = []
+    for entry_id, (kw, group) in enumerate(entries):
         if not kw:
             continue
-        
-        # 키워드 이스케이프 및 정규식 패턴 생성
-        # 한국어의 경우 공백이 포함된 키워드도 매칭되도록 처리
-        escaped_kw = re.escape(kw)
-        
-        # 키워드 매칭 (대소문자 무시, 부분 문자열 매칭)
-        mask = reviews["clean_text"].str.contains(escaped_kw, case=False, na=False, regex=True)
-        matched_reviews = reviews[mask]
-        
-        logger.debug(f"키워드 '{kw}': {len(matched_reviews)}개 리뷰 매칭")
-        
-        for _, review in matched_reviews.iterrows():
-            rows.append({
-                "keyword": kw,
-                "review_id": review["review_id"],
-                "app_id": review.get("app_id", None),
-                "sentiment_score": review.get("sentiment_score", 0.0),
-                "rating_score": review.get("rating_score", 0.0),
-                "text_score": review.get("text_score", None),
-                "rating": review["rating"],
-                "text": review["text"]
-            })
+        text_positions = hits.get(entry_id)
+        if not text_positions:
+            logger.debug(f"키워드 그룹 '{group}' - 키워드 '{kw}': 0개 리뷰 매칭")
+            continue
+        # 마지막 칸은 결측 텍스트(코드 -1)용
+        matched = np.zeros(len(unique_texts) + 1, dtype=bool)
+        matched[text_positions] = True
+        positions = np.flatnonzero(matched[text_codes])
+        logger.debug(f"키워드 그룹 '{group}' - 키워드 '{kw}': {len(positions)}개 리뷰 매칭")
+        row_parts.append(positions.astype(np.int64))
+        kw_id_parts.append(np.full(len(positions), entry_id, dtype=np.int32))
     
-    if not rows:
+    if not row_parts:
+        return pd.DataFrame({"row": np.array([], dtype=np.int64), "kw_id": np.array([], dtype=np.int32)})
+    
+    return pd.DataFrame({"row": np.concatenate(row_parts), "kw_id": np.concatenate(kw_id_parts)})
+
+
+def matched_review_positions(match_table: pd.DataFrame) -> np.ndarray:
+    """매칭 테이블에서 한 번 이상 매칭된 리뷰 위치 (오름차순, 중복 제거)"""
+    return np.unique(match_table["row"].to_numpy())
+
+
+def attach_review_columns(match_table: pd.DataFrame, reviews: pd.DataFrame,
+                          keyword_df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    매칭 테이블에 키워드와 리뷰 컬럼을 조인 (필요한 컬럼만, 마지막 단계에서)
+    
+    Args:
+        match_table: build_match_table 결과
+        reviews: build_match_table에 사용한 리뷰 데이터 (같은 행 순서)
+        keyword_df: build_match_table에 사용한 키워드 데이터
+        columns: 붙일 리뷰 컬럼 목록 (리뷰에 없으면 MATCH_COLUMN_DEFAULTS 값 사용)
+    
+    Returns:
+        keyword_group(있는 경우), keyword, columns 순서의 DataFrame
+        매칭이 없으면 빈 DataFrame
+    """
+    if match_table.empty:
         logger.warning("매칭된 리뷰가 없습니다.")
         return pd.DataFrame()
     
-    return pd.DataFrame(rows)
+    kw_ids = match_table["kw_id"].to_numpy()
+    rows = match_table["row"].to_numpy()
+    entries = _keyword_entries(keyword_df)
+    
+    result = {}
+    if "keyword_group" in keyword_df.columns:
+        groups = np.array([group for _, group in entries], dtype=object)
+        result["keyword_group"] = groups[kw_ids]
+    keywords = np.array([kw for kw, _ in entries], dtype=object)
+    result["keyword"] = keywords[kw_ids]
+    
+    for col in columns:
+        if col in reviews.columns:
+            result[col] = reviews[col].take(rows).reset_index(drop=True)
+        else:
+            result[col] = [MATCH_COLUMN_DEFAULTS.get(col)] * len(rows)
+    
+    return pd.DataFrame(result)
 
 
-def aggregate_by_keyword(kw_df: pd.DataFrame) -> pd.DataFrame:
+def match_keywords(reviews: pd.DataFrame, keywords: pd.DataFrame) -> pd.DataFrame:
     """
-    키워드별 감정 분석 집계
+    리뷰 텍스트에서 키워드 매칭
+    개선사항: Aho-Corasick 오토마톤으로 리뷰당 한 번만 스캔, 대소문자 무시, 부분 문자열 매칭
+    """
+    match_table = build_match_table(reviews, keywords[["keyword"]])
+    return attach_review_columns(
+        match_table, reviews, keywords[["keyword"]],
+        ["review_id", "app_id", "sentiment_score", "rating_score", "text_score", "rating", "text"]
+    )
+
+
+# 감정 라벨 기준 (스코어 > 0.2: 긍정, < -0.2: 부정, 그 외: 중립)
+SENTIMENT_THRESHOLD = 0.2
+
+# 감정 스코어 구간 코드
+BIN_POSITIVE, BIN_NEGATIVE, BIN_NEUTRAL, BIN_MISSING = 0, 1, 2, 3
+
+SUMMARY_COLUMNS = ["total_reviews", "avg_sentiment", "positive_count", "negative_count", "neutral_count"]
+
+
+def sentiment_bins(scores) -> np.ndarray:
+    """감정 스코어 배열을 구간 코드 배열로 변환 (결측값은 BIN_MISSING, 어느 개수에도 포함되지 않음)"""
+    scores = np.asarray(scores, dtype=np.float64)
+    bins = np.full(len(scores), BIN_NEUTRAL, dtype=np.int64)
+    bins[scores > SENTIMENT_THRESHOLD] = BIN_POSITIVE
+    bins[scores < -SENTIMENT_THRESHOLD] = BIN_NEGATIVE
+    bins[np.isnan(scores)] = BIN_MISSING
+    return bins
+
+
+def sentiment_labels(avg_sentiment) -> np.ndarray:
+    """평균 감정 스코어 배열을 감정 라벨 배열로 변환 (결측값은 neutral)"""
+    avg_sentiment = np.asarray(avg_sentiment, dtype=np.float64)
+    return np.select(
+        [avg_sentiment > SENTIMENT_THRESHOLD, avg_sentiment < -SENTIMENT_THRESHOLD],
+        ["positive", "negative"],
+        default="neutral"
+    ).astype(object)
+
+
+def _group_codes(kw_df: pd.DataFrame, keys: List[str]) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """
+    keys 조합별 그룹 번호 (groupby와 같은 정렬 순서, 키가 결측인 행은 제외)
+    
+    Returns:
+        (그룹에 속한 행 마스크, 해당 행의 그룹 번호, 그룹 번호 순서의 키 값 배열)
+    """
+    combined = np.zeros(len(kw_df), dtype=np.int64)
+    valid = np.ones(len(kw_df), dtype=bool)
+    levels = []
+    for key in keys:
+        codes, uniques = pd.factorize(kw_df[key], sort=True)
+        combined = combined * max(len(uniques), 1) + codes
+        valid &= codes >= 0
+        levels.append(uniques)
+    
+    if len(keys) == 1:
+        # 키가 하나면 정렬된 factorize 결과가 이미 그룹 번호
+        group_codes = combined[valid]
+        group_ids = np.arange(len(levels[0]), dtype=np.int64)
+    else:
+        group_codes, group_ids = pd.factorize(combined[valid], sort=True)
+        group_ids = np.asarray(group_ids, dtype=np.int64)
+    key_values = {}
+    for key, uniques in zip(reversed(keys), reversed(levels)):
+        size = max(len(uniques), 1)
+        key_values[key] = np.asarray(uniques, dtype=object)[group_ids % size]
+        group_ids = group_ids // size
+    return valid, group_codes, {key: key_values[key] for key in keys}
+
+
+def _review_codes(review_ids: np.ndarray, group_count: int) -> Tuple[np.ndarray, int]:
+    """
+    리뷰 ID를 0 이상의 정수 코드로 변환 (결측값은 -1)
+    
+    정수 ID는 최솟값과의 차이를 그대로 사용하고 (해시 불필요), 그 외에는 factorize
+    
+    Returns:
+        (코드 배열, 코드 범위)
+    """
+    if review_ids.dtype.kind == "i" and len(review_ids):
+        low, high = int(review_ids.min()), int(review_ids.max())
+        span = high - low + 1
+        if span * max(group_count, 1) < 2 ** 62:
+            return review_ids.astype(np.int64) - low, span
+    codes, uniques = pd.factorize(review_ids)
+    return codes, max(len(uniques), 1)
+
+
+def _group_scores(scores: np.ndarray, groups: np.ndarray, group_count: int) -> List[np.ndarray]:
+    """그룹 번호별 감정 스코어 배열 (결측값 제외, 그룹 안에서는 입력 순서)"""
+    present = ~np.isnan(scores)
+    scores, groups = scores[present], groups[present]
+    # 그룹 수가 적으면 (대부분) 16비트 정수로 정렬 (numpy의 안정 정렬이 기수 정렬을 사용)
+    order = np.argsort(groups.astype(np.uint16) if group_count <= 1 << 16 else groups, kind="stable")
+    return np.split(scores[order], np.cumsum(np.bincount(groups, minlength=group_count))[:-1])
+
+
+def _aggregate_sentiment(kw_df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """
+    keys별 감정 분석 집계 (aggregate_by_keyword / aggregate_by_keyword_group 공통)
+    
+    키를 정수 그룹 번호로 한 번 변환하고 감정 스코어를 한 번만 구간 코드로 나눈 뒤
+    긍정·부정·중립 수와 리뷰 수는 bincount, 평균은 groupby 한 번으로 계산하고 라벨은 벡터 연산으로 붙임
+    (lambda 기반 groupby().agg()와 같은 결과)
     """
     if kw_df.empty:
         logger.warning("집계할 데이터가 없습니다.")
-        return pd.DataFrame(columns=["keyword", "total_reviews", "avg_sentiment", 
-                                     "positive_count", "negative_count", "neutral_count"])
+        return pd.DataFrame(columns=keys + SUMMARY_COLUMNS)
+    
+    valid, groups, key_values = _group_codes(kw_df, keys)
+    group_count = len(next(iter(key_values.values())))
+    scores = kw_df["sentiment_score"].to_numpy(dtype=np.float64)[valid]
     
-    summary = kw_df.groupby("keyword").agg(
-        total_reviews=("review_id", "nunique"),
-        avg_sentiment=("sentiment_score", "mean"),
-        positive_count=("sentiment_score", lambda s: (s > 0.2).sum()),
-        negative_count=("sentiment_score", lambda s: (s < -0.2).sum()),
-        neutral_count=("sentiment_score", lambda s: ((s >= -0.2) & (s <= 0.2)).sum())
-    ).reset_index()
+    # 긍정 / 부정 / 중립 / 결측 수 (그룹 × 구간)
+    bin_counts = np.bincount(groups * 4 + sentiment_bins(scores), minlength=group_count * 4).reshape(group_count, 4)
+    
+    # 중복 제거한 리뷰 수 (결측 review_id 제외)
+    review_codes, review_count = _review_codes(kw_df["review_id"].to_numpy()[valid], group_count)
+    has_review = review_codes >= 0
+    pairs = np.sort(groups[has_review].astype(np.int64) * review_count + review_codes[has_review])
+    first = np.ones(len(pairs), dtype=bool)
+    first[1:] = pairs[1:] != pairs[:-1]
+    total_reviews = np.bincount(pairs[first] // review_count, minlength=group_count)
+    
+    summary = pd.DataFrame(key_values)
+    summary["total_reviews"] = total_reviews.astype(np.int64)
+    summary["avg_sentiment"] = pd.Series(scores).groupby(groups).mean().reindex(range(group_count)).to_numpy()
+    summary["positive_count"] = bin_counts[:, BIN_POSITIVE].astype(np.int64)
+    summary["negative_count"] = bin_counts[:, BIN_NEGATIVE].astype(np.int64)
+    summary["neutral_count"] = bin_counts[:, BIN_NEUTRAL].astype(np.int64)
     
     # 소수점 반올림
     summary["avg_sentiment"] = summary["avg_sentiment"].round(3)
     
     # 감정 라벨 추가
-    summary["sentiment_label"] = summary["avg_sentiment"].apply(
-        lambda x: "positive" if x > 0.2 else ("negative" if x < -0.2 else "neutral")
-    )
+    summary["sentiment_label"] = sentiment_labels(summary["avg_sentiment"])
     
     return summary
 
 
+def aggregate_by_keyword(kw_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    키워드별 감정 분석 집계
+    """
+    return _aggregate_sentiment(kw_df, ["keyword"])
+
+
+class KeywordAggregate:
+    """
+    키워드별 부분 집계 (청크 단위 스트리밍 집계용)
+    
+    청크마다 update()로 매칭 결과를 더하고, 다른 부분 집계와 merge()로 합친 뒤
+    result()로 전체 매칭 결과에 aggregate_by_keyword를 적용한 것과 같은 결과를 얻음
+    - 키워드별 긍정/부정/중립 수
+    - 키워드별 감정 스코어 배열 (결측값 제외, 입력 순서): groupby 평균은 행 순서대로 누적하는 보정 합이라
+      반올림 경계에서도 aggregate_by_keyword와 같은 평균을 내려면 같은 순서의 값이 필요
+      (메모리는 매칭 행당 8바이트, update / merge는 전체 리뷰의 행 순서대로 호출해야 함)
+    - 키워드별 리뷰 ID 집합 (total_reviews의 중복 제거용, 메모리는 매칭된 리뷰 ID 수에만 비례)
+    """
+    
+    def __init__(self):
+        self._stats: Dict[str, Dict] = {}
+        self.texts = 0
+        self.unique_texts = 0
+    
+    def _entry(self, keyword: str) -> Dict:
+        entry = self._stats.get(keyword)
+        if entry is None:
+            entry = {"positive": 0, "negative": 0, "neutral": 0, "scores": [], "review_ids": set()}
+            self._stats[keyword] = entry
+        return entry
+    
+    def update(self, kw_df: pd.DataFrame):
+        """
+        매칭 결과 청크를 집계에 추가
+        
+        Args:
+            kw_df: keyword, review_id, sentiment_score 컬럼을 가진 매칭 결과 (analyze_reviews 결과)
+        """
+        dedup = kw_df.attrs.get("dedup")
+        if dedup:
+            self.texts += dedup["texts"]
+            self.unique_texts += dedup["unique_texts"]
+        if kw_df.empty:
+            return
+        
+        valid, groups, key_values = _group_codes(kw_df, ["keyword"])
+        keywords = key_values["keyword"]
+        scores = kw_df["sentiment_score"].to_numpy(dtype=np.float64)[valid]
+        bin_counts = np.bincount(groups * 4 + sentiment_bins(scores), minlength=len(keywords) * 4).reshape(-1, 4)
+        group_scores = _group_scores(scores, groups, len(keywords))
+        
+        for keyword, counts, values in zip(keywords, bin_counts.tolist(), group_scores):
+            entry = self._entry(keyword)
+            entry["positive"] += counts[BIN_POSITIVE]
+            entry["negative"] += counts[BIN_NEGATIVE]
+            entry["neutral"] += counts[BIN_NEUTRAL]
+            if len(values):
+                entry["scores"].append(values)
+        
+        pairs = kw_df[["keyword", "review_id"]].dropna().drop_duplicates()
+        for keyword, review_ids in pairs.groupby("keyword", sort=False)["review_id"]:
+            self._entry(keyword)["review_ids"].update(review_ids.tolist())
+    
+    def merge(self, other: "KeywordAggregate"):
+        """다른 부분 집계를 합침 (other는 이 집계 뒤에 오는 리뷰의 집계)"""
+        self.texts += other.texts
+        self.unique_texts += other.unique_texts
+        for keyword, other_entry in other._stats.items():
+            entry = self._entry(keyword)
+            for name in ("positive", "negative", "neutral"):
+                entry[name] += other_entry[name]
+            entry["scores"].extend(other_entry["scores"])
+            entry["review_ids"].update(other_entry["review_ids"])
+    
+    @property
+    def empty(self) -> bool:
+        return not self._stats
+    
+    def dedup_stats(self) -> Dict:
+        """청크 / 샤드별 텍스트 중복 통계의 합 (dedup_stats와 같은 형식)"""
+        return {
+            "texts": self.texts,
+            "unique_texts": self.unique_texts,
+            "dedup_ratio": round(1 - self.unique_texts / self.texts, 4) if self.texts else 0.0,
+        }
+    
+    def matched_reviews(self) -> int:
+        """한 번 이상 매칭된 리뷰 ID 수"""
+        return len(set().union(*(entry["review_ids"] for entry in self._stats.values())))
+    
+    def result(self) -> pd.DataFrame:
+        """
+        키워드별 감정 분석 집계 (aggregate_by_keyword와 같은 컬럼, 순서, 값)
+        """
+        if self.empty:
+            return aggregate_by_keyword(pd.DataFrame())
+        
+        keywords = sorted(self._stats)
+        entries = [self._stats[keyword] for keyword in keywords]
+        
+        # aggregate_by_keyword와 같은 groupby 평균 (키워드별 값 순서도 같음)
+        scores = [np.concatenate(entry["scores"]) if entry["scores"] else np.empty(0) for entry in entries]
+        groups = np.repeat(np.arange(len(entries)), [len(values) for values in scores])
+        avg_sentiment = pd.Series(np.concatenate(scores)).groupby(groups).mean().reindex(range(len(entries)))
+        
+        summary = pd.DataFrame({
+            "keyword": keywords,
+            "total_reviews": np.array([len(entry["review_ids"]) for entry in entries], dtype=np.int64),
+            "avg_sentiment": avg_sentiment.to_numpy(dtype=np.float64),
+            "positive_count": np.array([entry["positive"] for entry in entries], dtype=np.int64),
+            "negative_count": np.array([entry["negative"] for entry in entries], dtype=np.int64),
+            "neutral_count": np.array([entry["neutral"] for entry in entries], dtype=np.int64),
+        })
+        
+        # 소수점 반올림
+        summary["avg_sentiment"] = summary["avg_sentiment"].round(3)
+        
+        # 감정 라벨 추가
+        summary["sentiment_label"] = sentiment_labels(summary["avg_sentiment"])
+        
+        return summary
+
+
 def match_keyword_groups(reviews: pd.DataFrame, keyword_groups: pd.DataFrame) -> pd.DataFrame:
     """
     전처리된 리뷰 데이터와 키워드 그룹을 매칭
@@ -352,105 +897,28 @@ def match_keyword_groups(reviews: pd.DataFrame, keyword_groups: pd.DataFrame) ->
     Returns:
         매칭된 리뷰와 키워드 그룹 정보를 포함한 DataFrame
     """
-    rows = []
-    
-    # 리뷰 데이터에 키워드 정보가 이미 있는 경우
-    if 'keyword' in reviews.columns or 'keywords' in reviews.columns:
-        keyword_col = 'keyword' if 'keyword' in reviews.columns else 'keywords'
-        
-        for _, review in reviews.iterrows():
-            review_keywords = str(review[keyword_col]).strip()
-            if pd.isna(review_keywords) or not review_keywords:
-                continue
-            
-            # 키워드가 쉼표로 구분되어 있을 수 있음
-            review_keyword_list = [kw.strip() for kw in review_keywords.split(',')]
-            
-            # 키워드 그룹에서 매칭
-            for _, kg_row in keyword_groups.iterrows():
-                kg_keyword = str(kg_row['keyword']).strip()
-                kg_group = str(kg_row['keyword_group']).strip()
-                
-                if kg_keyword in review_keyword_list:
-                    rows.append({
-                        "keyword_group": kg_group,
-                        "keyword": kg_keyword,
-                        "review_id": review["review_id"],
-                        "app_id": review.get("app_id", None),
-                        "sentiment_score": review.get("sentiment_score", 0.0),
-                        "rating": review.get("rating", None),
-                        "text": review.get("text", "")
-                    })
-    else:
-        # 리뷰 텍스트에서 키워드 매칭
+    # 리뷰 데이터에 키워드 정보가 없으면 리뷰 텍스트에서 키워드 매칭
+    if 'keyword' not in reviews.columns and 'keywords' not in reviews.columns:
         if 'text' not in reviews.columns and 'clean_text' not in reviews.columns:
             logger.warning("리뷰 데이터에 키워드나 텍스트 정보가 없습니다.")
             return pd.DataFrame()
         
-        text_col = 'clean_text' if 'clean_text' in reviews.columns else 'text'
-        
         # 텍스트 전처리 (없는 경우)
         if 'clean_text' not in reviews.columns:
-            reviews['clean_text'] = reviews[text_col].apply(preprocess)
-        
-        for _, kg_row in keyword_groups.iterrows():
-            kg_keyword = str(kg_row['keyword']).strip()
-            kg_group = str(kg_row['keyword_group']).strip()
-            
-            if not kg_keyword:
-                continue
-            
-            # 키워드 매칭
-            escaped_kw = re.escape(kg_keyword)
-            mask = reviews['clean_text'].str.contains(escaped_kw, case=False, na=False, regex=True)
-            matched_reviews = reviews[mask]
-            
-            logger.debug(f"키워드 그룹 '{kg_group}' - 키워드 '{kg_keyword}': {len(matched_reviews)}개 리뷰 매칭")
-            
-            for _, review in matched_reviews.iterrows():
-                rows.append({
-                    "keyword_group": kg_group,
-                    "keyword": kg_keyword,
-                    "review_id": review["review_id"],
-                    "app_id": review.get("app_id", None),
-                    "sentiment_score": review.get("sentiment_score", 0.0),
-                    "rating": review.get("rating", None),
-                    "text": review.get("text", "")
-                })
-    
-    if not rows:
-        logger.warning("매칭된 리뷰가 없습니다.")
-        return pd.DataFrame()
+            reviews['clean_text'] = preprocess_series(reviews['text'])
     
-    return pd.DataFrame(rows)
+    match_table = build_match_table(reviews, keyword_groups, use_tagged_keywords=True)
+    return attach_review_columns(
+        match_table, reviews, keyword_groups,
+        ["review_id", "app_id", "sentiment_score", "rating", "text"]
+    )
 
 
 def aggregate_by_keyword_group(kw_df: pd.DataFrame) -> pd.DataFrame:
     """
     키워드 그룹별 감정 분석 집계
     """
-    if kw_df.empty:
-        logger.warning("집계할 데이터가 없습니다.")
-        return pd.DataFrame(columns=["keyword_group", "keyword", "total_reviews", "avg_sentiment", 
-                                     "positive_count", "negative_count", "neutral_count"])
-    
-    summary = kw_df.groupby(["keyword_group", "keyword"]).agg(
-        total_reviews=("review_id", "nunique"),
-        avg_sentiment=("sentiment_score", "mean"),
-        positive_count=("sentiment_score", lambda s: (s > 0.2).sum()),
-        negative_count=("sentiment_score", lambda s: (s < -0.2).sum()),
-        neutral_count=("sentiment_score", lambda s: ((s >= -0.2) & (s <= 0.2)).sum())
-    ).reset_index()
-    
-    # 소수점 반올림
-    summary["avg_sentiment"] = summary["avg_sentiment"].round(3)
-    
-    # 감정 라벨 추가
-    summary["sentiment_label"] = summary["avg_sentiment"].apply(
-        lambda x: "positive" if x > 0.2 else ("negative" if x < -0.2 else "neutral")
-    )
-    
-    return summary
+    return _aggregate_sentiment(kw_df, ["keyword_group", "keyword"])
 
 
 def save_results(summary: pd.DataFrame, app_name: str, output_dir: str = "results"):
@@ -498,6 +966,265 @@ def get_app_name(reviews: pd.DataFrame) -> str:
         return "unknown_app"
 
 
+def load_text_scorer():
+    """
+    HuggingFace 텍스트 감성분석 모델 로드 (사용할 수 없으면 None, 별점 기반 분석만 수행)
+    """
+    if not HF_AVAILABLE:
+        return None
+    try:
+        logger.info("HuggingFace 감성분석 모델 로딩 중...")
+        sentiment_pipeline = load_sentiment_model(use_gpu=False)
+    except Exception as e:
+        logger.warning(f"모델 로드 중 오류 발생: {e}. 별점 기반 분석만 수행합니다.")
+        return None
+    if sentiment_pipeline is None:
+        logger.warning("HuggingFace 모델을 사용할 수 없습니다. 별점 기반 분석만 수행합니다.")
+    return sentiment_pipeline
+
+
+def score_reviews(reviews: pd.DataFrame, score_positions: List[int], sentiment_pipeline=None,
+                  cache=None, batch_size: int = 32, max_tokens: int = 8192) -> pd.DataFrame:
+    """
+    리뷰별 감정 스코어 계산 (rating_score, text_score, sentiment_score 컬럼 추가)
+    
+    Args:
+        reviews: 전처리된 리뷰 데이터 (clean_text, rating 컬럼 필요)
+        score_positions: 텍스트 분석할 리뷰 위치 (나머지 리뷰의 text_score는 None)
+        sentiment_pipeline: load_text_scorer() 결과 (None이면 별점 기반 분석만 수행)
+        cache: 감정 스코어 캐시 (None이면 캐시 사용 안 함)
+        batch_size / max_tokens: 텍스트 분석 배치당 최대 리뷰 수 / 토큰 수
+    """
+    # 별점 기반 스코어
+    reviews["rating_score"] = ratings_to_scores(reviews["rating"])
+    
+    # HuggingFace 텍스트 분석 (선택사항)
+    reviews["text_score"] = None
+    if sentiment_pipeline is not None:
+        try:
+            logger.info("텍스트 기반 감성분석 수행 중...")
+            # 배치 처리로 성능 향상 (토큰 길이순 정렬 + 토큰 예산 기반 배치)
+            texts = reviews["clean_text"].tolist()
+            text_scores = [None] * len(texts)
+            scored = score_texts_cached(
+                [texts[i] for i in score_positions],
+                lambda texts: analyze_texts_sentiment(
+                    texts,
+                    sentiment_pipeline,
+                    batch_size=batch_size,
+                    max_tokens=max_tokens
+                ),
+                scorer="hf",
+                model=get_model_name(sentiment_pipeline),
+                prompt_version=HF_SCORE_VERSION,
+                cache=cache
+            )
+            for position, score in zip(score_positions, scored):
+                text_scores[position] = score
+            reviews["text_score"] = pd.Series(text_scores, index=reviews.index, dtype=object)
+            logger.info("텍스트 분석 완료")
+        except Exception as e:
+            logger.warning(f"텍스트 분석 중 오류 발생: {e}. 별점 기반 분석만 수행합니다.")
+            reviews["text_score"] = None
+    
+    # 하이브리드 스코어 계산 (별점 + 텍스트 분석)
+    reviews["sentiment_score"] = hybrid_sentiment_scores(
+        reviews["rating_score"].to_numpy(),
+        reviews["text_score"].to_numpy(),
+        rating_weight=0.4,  # 별점 가중치
+        text_weight=0.6      # 텍스트 분석 가중치
+    )
+    return reviews
+
+
+def analyze_reviews(reviews: pd.DataFrame, keywords: pd.DataFrame, sentiment_pipeline=None,
+                    cache=None, batch_size: int = 32, max_tokens: int = 8192,
+                    match_first: bool = True) -> pd.DataFrame:
+    """
+    리뷰 전처리 → 키워드 매칭 → 감정 스코어 계산 → 매칭 결과 조인
+    
+    Returns:
+        keyword, review_id, sentiment_score 컬럼을 가진 매칭 결과 (매칭이 없으면 빈 DataFrame)
+        attrs["dedup"]에 텍스트 중복 통계 (dedup_stats)
+    """
+    # 전처리 및 결측값 제거
+    reviews = reviews.assign(clean_text=preprocess_series(reviews["text"]))
+    reviews = reviews[reviews["clean_text"].str.len() > 0]
+    
+    # 같은 텍스트는 매칭 / 텍스트 분석 / 캐시 조회를 한 번만 수행
+    stats = dedup_stats(reviews["clean_text"])
+    logger.info(f"텍스트 중복 제거: 리뷰 {stats['texts']}개 → 고유 텍스트 {stats['unique_texts']}개 "
+                f"(중복 비율 {stats['dedup_ratio']:.1%})")
+    
+    # 키워드 매칭 (텍스트 분석 대상 선정을 위해 먼저 수행)
+    match_table = build_match_table(reviews, keywords)
+    if match_table.empty:
+        kw_df = pd.DataFrame()
+        kw_df.attrs["dedup"] = stats
+        return kw_df
+    
+    if match_first:
+        # 키워드가 매칭된 리뷰만 텍스트 분석 (나머지는 집계에 사용되지 않음)
+        score_positions = matched_review_positions(match_table).tolist()
+        logger.info(f"매칭된 리뷰만 텍스트 분석: {len(score_positions)}/{len(reviews)}개")
+    else:
+        score_positions = list(range(len(reviews)))
+    
+    reviews = score_reviews(reviews, score_positions, sentiment_pipeline, cache,
+                            batch_size=batch_size, max_tokens=max_tokens)
+    
+    # 매칭 결과에 감정 스코어 조인
+    kw_df = attach_review_columns(match_table, reviews, keywords, ["review_id", "sentiment_score"])
+    kw_df.attrs["dedup"] = stats
+    return kw_df
+
+
+# 워커에 보내는 리뷰 컬럼 (analyze_reviews에 필요한 컬럼만 직렬화)
+SHARD_COLUMNS = ["review_id", "text", "rating"]
+
+# 워커 프로세스 상태 (_init_worker에서 설정)
+_worker_state: Dict = {}
+
+
+def _init_worker(keywords: pd.DataFrame, load_model: bool, use_cache: bool, options: Dict, torch_threads: int):
+    """
+    분석 워커 프로세스 초기화 (프로세스당 한 번)
+    
+    fork로 시작된 워커는 부모 프로세스에서 로드한 모델(_sentiment_pipeline)을 복사 없이 공유하고,
+    spawn으로 시작된 워커는 여기서 모델을 한 번 로드
+    """
+    pipeline_obj = None
+    if load_model:
+        if HF_AVAILABLE:
+            torch.set_num_threads(torch_threads)
+        pipeline_obj = _sentiment_pipeline if _sentiment_pipeline is not None else load_text_scorer()
+    
+    _worker_state.update(
+        keywords=keywords,
+        pipeline=pipeline_obj,
+        # SQLite 연결은 프로세스 간에 공유할 수 없으므로 워커마다 새로 연결
+        cache=get_sentiment_cache() if use_cache and pipeline_obj is not None else None,
+        options=options,
+    )
+
+
+def _analyze_shard(reviews: pd.DataFrame) -> KeywordAggregate:
+    """워커에서 리뷰 샤드 하나를 분석하여 부분 집계 반환"""
+    state = _worker_state
+    aggregate = KeywordAggregate()
+    aggregate.update(analyze_reviews(reviews, state["keywords"], state["pipeline"], state["cache"], **state["options"]))
+    return aggregate
+
+
+def aggregate_shards(shards: Iterable[pd.DataFrame], keywords: pd.DataFrame, sentiment_pipeline=None,
+                     cache=None, workers: int = 1, use_cache: bool = False,
+                     batch_size: int = 32, max_tokens: int = 8192, match_first: bool = True) -> KeywordAggregate:
+    """
+    리뷰 샤드를 분석하여 부분 집계를 합침
+    
+    Args:
+        shards: 리뷰 샤드 (DataFrame) 이터러블 (전체 리뷰를 나눈 것 또는 CSV 청크)
+        keywords: 키워드 데이터
+        sentiment_pipeline: load_text_scorer() 결과 (워커는 fork 시 이 모델을 공유)
+        cache: workers=1일 때 사용할 감정 스코어 캐시
+        workers: 프로세스 수 (1이면 현재 프로세스에서 순서대로 분석)
+        use_cache: workers>1일 때 워커별 감정 스코어 캐시 사용 여부
+        batch_size / max_tokens / match_first: analyze_reviews 옵션
+    
+    Returns:
+        모든 샤드의 부분 집계를 샤드 순서대로 합친 KeywordAggregate (샤드 구성과 관계없이 같은 result())
+    """
+    options = dict(batch_size=batch_size, max_tokens=max_tokens, match_first=match_first)
+    aggregate = KeywordAggregate()
+    
+    if workers <= 1:
+        for shard in shards:
+            aggregate.update(analyze_reviews(shard, keywords, sentiment_pipeline, cache, **options))
+        return aggregate
+    
+    # fork를 지원하면 부모 프로세스에서 로드한 모델을 워커가 공유 (copy-on-write)
+    start_methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in start_methods else None)
+    torch_threads = max(1, (os.cpu_count() or 1) // workers)
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(keywords, sentiment_pipeline is not None, use_cache, options, torch_threads),
+    ) as executor:
+        # 메모리 사용량을 일정하게 유지하기 위해 워커당 최대 2개 샤드만 대기 (끝났지만 합치지 못한 샤드 포함)
+        # 부분 집계는 샤드 순서대로 합침 (KeywordAggregate 평균이 직렬 분석과 같도록)
+        pending = {}
+        finished: Dict[int, KeywordAggregate] = {}
+        merged = 0
+        
+        def merge_finished(return_when):
+            nonlocal merged
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                finished[pending.pop(future)] = future.result()
+            while merged in finished:
+                aggregate.merge(finished.pop(merged))
+                merged += 1
+        
+        for index, shard in enumerate(shards):
+            if len(pending) + len(finished) >= workers * 2:
+                merge_finished(FIRST_COMPLETED)
+            pending[executor.submit(_analyze_shard, shard[SHARD_COLUMNS])] = index
+        merge_finished(ALL_COMPLETED)
+        done_shards = merged
+    
+    logger.info(f"병렬 분석 완료: 워커 {workers}개, 샤드 {done_shards}개")
+    return aggregate
+
+
+def split_reviews(reviews: pd.DataFrame, shard_count: int) -> Iterator[pd.DataFrame]:
+    """리뷰를 행 순서대로 shard_count개 샤드로 분할"""
+    bounds = np.linspace(0, len(reviews), max(1, shard_count) + 1).astype(int)
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if end > start:
+            yield reviews.iloc[start:end]
+
+
+def analyze_in_chunks(reviews_path: str, keywords: pd.DataFrame, chunksize: int,
+                      sentiment_pipeline=None, cache=None, batch_size: int = 32,
+                      max_tokens: int = 8192, match_first: bool = True,
+                      workers: int = 1, use_cache: bool = False) -> Tuple[KeywordAggregate, str]:
+    """
+    리뷰 CSV를 청크 단위로 읽어 분석 (스트리밍 모드)
+    
+    청크마다 전처리, 키워드 매칭, 감정 스코어 계산 후 KeywordAggregate에 부분 집계를 더하므로
+    메모리 사용량은 입력 크기가 아니라 청크 크기(와 매칭된 리뷰 ID 수, 매칭 행당 스코어 8바이트)에 비례
+    (workers>1이면 청크를 워커 프로세스에 나눠서 분석)
+    
+    Returns:
+        (키워드별 부분 집계, 앱 이름 (전체 리뷰의 최빈 app_id, get_app_name과 같은 규칙))
+    """
+    app_counts: Counter = Counter()
+    
+    def chunks() -> Iterator[pd.DataFrame]:
+        total = 0
+        for i, chunk in enumerate(iter_review_chunks(reviews_path, chunksize), start=1):
+            total += len(chunk)
+            if 'app_id' in chunk.columns:
+                app_counts.update(chunk['app_id'].dropna().value_counts().to_dict())
+            yield chunk
+            logger.info(f"청크 {i} 읽기 완료: 누적 리뷰 {total}개")
+    
+    aggregate = aggregate_shards(
+        chunks(), keywords, sentiment_pipeline, cache, workers=workers, use_cache=use_cache,
+        batch_size=batch_size, max_tokens=max_tokens, match_first=match_first
+    )
+    
+    if app_counts:
+        top = max(app_counts.values())
+        app_name = str(min(app_id for app_id, count in app_counts.items() if count == top))
+    else:
+        app_name = "unknown_app"
+    return aggregate, app_name
+
+
 def main():
     """
     메인 실행 함수
@@ -507,6 +1234,16 @@ def main():
     parser.add_argument('--reviews', type=str, default='reviews.csv', help='리뷰 CSV 파일 경로')
     parser.add_argument('--keywords', type=str, default='keywords.csv', help='키워드 CSV 파일 경로')
     parser.add_argument('--output', type=str, default='results', help='결과 저장 디렉토리')
+    parser.add_argument('--batch-size', type=int, default=32, help='텍스트 분석 배치당 최대 리뷰 수')
+    parser.add_argument('--max-tokens', type=int, default=8192, help='텍스트 분석 배치당 최대 토큰 수 (패딩 포함)')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=True,
+                        help='감정 스코어 캐시 사용 여부 (--no-cache로 비활성화)')
+    parser.add_argument('--match-first', action=argparse.BooleanOptionalAction, default=True,
+                        help='키워드가 매칭된 리뷰만 텍스트 분석 (--no-match-first로 전체 분석)')
+    parser.add_argument('--chunksize', type=int, default=0,
+                        help='리뷰 CSV를 이 행 수씩 읽어 스트리밍 분석 (0이면 전체를 한 번에 로드)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='리뷰를 나눠 분석할 프로세스 수 (1이면 현재 프로세스에서 분석)')
     
     args = parser.parse_args()
     
@@ -516,94 +1253,94 @@ def main():
         keywords_path = args.keywords
         output_dir = args.output
         
-        # 1. 데이터 로드
-        reviews, keywords = load_data(reviews_path, keywords_path)
-        
-        # 앱 이름 추출
-        app_name = get_app_name(reviews)
-        logger.info(f"앱 이름: {app_name}")
-        
-        # 2. 전처리
-        logger.info("리뷰 텍스트 전처리 중...")
-        reviews["clean_text"] = reviews["text"].apply(preprocess)
+        # HuggingFace 텍스트 분석 모델 (선택사항)
+        # (워커 프로세스를 쓰는 경우 fork 전에 로드하여 워커가 공유)
+        sentiment_pipeline = load_text_scorer()
+        workers = max(1, args.workers)
+        # 여러 워커를 쓰는 경우 감정 스코어 캐시는 워커마다 따로 연결
+        cache = get_sentiment_cache() if args.cache and sentiment_pipeline is not None and workers == 1 else None
+        options = dict(batch_size=args.batch_size, max_tokens=args.max_tokens, match_first=args.match_first)
         
-        # 결측값 제거
-        reviews = reviews[reviews["clean_text"].str.len() > 0]
-        
-        # 3. 감정 스코어 계산
-        logger.info("감정 스코어 계산 중...")
-        
-        # 별점 기반 스코어
-        reviews["rating_score"] = reviews["rating"].apply(rating_to_score)
-        
-        # HuggingFace 텍스트 분석 (선택사항)
-        text_scores = None
-        sentiment_pipeline = None
-        
-        if HF_AVAILABLE:
-            try:
-                logger.info("HuggingFace 감성분석 모델 로딩 중...")
-                sentiment_pipeline = load_sentiment_model(use_gpu=False)
-                
-                if sentiment_pipeline is not None:
-                    logger.info("텍스트 기반 감성분석 수행 중...")
-                    # 배치 처리로 성능 향상
-                    texts = reviews["clean_text"].tolist()
-                    text_scores_list = []
-                    
-                    for i, text in enumerate(texts):
-                        if (i + 1) % 100 == 0:
-                            logger.info(f"텍스트 분석 진행 중: {i+1}/{len(texts)}")
-                        
-                        score = analyze_text_sentiment(text, sentiment_pipeline)
-                        text_scores_list.append(score)
-                    
-                    reviews["text_score"] = text_scores_list
-                    logger.info("텍스트 분석 완료")
-                else:
-                    logger.warning("HuggingFace 모델을 사용할 수 없습니다. 별점 기반 분석만 수행합니다.")
-                    reviews["text_score"] = None
-            except Exception as e:
-                logger.warning(f"텍스트 분석 중 오류 발생: {e}. 별점 기반 분석만 수행합니다.")
-                reviews["text_score"] = None
+        if args.chunksize > 0:
+            # 1~5. 청크 단위 로드, 전처리, 키워드 매칭, 감정 스코어 계산, 부분 집계
+            logger.info(f"스트리밍 모드: 리뷰를 {args.chunksize}개씩 분석합니다.")
+            keywords = load_keywords(keywords_path)
+            aggregate, app_name = analyze_in_chunks(
+                reviews_path, keywords, args.chunksize, sentiment_pipeline, cache,
+                workers=workers, use_cache=args.cache, **options
+            )
+            logger.info(f"앱 이름: {app_name}")
+            if aggregate.empty:
+                logger.error("키워드 매칭 결과가 없습니다. 키워드나 리뷰 데이터를 확인해주세요.")
+                return
+            
+            # 6. 부분 집계 병합
+            logger.info("키워드별 집계 중...")
+            summary = aggregate.result()
+            matched_reviews = aggregate.matched_reviews()
+            dedup = aggregate.dedup_stats()
+        elif workers > 1:
+            # 1. 데이터 로드
+            reviews, keywords = load_data(reviews_path, keywords_path)
+            
+            # 앱 이름 추출
+            app_name = get_app_name(reviews)
+            logger.info(f"앱 이름: {app_name}")
+            
+            # 2~5. 리뷰를 샤드로 나눠 워커 프로세스에서 분석 (워커당 4개 샤드로 부하 분산)
+            logger.info(f"리뷰 분석 중... (워커 {workers}개)")
+            aggregate = aggregate_shards(
+                split_reviews(reviews, workers * 4), keywords, sentiment_pipeline,
+                workers=workers, use_cache=args.cache, **options
+            )
+            
+            if aggregate.empty:
+                logger.error("키워드 매칭 결과가 없습니다. 키워드나 리뷰 데이터를 확인해주세요.")
+                return
+            
+            # 6. 부분 집계 병합
+            logger.info("키워드별 집계 중...")
+            summary = aggregate.result()
+            matched_reviews = aggregate.matched_reviews()
+            dedup = aggregate.dedup_stats()
         else:
-            reviews["text_score"] = None
-        
-        # 하이브리드 스코어 계산 (별점 + 텍스트 분석)
-        logger.info("하이브리드 감정 스코어 계산 중...")
-        reviews["sentiment_score"] = reviews.apply(
-            lambda row: calculate_hybrid_sentiment(
-                row["rating_score"],
-                row.get("text_score"),
-                rating_weight=0.4,  # 별점 가중치
-                text_weight=0.6      # 텍스트 분석 가중치
-            ),
-            axis=1
-        )
-        
-        # 4. 키워드 매칭
-        logger.info("키워드 매칭 중...")
-        kw_df = match_keywords(reviews, keywords)
-        
-        if kw_df.empty:
-            logger.error("키워드 매칭 결과가 없습니다. 키워드나 리뷰 데이터를 확인해주세요.")
-            return
+            # 1. 데이터 로드
+            reviews, keywords = load_data(reviews_path, keywords_path)
+            
+            # 앱 이름 추출
+            app_name = get_app_name(reviews)
+            logger.info(f"앱 이름: {app_name}")
+            
+            # 2~5. 전처리, 키워드 매칭, 감정 스코어 계산, 매칭 결과 조인
+            logger.info("리뷰 분석 중...")
+            kw_df = analyze_reviews(reviews, keywords, sentiment_pipeline, cache, **options)
+            
+            if kw_df.empty:
+                logger.error("키워드 매칭 결과가 없습니다. 키워드나 리뷰 데이터를 확인해주세요.")
+                return
+            
+            # 6. 키워드별 집계
+            logger.info("키워드별 집계 중...")
+            summary = aggregate_by_keyword(kw_df)
+            matched_reviews = kw_df['review_id'].nunique()
+            dedup = kw_df.attrs["dedup"]
         
-        # 5. 키워드별 집계
-        logger.info("키워드별 집계 중...")
-        summary = aggregate_by_keyword(kw_df)
+        if cache is not None:
+            logger.info(f"감정 스코어 캐시 통계: {cache.stats()}")
         
         # 앱 이름을 결과에 추가
         summary["app_name"] = app_name
         
-        # 6. 결과 저장 및 출력
+        # 7. 결과 저장 및 출력
         result_path = save_results(summary, app_name, output_dir)
         
         # 통계 출력
         logger.info(f"\n=== 분석 결과 요약 ===")
         logger.info(f"앱 이름: {app_name}")
         logger.info(f"총 키워드 수: {len(summary)}")
-        logger.info(f"총 매칭 리뷰 수: {kw_df['review_id'].nunique()}")
+        logger.info(f"총 매칭 리뷰 수: {matched_reviews}")
+        logger.info(f"텍스트 중복 제거: 리뷰 {dedup['texts']}개 → 고유 텍스트 {dedup['unique_texts']}개 "
+                    f"(중복 비율 {dedup['dedup_ratio']:.1%})")
         logger.info(f"평균 감정 스코어: {summary['avg_sentiment'].mean():.3f}")
         logger.info(f"결과 파일: {result_path}")
         
@@ -614,4 +1351,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,228 @@
+"""
+비동기 분석 작업 관리 모듈
+- 분석 작업을 백그라운드 워커 풀에서 실행
+- 단계(stage), 진행률, 성공/실패 카운터, 최종 결과 조회
+- 작업 취소 및 완료된 작업의 보관 기간(TTL) 관리
+
+환경 변수:
+- ANALYSIS_JOB_WORKERS: 동시에 실행할 분석 작업 수 (기본값: 2)
+- ANALYSIS_JOB_TTL: 완료된 작업 결과 보관 기간 (초, 기본값: 3600)
+- ANALYSIS_JOB_MAX_JOBS: 보관할 최대 작업 수 (기본값: 200)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+import logging
+import os
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+FINISHED_STATUSES = {JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED}
+
+
+class JobCancelled(Exception):
+    """작업이 취소되었을 때 분석 함수 내부에서 발생"""
+
+
+class AnalysisJob:
+    """
+    분석 작업 상태 (thread-safe)
+
+    분석 함수는 update()로 단계/진행률/카운터를 보고하고,
+    check_cancelled()로 취소 여부를 확인합니다.
+    """
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = JOB_QUEUED
+        self.stage = JOB_QUEUED
+        self.percent = 0.0
+        self.counters: Dict[str, int] = {}
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.error_status: Optional[int] = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+        self.future = None
+        self._lock = threading.Lock()
+
+    def update(self, stage: Optional[str] = None, percent: Optional[float] = None, **counters):
+        """진행 상황 보고 (percent는 0~100)"""
+        with self._lock:
+            if stage is not None:
+                self.stage = stage
+            if percent is not None:
+                self.percent = round(max(self.percent, min(float(percent), 100.0)), 1)
+            self.counters.update(counters)
+            self.updated_at = time.time()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        """취소 요청이 있으면 JobCancelled 발생"""
+        if self.cancel_event.is_set():
+            raise JobCancelled(f"작업이 취소되었습니다: {self.id}")
+
+    def _finish(self, status: str, result: Any = None, error: Optional[str] = None,
+                error_status: Optional[int] = None):
+        with self._lock:
+            self.status = status
+            self.stage = status
+            self.result = result
+            self.error = error
+            self.error_status = error_status
+            if status == JOB_SUCCEEDED:
+                self.percent = 100.0
+            self.finished_at = time.time()
+            self.updated_at = self.finished_at
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self, include_result: bool = True) -> Dict:
+        """API 응답용 딕셔너리"""
+        def iso(ts: Optional[float]) -> Optional[str]:
+            return datetime.fromtimestamp(ts).isoformat() if ts is not None else None
+
+        with self._lock:
+            data = {
+                'job_id': self.id,
+                'status': self.status,
+                'stage': self.stage,
+                'percent': self.percent,
+                'counters': dict(self.counters),
+                'created_at': iso(self.created_at),
+                'updated_at': iso(self.updated_at),
+                'finished_at': iso(self.finished_at),
+            }
+            if self.error is not None:
+                data['error'] = self.error
+            if include_result and self.status == JOB_SUCCEEDED:
+                data['result'] = self.result
+            return data
+
+
+class JobManager:
+    """
+    백그라운드 분석 작업 관리자
+
+    Args:
+        max_workers: 동시에 실행할 작업 수
+        retention_seconds: 완료된 작업 보관 기간 (초)
+        max_jobs: 보관할 최대 작업 수 (초과 시 오래된 완료 작업부터 삭제)
+    """
+
+    def __init__(self, max_workers: int = 2, retention_seconds: float = 3600, max_jobs: int = 200):
+        self.retention_seconds = retention_seconds
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='analysis-job')
+        self._jobs: Dict[str, AnalysisJob] = {}
+        self._lock = threading.Lock()
+
+    def _purge(self):
+        """보관 기간이 지난 완료 작업 삭제 (락 보유 상태에서 호출)"""
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at is not None and now - job.finished_at > self.retention_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+        overflow = len(self._jobs) - self.max_jobs
+        if overflow > 0:
+            finished = sorted((job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at)
+            for job in finished[:overflow]:
+                del self._jobs[job.id]
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> AnalysisJob:
+        """
+        작업 등록. fn(job, *args, **kwargs)가 백그라운드에서 실행되며 반환값이 결과가 됨
+
+        fn에서 발생한 예외에 status_code 속성이 있으면 작업 실패 시 함께 기록됩니다.
+        """
+        job = AnalysisJob(uuid.uuid4().hex)
+        with self._lock:
+            self._purge()
+            self._jobs[job.id] = job
+        job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        logger.info(f"분석 작업 등록: {job.id}")
+        return job
+
+    def _run(self, job: AnalysisJob, fn: Callable[..., Any], args, kwargs):
+        if job.cancelled:
+            job._finish(JOB_CANCELLED)
+            return
+        job.update(stage=JOB_RUNNING)
+        with job._lock:
+            job.status = JOB_RUNNING
+        started = time.time()
+        try:
+            result = fn(job, *args, **kwargs)
+            job._finish(JOB_SUCCEEDED, result=result)
+            logger.info(f"분석 작업 완료: {job.id} ({time.time() - started:.1f}초)")
+        except JobCancelled:
+            job._finish(JOB_CANCELLED)
+            logger.info(f"분석 작업 취소됨: {job.id}")
+        except Exception as e:
+            job._finish(JOB_FAILED, error=str(e), error_status=getattr(e, 'status_code', None))
+            logger.error(f"분석 작업 실패: {job.id}: {e}", exc_info=True)
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """작업 조회 (없거나 보관 기간이 지났으면 None)"""
+        with self._lock:
+            self._purge()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[AnalysisJob]:
+        """작업 취소 요청 (대기 중이면 즉시 취소, 실행 중이면 다음 확인 시점에 중단)"""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return job
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            job._finish(JOB_CANCELLED)
+        logger.info(f"분석 작업 취소 요청: {job_id}")
+        return job
+
+    def stats(self) -> Dict:
+        """작업 상태별 개수"""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            return {'jobs': len(self._jobs), 'by_status': counts}
+
+
+_default_manager: Optional[JobManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """프로세스 공용 작업 관리자 (환경 변수 설정 사용, 지연 생성)"""
+    global _default_manager
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                _default_manager = JobManager(
+                    max_workers=int(os.environ.get('ANALYSIS_JOB_WORKERS', 2)),
+                    retention_seconds=float(os.environ.get('ANALYSIS_JOB_TTL', 3600)),
+                    max_jobs=int(os.environ.get('ANALYSIS_JOB_MAX_JOBS', 200)),
+                )
+    return _default_manager
@@ -7,16 +7,37 @@ Railway, Render, Fly.io 등에 배포 가능
 - DEBUG: 디버그 모드 (기본값: False)
 - ENABLE_HF: HuggingFace 모델 사용 여부 (기본값: False, Claude API 사용 권장)
 - CLAUDE_API_KEY: Claude API 키 (앱 소개 요약 및 감정 분석 기능용)
+- CLAUDE_POOL_MAX_CONNECTIONS / CLAUDE_POOL_MAX_KEEPALIVE: Claude API 커넥션 풀 설정 (claude_client.py 참고)
+- CLAUDE_WORKERS / CLAUDE_RPM / CLAUDE_TPM / CLAUDE_BATCH_SIZE: Claude 동시·배치 감정 분석 설정 (claude_scoring.py 참고)
+- ANALYZE_MATCH_FIRST: 키워드가 매칭된 리뷰만 텍스트 감정 분석 (기본값: True)
+- SENTIMENT_CACHE_ENABLED / SENTIMENT_CACHE_PATH: 감정 스코어 캐시 사용 여부 및 파일 경로 (sentiment_cache.py 참고)
+- ANALYSIS_JOB_WORKERS / ANALYSIS_JOB_TTL: 비동기 분석 작업 동시 실행 수 및 결과 보관 기간 (analysis_jobs.py 참고)
+- ANALYSIS_JOB_DEADLINE: /analyze/jobs, /analyze/stream 작업의 Claude 감정 분석 마감 시간
+  (초, 기본값: 0 = 제한 없음, 동기 /analyze는 CLAUDE_SCORING_DEADLINE)
+- ANALYZE_STREAM_CHUNK_SIZE: /analyze/stream 중간 집계 단위 리뷰 수 (기본값: 200)
+- ANALYZE_STREAM_HEARTBEAT: /analyze/stream heartbeat 간격 (초, 기본값: 10)
+- CRAWL_STATE_ENABLED / CRAWL_STATE_PATH: 증분 리뷰 수집 상태 저장 (crawl_state.py 참고)
+- REVIEW_STORE_ENABLED / REVIEW_STORE_PATH: 수집한 리뷰 저장소 (review_store.py 참고)
+- HTTP_CACHE_ENABLED / HTTP_CACHE_PATH / HTTP_CACHE_TTL_*: 플레이스토어 페이지 응답 캐시 (http_cache.py 참고)
+- PLAYSTORE_BASE_URL: 플레이스토어 검색/상세 페이지 기본 URL (playstore_crawler.py 참고)
+- PLAYSTORE_RATE_LIMIT / PLAYSTORE_RATE_BURST / PLAYSTORE_BREAKER_*: 크롤러 호스트별 속도 제한 및 서킷 브레이커 (host_limiter.py 참고)
+- PIPELINE_DETAIL_WORKERS / PIPELINE_COLLECT_WORKERS / PIPELINE_SUMMARY_WORKERS: /api/search-and-collect 단계별 동시 실행 수
+  (collect_pipeline.py 참고)
+- REFRESH_SCHEDULER_ENABLED / REFRESH_INTERVAL / REFRESH_MAX_AGE / REFRESH_BUDGET_PER_HOUR: 요청된 앱 리뷰 백그라운드 갱신
+  및 리뷰 저장소 응답 (refresh_scheduler.py 참고)
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import pandas as pd
+import numpy as np
 import re
 import json
 import logging
 import tempfile
 import os
+import queue
+import time
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime
@@ -82,24 +103,48 @@ except ImportError:
     CLAUDE_AVAILABLE = False
     logger.warning("anthropic 패키지가 설치되지 않았습니다. Claude API 기능을 사용할 수 없습니다.")
 
+# Claude 모델 및 감정 분석 프롬프트 버전 (프롬프트 변경 시 버전을 올려 캐시 무효화)
+CLAUDE_MODEL = "claude-sonnet-4-5"
+CLAUDE_SENTIMENT_PROMPT_VERSION = "v1"
+# batch-v1 캐시에는 리뷰 1개짜리 배치를 개별 프롬프트로 분석한 스코어가 섞여 있어 batch-v2로 분리
+CLAUDE_BATCH_SENTIMENT_PROMPT_VERSION = "batch-v2"
+
+
+def claude_sentiment_prompt_version() -> str:
+    """현재 설정(CLAUDE_BATCH_SIZE)에 맞는 감정 분석 프롬프트 버전"""
+    if int(os.environ.get('CLAUDE_BATCH_SIZE', 20)) > 1:
+        return CLAUDE_BATCH_SENTIMENT_PROMPT_VERSION
+    return CLAUDE_SENTIMENT_PROMPT_VERSION
+
 # analyse.py의 함수들을 import
 # 같은 디렉토리에 있으므로 직접 import 가능
 try:
     from analyse import (
-        preprocess,
-        rating_to_score,
+        preprocess_series,
+        dedup_stats,
+        ratings_to_scores,
         load_sentiment_model,
         analyze_text_sentiment,
-        calculate_hybrid_sentiment,
+        hybrid_sentiment_scores,
         load_data,
         match_keywords,
         aggregate_by_keyword,
-        match_keyword_groups,
+        build_match_table,
+        attach_review_columns,
+        matched_review_positions,
         aggregate_by_keyword_group,
         get_app_name,
         get_keyword_groups_df,
         HF_AVAILABLE
     )
+    from sentiment_cache import get_sentiment_cache, score_texts_cached
+    from claude_scoring import ClaudeScoringEngine, parse_score_array, scoring_deadline
+    from claude_client import get_claude_client, claude_client_stats
+    from analysis_jobs import get_job_manager, JOB_SUCCEEDED, JOB_CANCELLED
+    from crawl_state import get_crawl_state_store
+    from review_store import get_review_store
+    from http_cache import get_http_cache
+    from host_limiter import host_limiter_stats
 except ImportError as e:
     logger.error(f"analyse.py 모듈을 import할 수 없습니다: {e}")
     logger.error("현재 디렉토리:", os.path.dirname(os.path.abspath(__file__)))
@@ -110,7 +155,7 @@ app = Flask(__name__)
 CORS(app, resources={
     r"/*": {
         "origins": "*",
-        "methods": ["GET", "POST", "OPTIONS"],
+        "methods": ["GET", "POST", "DELETE", "OPTIONS"],
         "allow_headers": ["Content-Type", "Authorization"]
     }
 })
@@ -198,6 +243,99 @@ def _load_model_internal():
         _model_loading_failed = True  # 재시도 방지
 
 
+def _request_claude_sentiment(client, text: str, timeout: Optional[float] = None) -> Optional[float]:
+    """
+    Claude API 감정 분석 요청 (API 오류는 호출자가 처리하도록 예외 그대로 전달)
+    
+    Returns:
+        -1.0 ~ 1.0 감정 스코어, 응답에서 숫자를 찾지 못하면 None
+    """
+    # 감정 분석 프롬프트
+    prompt = f"""다음 리뷰 텍스트의 감정을 분석해주세요. 
+텍스트가 긍정적인지 부정적인지 판단하여 -1.0 (매우 부정)부터 1.0 (매우 긍정) 사이의 숫자로만 응답해주세요.
+소수점 한 자리까지 표시해주세요. (예: 0.5, -0.3, 1.0, -1.0)
+
+리뷰 텍스트:
+{text}
+
+감정 점수 (-1.0 ~ 1.0):"""
+    
+    request_options = {'timeout': timeout} if timeout is not None else {}
+    
+    # API 호출 (claude-sonnet-4-5 사용 - Sonnet 4.5)
+    message = client.messages.create(
+        model=CLAUDE_MODEL,  # Claude Sonnet 4.5 (최신 버전 자동 사용)
+        max_tokens=50,
+        temperature=0.1,  # 낮은 temperature로 일관된 결과
+        messages=[
+            {"role": "user", "content": prompt}
+        ],
+        **request_options
+    )
+    
+    # 응답에서 숫자 추출
+    result_text = message.content[0].text.strip()
+    
+    # 숫자 추출 (정규식 사용)
+    numbers = re.findall(r'-?\d+\.?\d*', result_text)
+    
+    if numbers:
+        score = float(numbers[0])
+        # 범위 제한 (-1.0 ~ 1.0)
+        return max(-1.0, min(1.0, score))
+    
+    logger.warning(f"Claude 감정 분석 응답에서 숫자를 찾을 수 없습니다: {result_text}")
+    return None
+
+
+def _request_claude_sentiment_batch(client, items: List[Tuple[int, str]],
+                                    timeout: Optional[float] = None) -> Optional[Dict[int, float]]:
+    """
+    여러 리뷰를 하나의 프롬프트로 감정 분석 요청 (API 오류는 예외 그대로 전달)
+    
+    Args:
+        items: (id, 리뷰 텍스트) 리스트
+    
+    Returns:
+        {id: 감정 스코어}, 응답이 JSON 배열이 아니면 None
+    """
+    reviews_json = json.dumps(
+        [{"id": item_id, "text": text} for item_id, text in items],
+        ensure_ascii=False
+    )
+    
+    # 배치 감정 분석 프롬프트
+    prompt = f"""다음 리뷰들의 감정을 각각 분석해주세요.
+각 리뷰가 긍정적인지 부정적인지 판단하여 -1.0 (매우 부정)부터 1.0 (매우 긍정) 사이의 숫자로 평가해주세요.
+소수점 한 자리까지 표시해주세요. (예: 0.5, -0.3, 1.0, -1.0)
+모든 리뷰의 id를 빠짐없이 한 번씩 포함하여, 다른 설명 없이 다음 형식의 JSON 배열로만 응답해주세요.
+[{{"id": 0, "score": 0.5}}, {{"id": 1, "score": -0.3}}]
+
+리뷰 목록 (JSON):
+{reviews_json}
+
+감정 점수 JSON 배열:"""
+    
+    request_options = {'timeout': timeout} if timeout is not None else {}
+    
+    message = client.messages.create(
+        model=CLAUDE_MODEL,
+        # 리뷰당 {"id": n, "score": x.x} 한 항목 (id 자릿수, 공백·줄바꿈 여유 포함)
+        max_tokens=64 + 32 * len(items),
+        temperature=0.1,
+        messages=[
+            {"role": "user", "content": prompt}
+        ],
+        **request_options
+    )
+    
+    result_text = message.content[0].text.strip()
+    scores = parse_score_array(result_text, [item_id for item_id, _ in items])
+    if scores is None:
+        logger.warning(f"Claude 배치 감정 분석 응답이 JSON 배열이 아닙니다: {result_text[:200]}")
+    return scores
+
+
 def analyze_sentiment_with_claude(text: str) -> Optional[float]:
     """
     Claude API를 사용하여 텍스트 감정 분석 수행
@@ -211,69 +349,67 @@ def analyze_sentiment_with_claude(text: str) -> Optional[float]:
     if not text or not text.strip():
         return 0.0
     
-    # Claude API 키 확인 (여러 방법 시도)
-    claude_api_key = (
-        os.environ.get('CLAUDE_API_KEY') or 
-        os.environ.get('ANTHROPIC_API_KEY')
-    )
-    
-    if not claude_api_key:
-        logger.debug("CLAUDE_API_KEY가 설정되지 않았습니다. 감정 분석을 건너뜁니다.")
-        return None
-    
-    # API 키가 비어있거나 공백만 있는 경우
-    if not claude_api_key.strip():
-        logger.warning("CLAUDE_API_KEY가 비어있습니다.")
-        return None
-    
     if not CLAUDE_AVAILABLE:
         logger.debug("anthropic 패키지가 설치되지 않았습니다. 감정 분석을 건너뜁니다.")
         return None
     
+    # 프로세스 공용 Claude API 클라이언트 (커넥션 재사용)
+    client = get_claude_client()
+    if client is None:
+        logger.debug("CLAUDE_API_KEY가 설정되지 않았거나 비어있습니다. 감정 분석을 건너뜁니다.")
+        return None
+    
     try:
-        # Claude API 클라이언트 생성
-        client = Anthropic(api_key=claude_api_key)
-        
-        # 감정 분석 프롬프트
-        prompt = f"""다음 리뷰 텍스트의 감정을 분석해주세요. 
-텍스트가 긍정적인지 부정적인지 판단하여 -1.0 (매우 부정)부터 1.0 (매우 긍정) 사이의 숫자로만 응답해주세요.
-소수점 한 자리까지 표시해주세요. (예: 0.5, -0.3, 1.0, -1.0)
-
-리뷰 텍스트:
-{text}
-
-감정 점수 (-1.0 ~ 1.0):"""
-        
-        # API 호출 (claude-sonnet-4-5 사용 - Sonnet 4.5)
-        message = client.messages.create(
-            model="claude-sonnet-4-5",  # Claude Sonnet 4.5 (최신 버전 자동 사용)
-            max_tokens=50,
-            temperature=0.1,  # 낮은 temperature로 일관된 결과
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        # 응답에서 숫자 추출
-        result_text = message.content[0].text.strip()
-        
-        # 숫자 추출 (정규식 사용)
-        numbers = re.findall(r'-?\d+\.?\d*', result_text)
-        
-        if numbers:
-            score = float(numbers[0])
-            # 범위 제한 (-1.0 ~ 1.0)
-            score = max(-1.0, min(1.0, score))
-            return score
-        else:
-            logger.warning(f"Claude 감정 분석 응답에서 숫자를 찾을 수 없습니다: {result_text}")
-            return None
+        return _request_claude_sentiment(client, text)
         
     except Exception as e:
         logger.error(f"Claude 감정 분석 실패: {e}")
         return None
 
 
+def _score_texts_with_claude(texts: List[str], progress=None, cancel_event=None,
+                             deadline: Optional[float] = None,
+                             stats: Optional[Dict[str, int]] = None) -> List[Optional[float]]:
+    """
+    Claude로 여러 텍스트의 감정 스코어를 동시에 계산
+    워커 수/RPM/TPM/재시도/마감 시간은 claude_scoring.py의 환경 변수로 설정
+    (RPM/TPM 토큰 버킷은 프로세스 공용이므로 동시 요청이 같은 한도를 나눠 씀)
+    
+    Args:
+        progress: (완료 수, 전체 수)를 받는 진행 상황 콜백 (로깅과 함께 호출)
+        cancel_event: 설정되면 남은 분석을 중단 (threading.Event)
+        deadline: 분석 실행 전체 마감 시각 (scoring_deadline(), None이면 이 호출부터 CLAUDE_SCORING_DEADLINE)
+        stats: 엔진 통계(deadline_skipped_texts 등)를 더할 딕셔너리
+    """
+    client = get_claude_client() if CLAUDE_AVAILABLE else None
+    if client is None:
+        return [None] * len(texts)
+    
+    # 재시도는 엔진이 직접 처리하므로 SDK 자체 재시도는 끔 (커넥션 풀은 공유)
+    client = client.with_options(max_retries=0)
+    engine = ClaudeScoringEngine.from_env(
+        lambda text, timeout: _request_claude_sentiment(client, text, timeout),
+        batch_score_fn=lambda items, timeout: _request_claude_sentiment_batch(client, items, timeout)
+    )
+    
+    last_done = 0
+    
+    def log_progress(done: int, total: int):
+        # 진행 상황 로깅 (50개 단위 경계를 넘을 때마다, 배치로 여러 개씩 늘어나도 빠짐없이)
+        nonlocal last_done
+        if done // 50 != last_done // 50 or done == total:
+            logger.info(f'감정 분석 진행 중: {done}/{total}')
+        last_done = done
+        if progress is not None:
+            progress(done, total)
+    
+    scores = engine.score(texts, progress=log_progress, cancel_event=cancel_event, deadline=deadline)
+    if stats is not None:
+        for key, value in engine.stats.items():
+            stats[key] = stats.get(key, 0) + value
+    return scores
+
+
 def summarize_app_intro(intro_text: str) -> str:
     """
     Claude API를 사용하여 앱 소개 텍스트를 200자 내외의 한국어로 요약
@@ -287,30 +423,23 @@ def summarize_app_intro(intro_text: str) -> str:
     if not intro_text or not intro_text.strip():
         return "앱 소개 정보가 없습니다."
     
-    # Claude API 키 확인 (여러 방법 시도)
-    claude_api_key = (
-        os.environ.get('CLAUDE_API_KEY') or 
-        os.environ.get('ANTHROPIC_API_KEY')
-    )
-    
-    if not claude_api_key or not claude_api_key.strip():
-        logger.warning("CLAUDE_API_KEY가 설정되지 않았습니다. 원본 텍스트를 반환합니다.")
-        logger.warning("💡 Railway Variables에서 CLAUDE_API_KEY를 확인하세요.")
-        # 원본이 너무 길면 앞부분만 반환
+    if not CLAUDE_AVAILABLE:
+        logger.warning("anthropic 패키지가 설치되지 않았습니다. 원본 텍스트를 반환합니다.")
         if len(intro_text) > 200:
             return intro_text[:197] + "..."
         return intro_text
     
-    if not CLAUDE_AVAILABLE:
-        logger.warning("anthropic 패키지가 설치되지 않았습니다. 원본 텍스트를 반환합니다.")
+    # 프로세스 공용 Claude API 클라이언트 (API 키가 없으면 None)
+    client = get_claude_client()
+    if client is None:
+        logger.warning("CLAUDE_API_KEY가 설정되지 않았습니다. 원본 텍스트를 반환합니다.")
+        logger.warning("💡 Railway Variables에서 CLAUDE_API_KEY를 확인하세요.")
+        # 원본이 너무 길면 앞부분만 반환
         if len(intro_text) > 200:
             return intro_text[:197] + "..."
         return intro_text
     
     try:
-        # Claude API 클라이언트 생성
-        client = Anthropic(api_key=claude_api_key)
-        
         # 요약 프롬프트 (한국어로 강제)
         prompt = f"""다음 앱 소개 텍스트를 200자 내외의 간결한 한국어로 요약해주세요. 
 반드시 한국어로만 작성해주세요. 영어나 다른 언어를 사용하지 마세요.
@@ -323,7 +452,7 @@ def summarize_app_intro(intro_text: str) -> str:
         
         # API 호출 (claude-sonnet-4-5 사용 - Sonnet 4.5)
         message = client.messages.create(
-            model="claude-sonnet-4-5",  # Claude Sonnet 4.5 (최신 버전 자동 사용)
+            model=CLAUDE_MODEL,  # Claude Sonnet 4.5 (최신 버전 자동 사용)
             max_tokens=300,
             temperature=0.3,
             messages=[
@@ -346,7 +475,7 @@ App description:
 
 Summary (한국어로만):"""
             message = client.messages.create(
-                model="claude-sonnet-4-5",  # Claude Sonnet 4.5 (최신 버전 자동 사용)
+                model=CLAUDE_MODEL,  # Claude Sonnet 4.5 (최신 버전 자동 사용)
                 max_tokens=300,
                 temperature=0.3,
                 messages=[
@@ -384,12 +513,36 @@ def health_check():
     }), 200
 
 
+@app.route('/stats', methods=['GET'])
+def stats():
+    """캐시 등 내부 통계 엔드포인트"""
+    cache = get_sentiment_cache()
+    crawl_state = get_crawl_state_store()
+    review_store = get_review_store()
+    http_cache = get_http_cache()
+    refresh_scheduler = get_refresh_scheduler(start=False)
+    return jsonify({
+        'sentiment_cache': cache.stats() if cache is not None else {'enabled': False},
+        'claude_client': claude_client_stats(),
+        'analysis_jobs': get_job_manager().stats(),
+        'crawl_state': crawl_state.stats() if crawl_state is not None else {'enabled': False},
+        'review_store': review_store.stats() if review_store is not None else {'enabled': False},
+        'http_cache': http_cache.stats() if http_cache is not None else {'enabled': False},
+        'crawler_limits': host_limiter_stats(),
+        'refresh_scheduler': refresh_scheduler.stats() if refresh_scheduler is not None else {'enabled': False}
+    }), 200
+
+
 # 크롤링 모듈 import
 CRAWLER_AVAILABLE = False
 search_apps = None
 get_app_reviews = None
 get_multiple_app_reviews = None
+collect_multiple_app_reviews = None
 merge_app_info_and_reviews = None
+get_refresh_scheduler = None
+collect_reviews_with_cache = None
+search_and_collect = None
 
 try:
     logger.info("크롤링 모듈 import 시도 중...")
@@ -397,8 +550,11 @@ try:
         search_apps,
         get_app_reviews,
         get_multiple_app_reviews,
+        collect_multiple_app_reviews,
         merge_app_info_and_reviews
     )
+    from refresh_scheduler import get_refresh_scheduler, collect_reviews_with_cache
+    from collect_pipeline import search_and_collect
     CRAWLER_AVAILABLE = True
     logger.info("✓ 크롤링 기능이 활성화되었습니다.")
 except ImportError as e:
@@ -414,9 +570,20 @@ except ImportError as e:
     def get_multiple_app_reviews(*args, **kwargs):
         import pandas as pd
         return pd.DataFrame()
+    def collect_multiple_app_reviews(*args, **kwargs):
+        import pandas as pd
+        return pd.DataFrame(), []
     def merge_app_info_and_reviews(*args, **kwargs):
         import pandas as pd
         return pd.DataFrame()
+    def get_refresh_scheduler(start=True):
+        return None
+    def collect_reviews_with_cache(*args, **kwargs):
+        import pandas as pd
+        return pd.DataFrame(), []
+    def search_and_collect(*args, **kwargs):
+        import pandas as pd
+        return [], pd.DataFrame(), []
 except Exception as e:
     logger.error(f"✗ playstore_crawler 모듈 로드 중 예상치 못한 오류: {e}", exc_info=True)
     logger.warning("크롤링 기능이 비활성화됩니다.")
@@ -430,9 +597,20 @@ except Exception as e:
     def get_multiple_app_reviews(*args, **kwargs):
         import pandas as pd
         return pd.DataFrame()
+    def collect_multiple_app_reviews(*args, **kwargs):
+        import pandas as pd
+        return pd.DataFrame(), []
     def merge_app_info_and_reviews(*args, **kwargs):
         import pandas as pd
         return pd.DataFrame()
+    def get_refresh_scheduler(start=True):
+        return None
+    def collect_reviews_with_cache(*args, **kwargs):
+        import pandas as pd
+        return pd.DataFrame(), []
+    def search_and_collect(*args, **kwargs):
+        import pandas as pd
+        return [], pd.DataFrame(), []
 
 # 최종 상태 로깅
 logger.info(f"크롤링 기능 상태: CRAWLER_AVAILABLE = {CRAWLER_AVAILABLE}")
@@ -517,9 +695,12 @@ def get_app_reviews_endpoint():
     {
         "app_ids": ["com.example.app1", "com.example.app2"],
         "max_reviews": 150,  # 선택사항, 기본값: 150
-        "months": 6  # 선택사항, 기본값: 6
+        "months": 6,  # 선택사항, 기본값: 6
+        "incremental": false  # 선택사항, true이면 지난 수집 이후의 새 리뷰만 수집 (저장소 응답 사용 안 함)
     }
     
+    최근에 (백그라운드) 갱신된 앱은 리뷰 저장소에서 바로 응답하고, 나머지 앱만 즉시 수집합니다.
+    
     응답 형식:
     {
         "success": true,
@@ -532,7 +713,10 @@ def get_app_reviews_endpoint():
                 "app_id": "com.example.app"
             }
         ],
-        "count": 150
+        "count": 150,
+        "collection_report": [  # 앱별 수집 결과 (status: cached / ok / empty / failed / timeout)
+            {"app_id": "com.example.app", "status": "ok", "review_count": 150, "elapsed": 2.31}
+        ]
     }
     """
     try:
@@ -553,20 +737,31 @@ def get_app_reviews_endpoint():
         
         max_reviews = data.get('max_reviews', 150)
         months = data.get('months', 6)
+        incremental = bool(data.get('incremental', False))
         
-        logger.info(f'리뷰 수집 요청: app_ids={app_ids}, max_reviews={max_reviews}, months={months}')
+        logger.info(f'리뷰 수집 요청: app_ids={app_ids}, max_reviews={max_reviews}, months={months}, incremental={incremental}')
         
-        reviews_df = get_multiple_app_reviews(
-            app_ids=app_ids,
-            max_reviews_per_app=max_reviews,
-            months=months
-        )
+        if incremental:
+            reviews_df, collection_report = collect_multiple_app_reviews(
+                app_ids=app_ids,
+                max_reviews_per_app=max_reviews,
+                months=months,
+                incremental=True
+            )
+        else:
+            reviews_df, collection_report = collect_reviews_with_cache(
+                get_refresh_scheduler(),
+                app_ids=app_ids,
+                max_reviews_per_app=max_reviews,
+                months=months
+            )
         
         if reviews_df.empty:
             return jsonify({
                 'success': True,
                 'reviews': [],
                 'count': 0,
+                'collection_report': collection_report,
                 'message': '수집된 리뷰가 없습니다.'
             }), 200
         
@@ -576,7 +771,8 @@ def get_app_reviews_endpoint():
         return jsonify({
             'success': True,
             'reviews': reviews_list,
-            'count': len(reviews_list)
+            'count': len(reviews_list),
+            'collection_report': collection_report
         }), 200
         
     except Exception as e:
@@ -606,7 +802,8 @@ def search_and_collect_endpoint():
         "apps": [...],  # 앱 정보
         "reviews": [...],  # 리뷰 데이터
         "app_count": 10,
-        "review_count": 1500
+        "review_count": 1500,
+        "collection_report": [...]  # 앱별 수집 시간 및 실패 정보
     }
     """
     try:
@@ -638,8 +835,22 @@ def search_and_collect_endpoint():
                 'success': False
             }), 503
         
-        # 1. 앱 검색
-        apps = search_apps(keyword, max_results=max_apps)
+        def summarize(app: Dict) -> str:
+            intro_text = app.get('intro', '')
+            if intro_text:
+                return summarize_app_intro(intro_text)
+            return f'{keyword} 관련 앱입니다.'
+        
+        # 1~3. 앱 검색 → 앱별 리뷰 수집 / 상세 정보 → 소개 요약 (파이프라인, 앱 ID를 얻는 즉시 수집 시작)
+        #      최근에 갱신된 앱은 리뷰 저장소에서 응답, 느리거나 실패한 앱은 collection_report에 기록
+        apps, reviews_df, collection_report = search_and_collect(
+            keyword,
+            max_apps=max_apps,
+            max_reviews=max_reviews,
+            months=months,
+            summarize=summarize,
+            scheduler=get_refresh_scheduler()
+        )
         
         if not apps:
             return jsonify({
@@ -651,26 +862,6 @@ def search_and_collect_endpoint():
                 'message': '검색된 앱이 없습니다.'
             }), 200
         
-        # 1.5. 각 앱의 소개를 Claude API로 요약하여 ai_summary 추가
-        logger.info(f'{len(apps)}개 앱의 소개 요약 시작...')
-        for app in apps:
-            intro_text = app.get('intro', '')
-            if intro_text:
-                app['ai_summary'] = summarize_app_intro(intro_text)
-            else:
-                app['ai_summary'] = f'{keyword} 관련 앱입니다.'
-        logger.info('앱 소개 요약 완료')
-        
-        # 2. 앱 ID 추출
-        app_ids = [app['app_id'] for app in apps]
-        
-        # 3. 리뷰 수집
-        reviews_df = get_multiple_app_reviews(
-            app_ids=app_ids,
-            max_reviews_per_app=max_reviews,
-            months=months
-        )
-        
         # 4. 앱 정보와 리뷰 병합
         app_info_df = pd.DataFrame(apps)
         merged_df = merge_app_info_and_reviews(app_info_df, reviews_df)
@@ -683,7 +874,8 @@ def search_and_collect_endpoint():
             'apps': apps,
             'reviews': reviews_list,
             'app_count': len(apps),
-            'review_count': len(reviews_list)
+            'review_count': len(reviews_list),
+            'collection_report': collection_report
         }), 200
         
     except Exception as e:
@@ -746,6 +938,371 @@ def search_and_collect_endpoint():
 #     pass
 
 
+class AnalysisError(Exception):
+    """분석 요청 오류 (HTTP 상태 코드 포함)"""
+    
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _normalize_review_columns(reviews: pd.DataFrame) -> pd.DataFrame:
+    """
+    리뷰 데이터 컬럼명을 분석용 이름(review_id, text, rating, app_id)으로 정리
+    
+    Raises:
+        AnalysisError: 필수 컬럼이 없는 경우
+    """
+    # 컬럼명 매핑 (output_merge.csv 구조에 맞춤)
+    column_mapping = {
+        'reviewId': 'review_id',
+        'content': 'text',
+        'score': 'rating',
+        'app_ids': 'app_id'
+    }
+    
+    # 컬럼명 변경
+    reviews = reviews.rename(columns=column_mapping)
+    
+    # 필수 컬럼 검증
+    required_cols = ['review_id']
+    missing_cols = [col for col in required_cols if col not in reviews.columns]
+    if missing_cols:
+        raise AnalysisError(f'리뷰 데이터에 필수 컬럼이 없습니다: {missing_cols}')
+    
+    # text 컬럼이 없으면 content 컬럼 사용
+    if 'text' not in reviews.columns and 'content' in reviews.columns:
+        reviews['text'] = reviews['content']
+    
+    # rating이 없으면 score 사용
+    if 'rating' not in reviews.columns and 'score' in reviews.columns:
+        reviews['rating'] = reviews['score']
+    
+    return reviews
+
+
+def _read_uploaded_reviews() -> pd.DataFrame:
+    """
+    업로드된 리뷰 데이터 파일(reviews_data)을 읽어 컬럼명을 정리한 DataFrame 반환
+    (요청 컨텍스트 안에서 호출해야 함)
+    
+    Raises:
+        AnalysisError: 파일이 없거나 필수 컬럼이 없는 경우
+    """
+    # 리뷰 데이터 파일 확인
+    if 'reviews_data' not in request.files:
+        raise AnalysisError('전처리된 리뷰 데이터 파일이 필요합니다.')
+    
+    reviews_file = request.files['reviews_data']
+    if not reviews_file.filename:
+        raise AnalysisError('전처리된 리뷰 데이터 파일이 비어있습니다.')
+    
+    logger.info(f'파일 수신: reviews_data={reviews_file.filename}')
+    
+    # 임시 디렉토리 생성
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # 전처리된 리뷰 데이터 파일 저장 및 로드
+        reviews_path = os.path.join(temp_dir, 'reviews_data.csv')
+        reviews_file.save(reviews_path)
+        logger.info(f'리뷰 데이터 파일 저장: {reviews_path}')
+        
+        # CSV를 읽어서 DataFrame으로 변환
+        reviews = pd.read_csv(reviews_path)
+        logger.info(f'리뷰 데이터 로드 완료: {len(reviews)}개')
+    
+    return _normalize_review_columns(reviews)
+
+
+def _load_stored_reviews(data: Dict) -> pd.DataFrame:
+    """
+    리뷰 저장소에서 앱 ID와 기간으로 리뷰를 읽어 컬럼명을 정리한 DataFrame 반환
+    
+    Args:
+        data: {"app_ids": [...], "start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD"} (기간은 선택사항)
+        
+    Raises:
+        AnalysisError: 요청 형식이 잘못되었거나 저장소를 사용할 수 없는 경우, 조회된 리뷰가 없는 경우
+    """
+    app_ids = data.get('app_ids')
+    if isinstance(app_ids, str):
+        app_ids = [app_id.strip() for app_id in app_ids.split(',') if app_id.strip()]
+    if not isinstance(app_ids, list) or len(app_ids) == 0:
+        raise AnalysisError('app_ids는 비어있지 않은 리스트여야 합니다.')
+    
+    start_date = data.get('start_date') or None
+    end_date = data.get('end_date') or None
+    for name, value in (('start_date', start_date), ('end_date', end_date)):
+        if value is not None:
+            try:
+                datetime.strptime(value, '%Y-%m-%d')
+            except (TypeError, ValueError):
+                raise AnalysisError(f'{name}는 YYYY-MM-DD 형식이어야 합니다: {value}')
+    
+    store = get_review_store()
+    if store is None:
+        raise AnalysisError('리뷰 저장소가 비활성화되어 있습니다. REVIEW_STORE_ENABLED를 확인하세요.', 503)
+    
+    reviews = store.load_reviews([str(app_id) for app_id in app_ids], start_date=start_date, end_date=end_date)
+    logger.info(f'리뷰 저장소에서 로드: app_ids={app_ids}, 기간={start_date}~{end_date}, {len(reviews)}개')
+    if reviews.empty:
+        raise AnalysisError('저장된 리뷰가 없습니다. 먼저 리뷰를 수집하거나 기간을 확인해주세요.', 404)
+    
+    reviews = _normalize_review_columns(reviews)
+    reviews.attrs['source'] = 'review_store'
+    return reviews
+
+
+def _read_request_reviews() -> pd.DataFrame:
+    """
+    분석 요청의 리뷰 데이터 읽기
+    - reviews_data CSV 파일 업로드 (multipart/form-data)
+    - 또는 app_ids + 기간으로 리뷰 저장소 조회 (JSON 본문 또는 폼 필드)
+    """
+    if 'reviews_data' not in request.files:
+        data = request.get_json(silent=True) if request.is_json else request.form.to_dict()
+        if data and data.get('app_ids'):
+            return _load_stored_reviews(data)
+    return _read_uploaded_reviews()
+
+
+def _partial_keyword_group_summary(match_table: pd.DataFrame, reviews: pd.DataFrame,
+                                   keyword_groups: pd.DataFrame, review_score, pending_positions,
+                                   app_name: str) -> List[Dict]:
+    """
+    감정 분석이 끝난 리뷰만으로 키워드 그룹별 중간 집계 (aggregate_by_keyword_group과 동일한 형식)
+    
+    Args:
+        review_score: 리뷰 위치 -> 감정 스코어 함수
+        pending_positions: 아직 분석 중인 리뷰 위치 (집계에서 제외)
+    """
+    resolved = match_table[~match_table['row'].isin(pending_positions)]
+    if resolved.empty:
+        return []
+    
+    scores = pd.Series(float('nan'), index=range(len(reviews)))
+    for position in pd.unique(resolved['row']):
+        scores[position] = review_score(int(position))
+    partial_reviews = reviews.assign(sentiment_score=scores.to_numpy())
+    
+    kw_df = attach_review_columns(resolved, partial_reviews, keyword_groups, ['review_id', 'sentiment_score'])
+    summary = aggregate_by_keyword_group(kw_df)
+    summary['app_name'] = app_name
+    return summary.to_dict('records')
+
+
+def run_review_analysis(reviews: pd.DataFrame, job=None, on_partial=None,
+                        counters: Optional[Dict] = None) -> List[Dict]:
+    """
+    리뷰 분석 파이프라인 (전처리 → 키워드 그룹 매칭 → 감정 분석 → 집계)
+    
+    Args:
+        reviews: _read_request_reviews()로 읽은 리뷰 DataFrame
+        job: 진행 상황을 보고할 analysis_jobs.AnalysisJob (None이면 동기 실행)
+        on_partial: Claude 감정 분석 중 묶음(ANALYZE_STREAM_CHUNK_SIZE개)이 끝날 때마다
+            분석이 끝난 리뷰만으로 만든 중간 집계 결과를 받는 콜백
+        counters: job 카운터와 같은 항목을 기록할 딕셔너리 (동기 실행 시 응답에 포함할 통계용)
+        
+    Returns:
+        키워드 그룹별 집계 결과 리스트 (/analyze 응답의 data)
+        
+    Raises:
+        AnalysisError: 매칭 결과가 없거나 감정 분석에 필요한 컬럼이 없는 경우
+        JobCancelled: job이 취소된 경우
+    """
+    def report(stage: Optional[str] = None, percent: Optional[float] = None, **values):
+        if counters is not None:
+            counters.update(values)
+        if job is not None:
+            job.check_cancelled()
+            job.update(stage=stage, percent=percent, **values)
+    
+    report('preprocessing', 0, total_reviews=len(reviews))
+    
+    # 키워드 그룹 데이터 로드 (코드에 하드코딩된 딕셔너리 사용)
+    logger.info('키워드 그룹 데이터 로드 중...')
+    keyword_groups = get_keyword_groups_df()
+    logger.info(f'키워드 그룹 데이터 로드 완료: {len(keyword_groups)}개')
+    
+    # 앱 이름 추출 (리뷰 데이터에 app_id가 있는 경우)
+    app_name = 'unknown_app'
+    if 'app_id' in reviews.columns and not reviews['app_id'].isna().all():
+        app_id = reviews['app_id'].mode()[0] if len(reviews['app_id'].mode()) > 0 else reviews['app_id'].iloc[0]
+        app_name = str(app_id)
+    logger.info(f'앱 이름: {app_name}')
+    
+    # 텍스트 전처리 (키워드 매칭을 위해)
+    if 'text' in reviews.columns:
+        logger.info('리뷰 텍스트 전처리 중...')
+        reviews['clean_text'] = preprocess_series(reviews['text'])
+        reviews = reviews[reviews['clean_text'].str.len() > 0]
+        
+        # 같은 텍스트는 매칭 / 감정 분석 / 캐시 조회를 한 번만 수행
+        stats = dedup_stats(reviews['clean_text'])
+        logger.info(f"텍스트 중복 제거: 리뷰 {stats['texts']}개 → 고유 텍스트 {stats['unique_texts']}개 "
+                    f"(중복 비율 {stats['dedup_ratio']:.1%})")
+        report(unique_texts=stats['unique_texts'], dedup_ratio=stats['dedup_ratio'])
+    else:
+        reviews['clean_text'] = ''
+    
+    # 키워드 그룹별 매칭 (감정 분석 대상 선정을 위해 먼저 수행)
+    report('matching', 5)
+    logger.info('키워드 그룹별 매칭 중...')
+    match_table = build_match_table(reviews, keyword_groups, use_tagged_keywords=True)
+    
+    if match_table.empty:
+        raise AnalysisError('키워드 그룹 매칭 결과가 없습니다. 키워드 그룹이나 리뷰 데이터를 확인해주세요.')
+    
+    # match-first 모드: 키워드가 매칭된 리뷰만 텍스트 감정 분석 (나머지는 별점만 사용)
+    match_first = os.environ.get('ANALYZE_MATCH_FIRST', 'true').lower() == 'true'
+    if match_first:
+        score_candidates = set(matched_review_positions(match_table).tolist())
+        logger.info(f'매칭된 리뷰만 텍스트 감정 분석: {len(score_candidates)}/{len(reviews)}개')
+    else:
+        score_candidates = set(range(len(reviews)))
+    report('scoring', 10, matched_reviews=len(score_candidates))
+    
+    # 감정 스코어 계산 (전처리된 데이터에 이미 있을 수 있음)
+    sentiment_scorer = None
+    if 'sentiment_score' not in reviews.columns:
+        logger.info('감정 스코어 계산 중...')
+        
+        # Claude API를 사용한 감정 분석 시도 (여러 환경 변수 이름 확인)
+        claude_api_key = (
+            os.environ.get('CLAUDE_API_KEY') or 
+            os.environ.get('ANTHROPIC_API_KEY')
+        )
+        use_claude = claude_api_key and claude_api_key.strip() and CLAUDE_AVAILABLE
+        
+        if claude_api_key:
+            logger.info(f"✓ Claude API 키 발견 (길이: {len(claude_api_key)}자)")
+        else:
+            logger.warning("✗ Claude API 키를 찾을 수 없습니다. 별점 기반 분석만 사용합니다.")
+            logger.warning("💡 Railway Variables에서 CLAUDE_API_KEY를 확인하세요.")
+        
+        if use_claude:
+            logger.info('Claude API를 사용하여 감정 분석 수행 중...')
+            logger.info(f'총 {len(reviews)}개 리뷰 분석 예정')
+            
+            total_reviews = len(reviews)
+            # 캐시에 없는 리뷰만 Claude로 분석 (동일 텍스트는 한 번만 분석)
+            texts = reviews['clean_text'].tolist()
+            text_positions = [
+                i for i, text in enumerate(texts)
+                if i in score_candidates and text and len(text.strip()) > 0
+            ]
+            
+            # 별점 스코어 (Claude 실패/미분석 리뷰는 별점만 사용)
+            if 'rating' in reviews.columns:
+                rating_scores = ratings_to_scores(reviews['rating'])
+            else:
+                rating_scores = np.zeros(len(reviews))
+            
+            def review_score(position: int) -> float:
+                claude_score = claude_score_by_position.get(position)
+                if claude_score is not None:
+                    # 하이브리드 스코어: Claude 70%, 별점 30%
+                    return claude_score * 0.7 + rating_scores[position] * 0.3
+                return rating_scores[position]
+            
+            # 부분 집계가 필요하면 나누어 분석하고, 나눈 묶음이 끝날 때마다 중간 결과 전달
+            chunk_size = len(text_positions)
+            if on_partial is not None:
+                chunk_size = int(os.environ.get('ANALYZE_STREAM_CHUNK_SIZE', 200))
+            chunk_size = max(chunk_size, 1)
+            claude_score_by_position = {}
+            pending_positions = set(text_positions)
+            # 마감 시간은 묶음마다가 아니라 분석 실행 전체에 대해 한 번만 계산
+            # (동기 /analyze는 gunicorn 요청 타임아웃에 맞춘 CLAUDE_SCORING_DEADLINE,
+            #  백그라운드 작업은 ANALYSIS_JOB_DEADLINE, 기본값은 제한 없음)
+            if job is None:
+                deadline = scoring_deadline()
+            else:
+                deadline = scoring_deadline(float(os.environ.get('ANALYSIS_JOB_DEADLINE', 0)))
+            claude_stats: Dict[str, int] = {}
+            
+            for start in range(0, len(text_positions), chunk_size):
+                chunk_positions = text_positions[start:start + chunk_size]
+                
+                def score_progress(done: int, total: int, offset: int = start):
+                    # 감정 분석 단계는 전체 진행률의 10~90% (취소는 엔진이 cancel_event로 처리)
+                    scored = offset + done
+                    job.update(percent=10 + 80 * scored / max(len(text_positions), 1),
+                               scored=scored, to_score=len(text_positions))
+                
+                chunk_scores = score_texts_cached(
+                    [texts[i] for i in chunk_positions],
+                    lambda batch: _score_texts_with_claude(
+                        batch,
+                        progress=score_progress if job is not None else None,
+                        cancel_event=job.cancel_event if job is not None else None,
+                        deadline=deadline,
+                        stats=claude_stats
+                    ),
+                    scorer='claude',
+                    model=CLAUDE_MODEL,
+                    prompt_version=claude_sentiment_prompt_version(),
+                    cache=get_sentiment_cache()
+                )
+                claude_score_by_position.update(zip(chunk_positions, chunk_scores))
+                pending_positions.difference_update(chunk_positions)
+                
+                if on_partial is not None and pending_positions:
+                    report()
+                    on_partial(_partial_keyword_group_summary(
+                        match_table, reviews, keyword_groups, review_score, pending_positions, app_name
+                    ))
+            report(percent=90)
+            
+            claude_scores = [claude_score_by_position.get(position) for position in range(len(reviews))]
+            claude_success_count = sum(score is not None for score in claude_scores)
+            claude_fail_count = len(claude_score_by_position) - claude_success_count
+            # 마감 시간 초과로 Claude에 보내지 못해 별점만 사용한 리뷰 수 (실패 수에 포함)
+            claude_deadline_skipped = claude_stats.get('deadline_skipped_texts', 0)
+            if claude_deadline_skipped:
+                logger.warning(f'마감 시간 초과로 {claude_deadline_skipped}개 텍스트는 별점만 사용했습니다.')
+            
+            # 하이브리드 스코어: Claude 70%, 별점 30%
+            # (텍스트가 없거나 매칭되지 않은 리뷰, Claude 실패 시에는 별점만 사용)
+            reviews['sentiment_score'] = hybrid_sentiment_scores(
+                rating_scores, claude_scores, rating_weight=0.3, text_weight=0.7
+            )
+            sentiment_scorer = f'claude-hybrid:{CLAUDE_MODEL}:{claude_sentiment_prompt_version()}'
+            report(claude_success=claude_success_count, claude_fail=claude_fail_count,
+                   claude_deadline_skipped=claude_deadline_skipped)
+            logger.info(f'Claude 기반 감정 분석 완료: 성공 {claude_success_count}개, 실패 {claude_fail_count}개, 별점만 사용 {total_reviews - claude_success_count - claude_fail_count}개')
+        else:
+            # Claude를 사용할 수 없으면 별점 기반으로만 계산
+            logger.info('Claude API를 사용할 수 없습니다. 별점 기반 감정 분석만 수행합니다.')
+            if 'rating' in reviews.columns:
+                reviews['sentiment_score'] = ratings_to_scores(reviews['rating'])
+                sentiment_scorer = 'rating'
+            else:
+                raise AnalysisError('리뷰 데이터에 sentiment_score 또는 rating 컬럼이 필요합니다.')
+    
+    # 리뷰 저장소에서 읽은 리뷰는 분석한 감정 스코어를 저장소에 기록
+    if sentiment_scorer is not None and reviews.attrs.get('source') == 'review_store':
+        store = get_review_store()
+        if store is not None:
+            store.update_sentiment(dict(zip(reviews['review_id'], reviews['sentiment_score'])), sentiment_scorer)
+    
+    # 매칭 결과에 감정 스코어 조인
+    report('aggregating', 95)
+    kw_df = attach_review_columns(match_table, reviews, keyword_groups, ['review_id', 'sentiment_score'])
+    
+    # 키워드 그룹별 집계
+    logger.info('키워드 그룹별 집계 중...')
+    summary = aggregate_by_keyword_group(kw_df)
+    
+    # 앱 이름 추가
+    summary['app_name'] = app_name
+    
+    # DataFrame을 JSON으로 변환
+    result_data = summary.to_dict('records')
+    
+    logger.info(f'분석 완료: {len(result_data)}개 키워드')
+    return result_data
+
+
 @app.route('/analyze', methods=['POST'])
 def analyze_reviews():
     # HuggingFace 모델 로딩 제거 - Claude API만 사용
@@ -754,9 +1311,11 @@ def analyze_reviews():
     """
     리뷰 분석 API 엔드포인트
     
-    요청 형식:
-    - reviews_data: CSV 파일 (multipart/form-data, 필수)
+    요청 형식 (둘 중 하나):
+    - reviews_data: CSV 파일 (multipart/form-data)
       - 전처리된 리뷰 데이터 (reviewId, content, score, app_ids 등 포함)
+    - 리뷰 저장소 조회 (JSON 본문 또는 폼 필드, 리뷰 수집 API로 저장된 리뷰 사용)
+      {"app_ids": ["com.example.app"], "start_date": "2024-01-01", "end_date": "2024-06-30"}  # 기간은 선택사항
     
     응답 형식:
     {
@@ -777,174 +1336,29 @@ def analyze_reviews():
     }
     """
     try:
-        # 리뷰 데이터 파일 확인
-        if 'reviews_data' not in request.files:
-            return jsonify({
-                'error': '전처리된 리뷰 데이터 파일이 필요합니다.',
-                'success': False
-            }), 400
-        
-        reviews_file = request.files['reviews_data']
-        if not reviews_file.filename:
-            return jsonify({
-                'error': '전처리된 리뷰 데이터 파일이 비어있습니다.',
-                'success': False
-            }), 400
+        reviews = _read_request_reviews()
+        counters = {}
+        result_data = run_review_analysis(reviews, counters=counters)
         
-        logger.info(f'파일 수신: reviews_data={reviews_file.filename}')
+        response = {
+            'success': True,
+            'data': result_data,
+            'message': '분석이 완료되었습니다.'
+        }
+        if counters.get('claude_deadline_skipped'):
+            # 마감 시간 안에 Claude로 분석하지 못한 텍스트는 별점만 사용
+            response['claude_deadline_skipped'] = counters['claude_deadline_skipped']
+            response['message'] = (f"분석이 완료되었습니다. 마감 시간 초과로 "
+                                   f"{counters['claude_deadline_skipped']}개 텍스트는 별점만 사용했습니다.")
+        return jsonify(response), 200
+    
+    except AnalysisError as e:
+        logger.error(f'분석 요청 오류: {e}')
+        return jsonify({
+            'error': str(e),
+            'success': False
+        }), e.status_code
         
-        # 임시 디렉토리 생성
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # 키워드 그룹 데이터 로드 (코드에 하드코딩된 딕셔너리 사용)
-            logger.info('키워드 그룹 데이터 로드 중...')
-            keyword_groups = get_keyword_groups_df()
-            logger.info(f'키워드 그룹 데이터 로드 완료: {len(keyword_groups)}개')
-            
-            # 전처리된 리뷰 데이터 파일 저장 및 로드
-            reviews_path = os.path.join(temp_dir, 'reviews_data.csv')
-            reviews_file.save(reviews_path)
-            logger.info(f'리뷰 데이터 파일 저장: {reviews_path}')
-            
-            # CSV를 읽어서 DataFrame으로 변환
-            reviews = pd.read_csv(reviews_path)
-            logger.info(f'리뷰 데이터 로드 완료: {len(reviews)}개')
-            
-            # 컬럼명 매핑 (output_merge.csv 구조에 맞춤)
-            column_mapping = {
-                'reviewId': 'review_id',
-                'content': 'text',
-                'score': 'rating',
-                'app_ids': 'app_id'
-            }
-            
-            # 컬럼명 변경
-            reviews = reviews.rename(columns=column_mapping)
-            
-            # 필수 컬럼 검증
-            required_cols = ['review_id']
-            missing_cols = [col for col in required_cols if col not in reviews.columns]
-            if missing_cols:
-                return jsonify({
-                    'error': f'리뷰 데이터에 필수 컬럼이 없습니다: {missing_cols}',
-                    'success': False
-                }), 400
-            
-            # text 컬럼이 없으면 content 컬럼 사용
-            if 'text' not in reviews.columns and 'content' in reviews.columns:
-                reviews['text'] = reviews['content']
-            
-            # rating이 없으면 score 사용
-            if 'rating' not in reviews.columns and 'score' in reviews.columns:
-                reviews['rating'] = reviews['score']
-            
-            # 앱 이름 추출 (리뷰 데이터에 app_id가 있는 경우)
-            app_name = 'unknown_app'
-            if 'app_id' in reviews.columns and not reviews['app_id'].isna().all():
-                app_id = reviews['app_id'].mode()[0] if len(reviews['app_id'].mode()) > 0 else reviews['app_id'].iloc[0]
-                app_name = str(app_id)
-            logger.info(f'앱 이름: {app_name}')
-            
-            # 텍스트 전처리 (키워드 매칭을 위해)
-            if 'text' in reviews.columns:
-                logger.info('리뷰 텍스트 전처리 중...')
-                reviews['clean_text'] = reviews['text'].apply(preprocess)
-                reviews = reviews[reviews['clean_text'].str.len() > 0]
-            else:
-                reviews['clean_text'] = ''
-            
-            # 감정 스코어 계산 (전처리된 데이터에 이미 있을 수 있음)
-            if 'sentiment_score' not in reviews.columns:
-                logger.info('감정 스코어 계산 중...')
-                
-                # Claude API를 사용한 감정 분석 시도 (여러 환경 변수 이름 확인)
-                claude_api_key = (
-                    os.environ.get('CLAUDE_API_KEY') or 
-                    os.environ.get('ANTHROPIC_API_KEY')
-                )
-                use_claude = claude_api_key and claude_api_key.strip() and CLAUDE_AVAILABLE
-                
-                if claude_api_key:
-                    logger.info(f"✓ Claude API 키 발견 (길이: {len(claude_api_key)}자)")
-                else:
-                    logger.warning("✗ Claude API 키를 찾을 수 없습니다. 별점 기반 분석만 사용합니다.")
-                    logger.warning("💡 Railway Variables에서 CLAUDE_API_KEY를 확인하세요.")
-                
-                if use_claude:
-                    logger.info('Claude API를 사용하여 감정 분석 수행 중...')
-                    logger.info(f'총 {len(reviews)}개 리뷰 분석 예정')
-                    
-                    sentiment_scores = []
-                    total_reviews = len(reviews)
-                    claude_success_count = 0
-                    claude_fail_count = 0
-                    
-                    for idx, row in reviews.iterrows():
-                        # 진행 상황 로깅 (50개마다)
-                        if (idx + 1) % 50 == 0:
-                            logger.info(f'감정 분석 진행 중: {idx+1}/{total_reviews} (Claude 성공: {claude_success_count}, 실패: {claude_fail_count})')
-                        
-                        text = row.get('text', '') or row.get('content', '')
-                        rating = row.get('rating', 3)
-                        rating_score = rating_to_score(rating) if 'rating' in row else 0.0
-                        
-                        if text and len(text.strip()) > 0:
-                            # Claude로 감정 분석 시도
-                            claude_score = analyze_sentiment_with_claude(text)
-                            
-                            if claude_score is not None:
-                                claude_success_count += 1
-                                # 하이브리드 스코어: Claude 70%, 별점 30%
-                                hybrid_score = claude_score * 0.7 + rating_score * 0.3
-                                sentiment_scores.append(hybrid_score)
-                            else:
-                                claude_fail_count += 1
-                                # Claude 실패 시 별점만 사용
-                                sentiment_scores.append(rating_score)
-                        else:
-                            # 텍스트가 없으면 별점만 사용
-                            sentiment_scores.append(rating_score)
-                    
-                    reviews['sentiment_score'] = sentiment_scores
-                    logger.info(f'Claude 기반 감정 분석 완료: 성공 {claude_success_count}개, 실패 {claude_fail_count}개, 별점만 사용 {total_reviews - claude_success_count - claude_fail_count}개')
-                else:
-                    # Claude를 사용할 수 없으면 별점 기반으로만 계산
-                    logger.info('Claude API를 사용할 수 없습니다. 별점 기반 감정 분석만 수행합니다.')
-                    if 'rating' in reviews.columns:
-                        reviews['sentiment_score'] = reviews['rating'].apply(rating_to_score)
-                    else:
-                        return jsonify({
-                            'error': '리뷰 데이터에 sentiment_score 또는 rating 컬럼이 필요합니다.',
-                            'success': False
-                        }), 400
-            
-            # 키워드 그룹별 매칭 및 집계
-            logger.info('키워드 그룹별 매칭 및 집계 중...')
-            kw_df = match_keyword_groups(reviews, keyword_groups)
-            
-            if kw_df.empty:
-                return jsonify({
-                    'error': '키워드 그룹 매칭 결과가 없습니다. 키워드 그룹이나 리뷰 데이터를 확인해주세요.',
-                    'success': False
-                }), 400
-            
-            # 키워드 그룹별 집계
-            logger.info('키워드 그룹별 집계 중...')
-            summary = aggregate_by_keyword_group(kw_df)
-            
-            # 앱 이름 추가
-            summary['app_name'] = app_name
-            
-            # DataFrame을 JSON으로 변환
-            result_data = summary.to_dict('records')
-            
-            logger.info(f'분석 완료: {len(result_data)}개 키워드')
-            
-            return jsonify({
-                'success': True,
-                'data': result_data,
-                'message': '분석이 완료되었습니다.'
-            }), 200
-            
     except FileNotFoundError as e:
         logger.error(f'파일을 찾을 수 없습니다: {e}')
         return jsonify({
@@ -967,6 +1381,173 @@ def analyze_reviews():
         }), 500
 
 
+@app.route('/analyze/jobs', methods=['POST'])
+def create_analysis_job():
+    """
+    비동기 리뷰 분석 작업 생성 엔드포인트
+    
+    요청 형식은 /analyze와 동일하며, 업로드 파일 검증 후 작업 ID를 즉시 반환합니다.
+    분석은 백그라운드 워커에서 실행되며 GET /analyze/jobs/<job_id>로 진행 상황과 결과를 조회합니다.
+    
+    응답 형식 (202):
+    {
+        "success": true,
+        "job_id": "...",
+        "status": "queued",
+        "status_url": "/analyze/jobs/..."
+    }
+    """
+    try:
+        reviews = _read_request_reviews()
+    except AnalysisError as e:
+        logger.error(f'분석 요청 오류: {e}')
+        return jsonify({
+            'error': str(e),
+            'success': False
+        }), e.status_code
+    except Exception as e:
+        logger.error(f'리뷰 데이터 로드 실패: {e}', exc_info=True)
+        return jsonify({
+            'error': f'리뷰 데이터를 읽을 수 없습니다: {str(e)}',
+            'success': False
+        }), 400
+    
+    job = get_job_manager().submit(lambda job: run_review_analysis(reviews, job=job))
+    return jsonify({
+        'success': True,
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': f'/analyze/jobs/{job.id}'
+    }), 202
+
+
+@app.route('/analyze/jobs/<job_id>', methods=['GET'])
+def get_analysis_job(job_id: str):
+    """
+    분석 작업 상태 조회 엔드포인트
+    
+    응답 형식:
+    {
+        "success": true,
+        "job_id": "...",
+        "status": "running",          # queued / running / succeeded / failed / cancelled
+        "stage": "scoring",           # preprocessing / matching / scoring / aggregating
+        "percent": 42.0,
+        "counters": {"total_reviews": 1000, "scored": 420, "claude_success": 415, "claude_fail": 5,
+                     "claude_deadline_skipped": 0},  # 마감 시간 초과로 별점만 사용한 텍스트 수
+        "result": [...]               # succeeded인 경우에만 포함 (/analyze의 data와 동일)
+    }
+    """
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({
+            'error': '작업을 찾을 수 없습니다. 작업 ID를 확인하거나 보관 기간이 지났는지 확인해주세요.',
+            'success': False
+        }), 404
+    
+    return jsonify({'success': True, **job.to_dict()}), 200
+
+
+@app.route('/analyze/jobs/<job_id>', methods=['DELETE'])
+def cancel_analysis_job(job_id: str):
+    """분석 작업 취소 엔드포인트 (실행 중인 작업은 다음 확인 시점에 중단)"""
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        return jsonify({
+            'error': '작업을 찾을 수 없습니다.',
+            'success': False
+        }), 404
+    
+    return jsonify({'success': True, **job.to_dict(include_result=False)}), 200
+
+
+@app.route('/analyze/stream', methods=['POST'])
+def analyze_reviews_stream():
+    """
+    스트리밍 리뷰 분석 엔드포인트 (NDJSON, 한 줄에 JSON 이벤트 하나)
+    
+    요청 형식은 /analyze와 동일하며, 분석은 백그라운드 작업으로 실행됩니다.
+    연결이 끊기면 작업을 취소합니다.
+    
+    이벤트 형식:
+    {"event": "job", "job_id": "..."}
+    {"event": "progress", "stage": "scoring", "percent": 42.0, "counters": {...}}
+    {"event": "partial", "data": [...]}       # 분석이 끝난 리뷰만으로 만든 키워드 그룹별 중간 집계
+    {"event": "heartbeat"}                    # 프록시 타임아웃 방지 (ANALYZE_STREAM_HEARTBEAT초마다)
+    {"event": "result", "success": true, "data": [...], "message": "...", "counters": {...}}   # /analyze 응답 + 작업 카운터
+    {"event": "error", "success": false, "error": "...", "status_code": 400}
+    """
+    try:
+        reviews = _read_request_reviews()
+    except AnalysisError as e:
+        logger.error(f'분석 요청 오류: {e}')
+        return jsonify({
+            'error': str(e),
+            'success': False
+        }), e.status_code
+    except Exception as e:
+        logger.error(f'리뷰 데이터 로드 실패: {e}', exc_info=True)
+        return jsonify({
+            'error': f'리뷰 데이터를 읽을 수 없습니다: {str(e)}',
+            'success': False
+        }), 400
+    
+    manager = get_job_manager()
+    partials = queue.Queue()
+    job = manager.submit(lambda job: run_review_analysis(reviews, job=job, on_partial=partials.put))
+    heartbeat_seconds = float(os.environ.get('ANALYZE_STREAM_HEARTBEAT', 10))
+    
+    def frame(event: str, **payload) -> str:
+        return json.dumps({'event': event, **payload}, ensure_ascii=False, default=str) + '\n'
+    
+    def generate():
+        yield frame('job', job_id=job.id)
+        last_progress = None
+        last_sent = time.monotonic()
+        try:
+            while True:
+                finished = job.finished
+                try:
+                    partial = partials.get(timeout=0 if finished else 1.0)
+                except queue.Empty:
+                    partial = None
+                
+                state = job.to_dict(include_result=False)
+                progress = {key: state[key] for key in ('stage', 'percent', 'counters')}
+                if progress != last_progress and not finished:
+                    last_progress = progress
+                    last_sent = time.monotonic()
+                    yield frame('progress', **progress)
+                if partial is not None:
+                    last_sent = time.monotonic()
+                    yield frame('partial', data=partial)
+                    continue
+                
+                if finished:
+                    if job.status == JOB_SUCCEEDED:
+                        yield frame('result', success=True, data=job.result, message='분석이 완료되었습니다.',
+                                    counters=state['counters'])
+                    elif job.status == JOB_CANCELLED:
+                        yield frame('error', success=False, error='분석 작업이 취소되었습니다.', status_code=409)
+                    else:
+                        yield frame('error', success=False, error=job.error, status_code=job.error_status or 500)
+                    return
+                
+                if time.monotonic() - last_sent >= heartbeat_seconds:
+                    last_sent = time.monotonic()
+                    yield frame('heartbeat')
+        finally:
+            # 클라이언트 연결이 끊기면 분석 작업도 취소
+            if not job.finished:
+                logger.info(f'스트리밍 연결 종료, 분석 작업 취소: {job.id}')
+                manager.cancel(job.id)
+    
+    return Response(generate(), mimetype='application/x-ndjson', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
 # Gunicorn을 사용할 때는 이 블록이 실행되지 않음
 # 하지만 개발 환경이나 직접 실행할 때를 위해 유지
 if __name__ == '__main__':
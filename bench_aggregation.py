@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+키워드 / 키워드 그룹 감정 집계 벤치마크
+- 기존 방식(groupby().agg()의 lambda 3개 + 라벨 apply)과 현재 aggregate_by_keyword / aggregate_by_keyword_group 비교
+- 합성 매칭 결과(10,000행 / 1,000,000행)로 두 방식의 JSON 출력이 바이트 단위로 같은지 확인한 뒤
+  평균 집계 시간과 속도 향상 배율 출력
+
+사용법:
+    python bench_aggregation.py [--rows 10000,1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from analyse import KEYWORD_GROUPS, aggregate_by_keyword, aggregate_by_keyword_group
+
+
+def legacy_aggregate(kw_df: pd.DataFrame, keys) -> pd.DataFrame:
+    """기존 집계 방식 (lambda 기반, 결과 비교 및 시간 측정용)"""
+    summary = kw_df.groupby(keys).agg(
+        total_reviews=("review_id", "nunique"),
+        avg_sentiment=("sentiment_score", "mean"),
+        positive_count=("sentiment_score", lambda s: (s > 0.2).sum()),
+        negative_count=("sentiment_score", lambda s: (s < -0.2).sum()),
+        neutral_count=("sentiment_score", lambda s: ((s >= -0.2) & (s <= 0.2)).sum())
+    ).reset_index()
+    summary["avg_sentiment"] = summary["avg_sentiment"].round(3)
+    summary["sentiment_label"] = summary["avg_sentiment"].apply(
+        lambda x: "positive" if x > 0.2 else ("negative" if x < -0.2 else "neutral")
+    )
+    return summary
+
+
+def synthetic_matches(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    키워드 그룹 × 키워드 매칭 결과 (결측값 일부 포함)
+    
+    스코어는 별점 기반(0.5 단위), 소수 둘째 자리 스코어(평균이 소수 셋째 자리 반올림 경계에 자주 걸림),
+    연속 스코어를 1/3씩 섞음
+    """
+    rng = np.random.default_rng(seed)
+    entries = [(group, keyword) for group, keywords in KEYWORD_GROUPS.items() for keyword in keywords]
+    entry_ids = rng.integers(0, len(entries), rows)
+    scores = np.select(
+        [rng.random(rows) < 1 / 3, rng.random(rows) < 0.5],
+        [rng.integers(-2, 3, rows) / 2, np.round(rng.uniform(-1, 1, rows), 2)],
+        default=rng.uniform(-1, 1, rows)
+    )
+    scores[rng.random(rows) < 0.01] = np.nan
+    return pd.DataFrame({
+        "keyword_group": np.array([group for group, _ in entries], dtype=object)[entry_ids],
+        "keyword": np.array([keyword for _, keyword in entries], dtype=object)[entry_ids],
+        "review_id": rng.integers(0, max(rows // 2, 1), rows),
+        "sentiment_score": scores,
+    })
+
+
+def bench(fn, repeat: int) -> float:
+    """평균 실행 시간 (ms)"""
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 / 키워드 그룹 감정 집계 벤치마크')
+    parser.add_argument('--rows', type=str, default='10000,1000000', help='매칭 결과 행 수 목록 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    args = parser.parse_args()
+
+    cases = {
+        'keyword': (aggregate_by_keyword, ['keyword']),
+        'keyword_group': (aggregate_by_keyword_group, ['keyword_group', 'keyword']),
+    }
+
+    print(f"{'행 수':>10}  {'집계':<14}{'기존(ms)':>12}{'현재(ms)':>12}{'배율':>8}")
+    for rows in (int(value) for value in args.rows.split(',')):
+        kw_df = synthetic_matches(rows)
+        for name, (fn, keys) in cases.items():
+            expected = legacy_aggregate(kw_df, keys).to_json(orient="records", force_ascii=False, indent=2)
+            actual = fn(kw_df).to_json(orient="records", force_ascii=False, indent=2)
+            if actual != expected:
+                print(f"{rows}행 {name}: 기존 방식과 JSON 출력이 다릅니다.")
+                sys.exit(1)
+
+            legacy_ms = bench(lambda: legacy_aggregate(kw_df, keys), args.repeat)
+            current_ms = bench(lambda: fn(kw_df), args.repeat)
+            print(f"{rows:>10}  {name:<14}{legacy_ms:>12.2f}{current_ms:>12.2f}{legacy_ms / current_ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+플레이스토어 HTML 파싱 백엔드 벤치마크
+- fixtures/playstore의 저장된 검색/상세 페이지 HTML로 'bs4'(전체 트리)와 'lxml'(스트리밍) 백엔드 비교
+- 두 백엔드의 추출 결과가 같은지 확인한 뒤 페이지당 평균 파싱 시간과 속도 향상 배율 출력
+
+사용법:
+    python bench_html_parsing.py [--repeat 20] [--fixtures fixtures/playstore]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from playstore_html import HTML_PARSERS, parse_app_detail_fields, parse_search_links
+
+PAGES = {
+    'search.html': parse_search_links,
+    'detail.html': parse_app_detail_fields,
+}
+
+
+def bench(fn, html: str, parser: str, repeat: int) -> float:
+    """페이지당 평균 파싱 시간 (ms)"""
+    fn(html, parser=parser)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(html, parser=parser)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='플레이스토어 HTML 파싱 백엔드 벤치마크')
+    parser.add_argument('--fixtures', type=str,
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'playstore'),
+                        help='검색/상세 페이지 HTML 디렉토리')
+    parser.add_argument('--repeat', type=int, default=20, help='페이지별 반복 횟수')
+    args = parser.parse_args()
+
+    print(f"{'페이지':<14}{'크기(KB)':>10}" + ''.join(f"{name + '(ms)':>12}" for name in HTML_PARSERS) + f"{'배율':>8}")
+    for filename, fn in PAGES.items():
+        html = Path(args.fixtures, filename).read_text(encoding='utf-8')
+
+        results = {name: fn(html, parser=name) for name in HTML_PARSERS}
+        if results['lxml'] != results['bs4']:
+            print(f"{filename}: 백엔드별 추출 결과가 다릅니다.\n  bs4:  {results['bs4']}\n  lxml: {results['lxml']}")
+            sys.exit(1)
+
+        timings = {name: bench(fn, html, name, args.repeat) for name in HTML_PARSERS}
+        print(f"{filename:<14}{len(html.encode('utf-8')) / 1024:>10.0f}"
+              + ''.join(f"{timings[name]:>12.2f}" for name in HTML_PARSERS)
+              + f"{timings['bs4'] / timings['lxml']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+analyse.py 멀티 프로세스 분석 확장성 벤치마크
+- 같은 리뷰 데이터를 워커 수(1/2/4/8/16)별로 샤드 분석하고 처리량(리뷰/초)과 1개 대비 배율 출력
+- 워커별 결과가 1개(직렬) 결과와 같은지 확인
+- HuggingFace 모델을 사용할 수 있으면 텍스트 분석 포함 (부모 프로세스에서 한 번 로드하여 워커가 fork로 공유)
+
+사용법:
+    python bench_workers.py [--rows 200000] [--workers 1,2,4,8,16] [--reviews reviews.csv] [--keywords keywords.csv]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from analyse import aggregate_by_keyword, aggregate_shards, analyze_reviews, load_keywords, load_text_scorer, split_reviews
+
+# 합성 리뷰에 사용할 단어 (keywords.csv 예시 키워드 포함)
+WORDS = ['렉', '버벅임', '로딩', '오래', '걸림', '광고', '결제', '오류', '좋아요', '별로', '최고', '화면', '업데이트']
+
+
+def synthetic_reviews(rows: int, seed: int = 0) -> pd.DataFrame:
+    """키워드가 섞인 합성 리뷰 데이터"""
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'review_id': range(rows),
+        'app_id': 'com.example.app',
+        'text': [' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 15))) for _ in range(rows)],
+        'rating': [rng.randint(1, 5) for _ in range(rows)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='analyse.py 멀티 프로세스 분석 확장성 벤치마크')
+    parser.add_argument('--reviews', type=str, default=None, help='리뷰 CSV 파일 경로 (없으면 합성 데이터 사용)')
+    parser.add_argument('--keywords', type=str,
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keywords.csv'),
+                        help='키워드 CSV 파일 경로')
+    parser.add_argument('--rows', type=int, default=200_000, help='합성 리뷰 수')
+    parser.add_argument('--workers', type=str, default='1,2,4,8,16', help='측정할 워커 수 목록 (쉼표 구분)')
+    args = parser.parse_args()
+
+    reviews = pd.read_csv(args.reviews) if args.reviews else synthetic_reviews(args.rows)
+    keywords = load_keywords(args.keywords)
+    sentiment_pipeline = load_text_scorer()
+
+    print(f"리뷰 {len(reviews)}개, 키워드 {len(keywords)}개, CPU {os.cpu_count()}개, "
+          f"텍스트 분석 {'사용' if sentiment_pipeline is not None else '미사용 (별점 기반)'}")
+
+    started = time.perf_counter()
+    expected = aggregate_by_keyword(analyze_reviews(reviews, keywords, sentiment_pipeline))
+    serial = time.perf_counter() - started
+    expected_json = expected.to_json(orient='records', force_ascii=False)
+
+    print(f"{'워커':>6}{'시간(초)':>12}{'리뷰/초':>12}{'배율':>8}")
+    print(f"{'직렬':>6}{serial:>12.2f}{len(reviews) / serial:>12.0f}{1.0:>7.1f}x")
+    for workers in (int(value) for value in args.workers.split(',')):
+        started = time.perf_counter()
+        aggregate = aggregate_shards(split_reviews(reviews, workers * 4), keywords, sentiment_pipeline,
+                                     workers=workers)
+        elapsed = time.perf_counter() - started
+        if aggregate.result().to_json(orient='records', force_ascii=False) != expected_json:
+            print(f"워커 {workers}개: 직렬 분석과 결과가 다릅니다.")
+            sys.exit(1)
+        print(f"{workers:>6}{elapsed:>12.2f}{len(reviews) / elapsed:>12.0f}{serial / elapsed:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
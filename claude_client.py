@@ -0,0 +1,155 @@
+"""
+Claude API 클라이언트 레지스트리
+- 프로세스 전체에서 하나의 Anthropic 클라이언트(HTTP 커넥션 풀)를 공유
+- 첫 사용 시 지연 생성 (thread-safe)
+- 커넥션 풀 크기, keep-alive, 타임아웃 설정
+- 커넥션 재사용 통계 제공 (요청 수 대비 새 TCP 연결 수)
+
+환경 변수:
+- CLAUDE_API_KEY / ANTHROPIC_API_KEY: Claude API 키
+- CLAUDE_POOL_MAX_CONNECTIONS: 최대 동시 연결 수 (기본값: 20)
+- CLAUDE_POOL_MAX_KEEPALIVE: 유지할 keep-alive 연결 수 (기본값: 10)
+- CLAUDE_POOL_KEEPALIVE_EXPIRY: keep-alive 연결 유지 시간 (초, 기본값: 60)
+- CLAUDE_CONNECT_TIMEOUT: 연결 타임아웃 (초, 기본값: 10)
+- CLAUDE_READ_TIMEOUT: 응답 타임아웃 (초, 기본값: 60)
+"""
+
+from typing import Dict, Optional
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+    from anthropic import Anthropic
+    try:
+        from anthropic import DefaultHttpxClient as _HttpxClient
+    except ImportError:
+        _HttpxClient = httpx.Client
+    CLAUDE_CLIENT_AVAILABLE = True
+except ImportError:
+    CLAUDE_CLIENT_AVAILABLE = False
+    logger.warning("anthropic 패키지가 설치되지 않았습니다. Claude API 기능을 사용할 수 없습니다.")
+
+
+def get_api_key() -> Optional[str]:
+    """Claude API 키 확인 (여러 환경 변수 이름 시도, 없거나 비어있으면 None)"""
+    claude_api_key = (
+        os.environ.get('CLAUDE_API_KEY') or
+        os.environ.get('ANTHROPIC_API_KEY')
+    )
+    if not claude_api_key or not claude_api_key.strip():
+        return None
+    return claude_api_key
+
+
+class ClaudeClientRegistry:
+    """
+    공유 Anthropic 클라이언트 레지스트리
+
+    환경 변수는 클라이언트 생성 시 한 번만 읽으며, reset()으로 다시 읽을 수 있습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._api_key_missing = False
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {'clients_created': 0, 'requests': 0, 'new_connections': 0}
+
+    def _trace(self, event_name: str, info: Dict):
+        """httpcore trace 콜백: 새 TCP 연결 수 집계"""
+        if event_name == 'connection.connect_tcp.complete':
+            with self._stats_lock:
+                self._stats['new_connections'] += 1
+
+    def _on_request(self, request):
+        """httpx 요청 훅: 요청 수 집계 및 trace 콜백 연결"""
+        with self._stats_lock:
+            self._stats['requests'] += 1
+        request.extensions['trace'] = self._trace
+
+    def _create_client(self):
+        api_key = get_api_key()
+        if not api_key:
+            logger.debug("CLAUDE_API_KEY가 설정되지 않았거나 비어있습니다.")
+            self._api_key_missing = True
+            return None
+
+        limits = httpx.Limits(
+            max_connections=int(os.environ.get('CLAUDE_POOL_MAX_CONNECTIONS', 20)),
+            max_keepalive_connections=int(os.environ.get('CLAUDE_POOL_MAX_KEEPALIVE', 10)),
+            keepalive_expiry=float(os.environ.get('CLAUDE_POOL_KEEPALIVE_EXPIRY', 60)),
+        )
+        timeout = httpx.Timeout(
+            float(os.environ.get('CLAUDE_READ_TIMEOUT', 60)),
+            connect=float(os.environ.get('CLAUDE_CONNECT_TIMEOUT', 10)),
+        )
+        http_client = _HttpxClient(
+            limits=limits,
+            timeout=timeout,
+            event_hooks={'request': [self._on_request]},
+        )
+        client = Anthropic(api_key=api_key, http_client=http_client, timeout=timeout)
+        with self._stats_lock:
+            self._stats['clients_created'] += 1
+        logger.info(f"Claude API 클라이언트 생성 (최대 연결: {limits.max_connections}, "
+                    f"keep-alive: {limits.max_keepalive_connections})")
+        return client
+
+    def get(self):
+        """
+        공유 Anthropic 클라이언트 반환 (없으면 생성)
+
+        Returns:
+            Anthropic 클라이언트 또는 None (API 키 없음/패키지 미설치)
+        """
+        if not CLAUDE_CLIENT_AVAILABLE:
+            return None
+        if self._client is not None:
+            return self._client
+        with self._lock:
+            if self._client is None and not self._api_key_missing:
+                self._client = self._create_client()
+            return self._client
+
+    def reset(self):
+        """클라이언트를 닫고 다음 get() 호출 시 환경 변수를 다시 읽어 생성"""
+        with self._lock:
+            client, self._client = self._client, None
+            self._api_key_missing = False
+        if client is not None:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Claude API 클라이언트 종료 중 오류: {e}")
+
+    def stats(self) -> Dict:
+        """커넥션 재사용 통계"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        requests = stats['requests']
+        stats['reused_connections'] = max(requests - stats['new_connections'], 0)
+        stats['reuse_rate'] = round(stats['reused_connections'] / requests, 4) if requests else 0.0
+        stats['initialized'] = self._client is not None
+        return stats
+
+
+_registry = ClaudeClientRegistry()
+
+
+def get_claude_client():
+    """프로세스 공용 Anthropic 클라이언트 (API 키가 없으면 None)"""
+    return _registry.get()
+
+
+def reset_claude_client():
+    """프로세스 공용 Anthropic 클라이언트 초기화 (API 키 변경 시 사용)"""
+    _registry.reset()
+
+
+def claude_client_stats() -> Dict:
+    """프로세스 공용 Anthropic 클라이언트의 커넥션 재사용 통계"""
+    return _registry.stats()
@@ -0,0 +1,406 @@
+"""
+Claude 동시 감정 분석 엔진
+- 설정 가능한 워커 수로 병렬 요청
+- 분당 요청 수(RPM) / 분당 토큰 수(TPM) 토큰 버킷 제한 (프로세스 공용, 동시 분석 요청이 함께 사용)
+- 429/5xx/연결 오류 시 지수 백오프 재시도
+- 요청별 타임아웃 및 분석 실행 전체 마감 시간 (나누어 호출해도 실행당 한 번 계산)
+- 결과는 입력 순서대로 반환
+
+환경 변수:
+- CLAUDE_WORKERS: 동시 요청 수 (기본값: 4)
+- CLAUDE_RPM: 프로세스 전체 분당 최대 요청 수 (기본값: 50)
+- CLAUDE_TPM: 프로세스 전체 분당 최대 토큰 수 (기본값: 40000)
+- CLAUDE_MAX_RETRIES: 재시도 횟수 (기본값: 4)
+- CLAUDE_REQUEST_TIMEOUT: 요청별 타임아웃 (초, 기본값: 30)
+- CLAUDE_SCORING_DEADLINE: 전체 분석 마감 시간 (초, 기본값: 240, 0이면 제한 없음)
+  (동기 /analyze 요청이 gunicorn 요청 타임아웃 안에 끝나도록 하는 값, 백그라운드 작업은 api_server의 ANALYSIS_JOB_DEADLINE)
+- CLAUDE_BATCH_SIZE: 프롬프트당 최대 리뷰 수 (기본값: 20, 1이면 리뷰별 개별 요청)
+- CLAUDE_BATCH_MAX_TOKENS: 프롬프트당 최대 리뷰 토큰 수 추정치 (기본값: 4000)
+
+로컬 테스트 시 ANTHROPIC_BASE_URL을 가짜 서버 주소로 설정하면
+anthropic SDK가 해당 주소로 요청합니다.
+엔진 자체는 가짜 score_fn / batch_score_fn으로 테스트할 수 있습니다 (test_claude_scoring.py 참고).
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import json
+import logging
+import os
+import threading
+import time
+
+from rate_limit import TokenBucket, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# 마감 시각 없음 (score(deadline=NO_DEADLINE)은 deadline_seconds도 적용하지 않음)
+NO_DEADLINE = float('inf')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 근사치 (한국어는 대략 2자당 1토큰 이상이므로 보수적으로 계산)
+    """
+    return max(1, len(text) // 2 + 1)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """anthropic 예외에서 HTTP 상태 코드 추출 (없으면 None)"""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None)
+    return status
+
+
+def is_retryable(error: Exception) -> bool:
+    """재시도할 오류인지 판단 (429/5xx, 연결 오류, 타임아웃)"""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    name = type(error).__name__
+    return 'Connection' in name or 'Timeout' in name
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """retry-after 응답 헤더 값 (초)"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+def pack_batches(texts: Sequence[str], max_items: int, max_tokens: int) -> List[List[int]]:
+    """
+    텍스트를 개수/토큰 예산 기준으로 배치로 묶음 (입력 순서 유지)
+
+    Args:
+        texts: 텍스트 리스트
+        max_items: 배치당 최대 텍스트 수
+        max_tokens: 배치당 최대 토큰 수 추정치 (단일 텍스트가 초과하면 단독 배치)
+
+    Returns:
+        텍스트 위치 리스트의 리스트
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_score_array(response_text: str, expected_ids: Sequence[int]) -> Optional[Dict[int, float]]:
+    """
+    배치 응답의 JSON 스코어 배열 파싱
+
+    응답 형식: [{"id": 0, "score": 0.5}, {"id": 1, "score": -0.3}, ...]
+
+    Returns:
+        {id: 스코어} (기대한 id 중 유효한 스코어가 있는 것만 포함, -1.0 ~ 1.0으로 제한)
+        JSON 배열이 아니면 None
+    """
+    text = response_text.strip()
+    # 코드 블록으로 감싼 응답 허용
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.strip()
+
+    try:
+        items = json.loads(text)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(items, list):
+        return None
+
+    expected = set(expected_ids)
+    scores: Dict[int, float] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_id = item.get('id')
+        score = item.get('score')
+        if isinstance(item_id, bool) or not isinstance(item_id, int) or item_id not in expected:
+            continue
+        if isinstance(score, bool) or not isinstance(score, (int, float)):
+            continue
+        scores[item_id] = max(-1.0, min(1.0, float(score)))
+    return scores
+
+
+class ClaudeScoringEngine:
+    """
+    Claude 동시 감정 분석 엔진
+
+    Args:
+        score_fn: (text, timeout) -> 스코어 또는 None. API 오류 시 예외를 그대로 발생시켜야 재시도됨
+        batch_score_fn: ([(id, text), ...], timeout) -> {id: 스코어} 또는 None (응답 파싱 실패)
+            지정하면 batch_size개씩 묶어 요청하고(리뷰 1개짜리 배치 포함), 파싱 실패/누락 id는 배치를 나누어 재요청
+        batch_size: 배치당 최대 리뷰 수 (1이면 score_fn으로 개별 요청)
+        batch_max_tokens: 배치당 최대 리뷰 토큰 수 추정치
+        workers: 동시 요청 수
+        requests_per_minute: 분당 최대 요청 수
+        tokens_per_minute: 분당 최대 토큰 수 (프롬프트 추정치 + 응답 최대 토큰)
+        max_retries: 재시도 가능한 오류에 대한 최대 재시도 횟수
+        request_timeout: 요청별 타임아웃 (초)
+        deadline_seconds: 전체 분석 마감 시간 (초, None이면 제한 없음, score()에 deadline을 넘기면 무시)
+        output_tokens: 요청당 응답 최대 토큰 수 (TPM 계산용)
+        prompt_overhead_tokens: 텍스트 외 프롬프트 토큰 수 (TPM 계산용)
+        request_bucket / token_bucket: 사용할 RPM / TPM 토큰 버킷
+            (None이면 requests_per_minute / tokens_per_minute로 엔진 전용 버킷 생성)
+    """
+
+    def __init__(self, score_fn: Callable[[str, float], Optional[float]],
+                 batch_score_fn: Optional[Callable[[List[Tuple[int, str]], float], Optional[Dict[int, float]]]] = None,
+                 batch_size: int = 20, batch_max_tokens: int = 4000, workers: int = 4,
+                 requests_per_minute: float = 50, tokens_per_minute: float = 40000,
+                 max_retries: int = 4, request_timeout: float = 30.0,
+                 deadline_seconds: Optional[float] = 240.0, output_tokens: int = 50,
+                 prompt_overhead_tokens: int = 120, base_delay: float = 1.0, max_delay: float = 30.0,
+                 request_bucket: Optional[TokenBucket] = None, token_bucket: Optional[TokenBucket] = None):
+        self.score_fn = score_fn
+        self.batch_score_fn = batch_score_fn
+        self.batch_size = max(1, int(batch_size))
+        self.batch_max_tokens = batch_max_tokens
+        self.workers = max(1, int(workers))
+        self.request_bucket = request_bucket or TokenBucket.per_minute(requests_per_minute)
+        self.token_bucket = token_bucket or TokenBucket.per_minute(tokens_per_minute)
+        self.max_retries = max_retries
+        self.request_timeout = request_timeout
+        self.deadline_seconds = deadline_seconds
+        self.output_tokens = output_tokens
+        self.prompt_overhead_tokens = prompt_overhead_tokens
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._cancel_event: Optional[threading.Event] = None
+
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            'requests': 0, 'succeeded': 0, 'failed': 0, 'retries': 0, 'deadline_skipped': 0,
+            'deadline_skipped_texts': 0, 'batch_requests': 0, 'batch_splits': 0, 'cancelled': 0
+        }
+
+    @classmethod
+    def from_env(cls, score_fn: Callable[[str, float], Optional[float]], **overrides) -> "ClaudeScoringEngine":
+        """
+        환경 변수 설정으로 엔진 생성 (overrides가 우선)
+
+        RPM / TPM 제한은 get_claude_rate_buckets()의 프로세스 공용 버킷을 사용하므로
+        엔진을 호출마다 새로 만들어도 프로세스 전체 요청 속도가 제한됨
+        """
+        deadline = float(os.environ.get('CLAUDE_SCORING_DEADLINE', 240))
+        request_bucket, token_bucket = get_claude_rate_buckets()
+        config = {
+            'workers': int(os.environ.get('CLAUDE_WORKERS', 4)),
+            'request_bucket': request_bucket,
+            'token_bucket': token_bucket,
+            'max_retries': int(os.environ.get('CLAUDE_MAX_RETRIES', 4)),
+            'request_timeout': float(os.environ.get('CLAUDE_REQUEST_TIMEOUT', 30)),
+            'deadline_seconds': deadline if deadline > 0 else None,
+            'batch_size': int(os.environ.get('CLAUDE_BATCH_SIZE', 20)),
+            'batch_max_tokens': int(os.environ.get('CLAUDE_BATCH_MAX_TOKENS', 4000)),
+        }
+        config.update(overrides)
+        return cls(score_fn, **config)
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _skip_for_deadline(self, texts: int):
+        self._count('deadline_skipped')
+        self._count('deadline_skipped_texts', texts)
+
+    def _call_with_retries(self, call: Callable[[float], Any], tokens: int,
+                           deadline: Optional[float], texts: int = 1) -> Tuple[bool, Any]:
+        """
+        속도 제한을 지키며 call(timeout)을 실행하고 재시도 가능한 오류는 백오프 후 재시도
+        (마감 초과로 포기하면 deadline_skipped는 요청 수, deadline_skipped_texts는 texts만큼 증가)
+
+        Returns:
+            (성공 여부, 반환값). 재시도 불가 오류/재시도 소진/마감 초과 시 (False, None)
+        """
+        for attempt in range(self.max_retries + 1):
+            if self._cancel_event is not None and self._cancel_event.is_set():
+                self._count('cancelled')
+                return False, None
+            if not self.request_bucket.acquire(1, deadline) or not self.token_bucket.acquire(tokens, deadline):
+                self._skip_for_deadline(texts)
+                return False, None
+
+            timeout = self.request_timeout
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    self._skip_for_deadline(texts)
+                    return False, None
+
+            self._count('requests')
+            try:
+                return True, call(timeout)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    logger.error(f"Claude 감정 분석 실패: {e}")
+                    return False, None
+
+                delay = _retry_after(e) or backoff_delay(attempt, self.base_delay, self.max_delay)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    self._skip_for_deadline(texts)
+                    return False, None
+                logger.warning(f"Claude 요청 재시도 ({attempt + 1}/{self.max_retries}, {delay:.1f}초 후): {e}")
+                self._count('retries')
+                time.sleep(delay)
+        return False, None
+
+    def _score_one(self, text: str, deadline: Optional[float]) -> Optional[float]:
+        """단일 텍스트 분석 (속도 제한 + 재시도)"""
+        tokens = estimate_tokens(text) + self.prompt_overhead_tokens + self.output_tokens
+        ok, score = self._call_with_retries(lambda timeout: self.score_fn(text, timeout), tokens, deadline)
+        self._count('succeeded' if ok and score is not None else 'failed')
+        return score if ok else None
+
+    def _score_batch(self, items: List[Tuple[int, str]], deadline: Optional[float]) -> Dict[int, Optional[float]]:
+        """
+        배치 분석. 응답 파싱 실패 시 배치를 반으로 나누고, 누락된 id만 다시 요청
+        배치를 사용하면 리뷰 1개짜리 배치도 배치 프롬프트(batch_score_fn)로 분석
+        (프롬프트 버전별 감정 스코어 캐시 키가 섞이지 않도록 개별 프롬프트로 바꾸지 않음)
+        """
+        if self.batch_score_fn is None or self.batch_size <= 1:
+            item_id, text = items[0]
+            return {item_id: self._score_one(text, deadline)}
+
+        tokens = (sum(estimate_tokens(text) for _, text in items)
+                  + self.prompt_overhead_tokens + self.output_tokens * len(items))
+        self._count('batch_requests')
+        ok, parsed = self._call_with_retries(lambda timeout: self.batch_score_fn(items, timeout), tokens, deadline,
+                                             texts=len(items))
+        if not ok:
+            # API 오류(재시도 소진 등)는 배치 전체 실패로 처리
+            self._count('failed', len(items))
+            return {item_id: None for item_id, _ in items}
+
+        results: Dict[int, Optional[float]] = dict(parsed or {})
+        self._count('succeeded', len(results))
+        missing = [(item_id, text) for item_id, text in items if item_id not in results]
+        if missing and len(items) == 1:
+            # 더 나눌 수 없는 배치는 실패로 처리
+            logger.warning(f"Claude 배치 응답에서 리뷰 스코어를 찾을 수 없습니다: id {items[0][0]}")
+            self._count('failed')
+            return {items[0][0]: None}
+        if missing:
+            self._count('batch_splits')
+            if parsed is None:
+                logger.warning(f"Claude 배치 응답 파싱 실패, 배치 분할 후 재요청: {len(items)}개")
+                halves = [missing[:len(missing) // 2], missing[len(missing) // 2:]]
+            else:
+                logger.warning(f"Claude 배치 응답에 누락된 리뷰 재요청: {len(missing)}/{len(items)}개")
+                halves = [missing] if len(missing) < len(items) else [missing[:len(missing) // 2], missing[len(missing) // 2:]]
+            for half in halves:
+                if half:
+                    results.update(self._score_batch(half, deadline))
+        return results
+
+    def score(self, texts: List[str], progress: Optional[Callable[[int, int], None]] = None,
+              cancel_event: Optional[threading.Event] = None,
+              deadline: Optional[float] = None) -> List[Optional[float]]:
+        """
+        텍스트 리스트를 동시에 분석
+
+        Args:
+            texts: 분석할 텍스트 리스트
+            progress: (완료 수, 전체 수)를 받는 진행 상황 콜백
+            cancel_event: 설정되면 대기 중인 배치를 취소하고 새 요청을 보내지 않음
+            deadline: time.monotonic() 기준 마감 시각 (여러 번 나누어 호출하는 분석 실행은
+                scoring_deadline()으로 한 번 계산해 넘김, None이면 지금부터 deadline_seconds,
+                NO_DEADLINE이면 제한 없음)
+
+        Returns:
+            입력 순서대로의 스코어 리스트 (실패/마감 초과 시 None)
+        """
+        scores: List[Optional[float]] = [None] * len(texts)
+        if not texts:
+            return scores
+
+        if deadline is None and self.deadline_seconds:
+            deadline = time.monotonic() + self.deadline_seconds
+        if self.batch_score_fn is not None and self.batch_size > 1:
+            batches = pack_batches(texts, self.batch_size, self.batch_max_tokens)
+        else:
+            batches = [[i] for i in range(len(texts))]
+
+        self._cancel_event = cancel_event
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(batches)),
+                                thread_name_prefix='claude-scoring') as executor:
+            futures = {
+                executor.submit(self._score_batch, [(i, texts[i]) for i in batch], deadline): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                for i, score in future.result().items():
+                    scores[i] = score
+                done += len(futures[future])
+                if progress is not None:
+                    progress(done, len(texts))
+                if cancel_event is not None and cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    logger.info(f"Claude 감정 분석 취소됨: {done}/{len(texts)}개 완료")
+                    break
+
+        logger.info(f"Claude 동시 감정 분석 통계: {self.stats}")
+        return scores
+
+
+def scoring_deadline(seconds: Optional[float] = None) -> float:
+    """
+    지금부터 seconds초 뒤의 분석 마감 시각 (time.monotonic 기준, 0 이하면 NO_DEADLINE)
+
+    분석 실행 시작 시 한 번 계산하여 ClaudeScoringEngine.score(deadline=...)에 넘김
+
+    Args:
+        seconds: 마감 시간 (초, None이면 CLAUDE_SCORING_DEADLINE)
+    """
+    if seconds is None:
+        seconds = float(os.environ.get('CLAUDE_SCORING_DEADLINE', 240))
+    return time.monotonic() + seconds if seconds > 0 else NO_DEADLINE
+
+
+_rate_buckets: Optional[Tuple[TokenBucket, TokenBucket]] = None
+_rate_buckets_lock = threading.Lock()
+
+
+def get_claude_rate_buckets() -> Tuple[TokenBucket, TokenBucket]:
+    """
+    프로세스 공용 Claude (요청 수, 토큰 수) 토큰 버킷 (환경 변수 설정 사용, 지연 생성)
+
+    동시 /analyze 요청, 분석 작업 워커, 스트리밍 분석이 모두 같은 CLAUDE_RPM / CLAUDE_TPM 한도를 나눠 씀
+    """
+    global _rate_buckets
+
+    if _rate_buckets is None:
+        with _rate_buckets_lock:
+            if _rate_buckets is None:
+                _rate_buckets = (
+                    TokenBucket.per_minute(float(os.environ.get('CLAUDE_RPM', 50))),
+                    TokenBucket.per_minute(float(os.environ.get('CLAUDE_TPM', 40000))),
+                )
+    return _rate_buckets
@@ -0,0 +1,125 @@
+"""
+앱 검색 → 리뷰 수집 / 상세 정보 → 소개 요약 파이프라인 (asyncio)
+- 검색 결과에서 앱 ID를 얻는 즉시 앱별로 리뷰 수집과 상세 정보 수집을 동시에 시작
+- 상세 정보를 받은 앱부터 바로 소개 요약 (리뷰 수집과 겹쳐서 실행)
+- 단계별 동시 실행 수 제한 (상세 정보 / 리뷰 수집 / 요약)
+- 전체 소요 시간이 단계별 소요 시간의 합이 아니라 가장 느린 앱 하나의 처리 시간에 가까워짐
+
+환경 변수:
+- PIPELINE_DETAIL_WORKERS: 상세 정보 동시 요청 수 (기본값: PLAYSTORE_DETAIL_WORKERS)
+- PIPELINE_COLLECT_WORKERS: 리뷰를 동시에 수집할 앱 수 (기본값: PLAYSTORE_COLLECT_WORKERS)
+- PIPELINE_SUMMARY_WORKERS: 소개 요약 동시 요청 수 (기본값: 4)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import time
+
+import pandas as pd
+
+from playstore_crawler import COLLECT_WORKERS, DETAIL_WORKERS, get_app_detail, search_app_links
+from refresh_scheduler import RefreshScheduler, collect_reviews_with_cache
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_DETAIL_WORKERS = int(os.environ.get('PIPELINE_DETAIL_WORKERS', DETAIL_WORKERS))
+PIPELINE_COLLECT_WORKERS = int(os.environ.get('PIPELINE_COLLECT_WORKERS', COLLECT_WORKERS))
+PIPELINE_SUMMARY_WORKERS = int(os.environ.get('PIPELINE_SUMMARY_WORKERS', 4))
+
+
+async def _run_pipeline(
+    executor: ThreadPoolExecutor,
+    app_links: List[Tuple[str, str]],
+    max_reviews: int,
+    months: int,
+    summarize: Optional[Callable[[Dict], str]],
+    scheduler: Optional[RefreshScheduler],
+    limits: Dict[str, int]
+) -> Tuple[List[Dict], List[Tuple[pd.DataFrame, List[Dict]]]]:
+    loop = asyncio.get_running_loop()
+    detail_slots = asyncio.Semaphore(limits['detail'])
+    collect_slots = asyncio.Semaphore(limits['collect'])
+    summary_slots = asyncio.Semaphore(limits['summary'])
+
+    async def run(slots: asyncio.Semaphore, fn, *args):
+        async with slots:
+            return await loop.run_in_executor(executor, fn, *args)
+
+    async def describe(app_link: str, app_id: str) -> Dict:
+        # 상세 정보 → 소개 요약 (요약 실패는 앱 정보에 영향 없음)
+        app = await run(detail_slots, get_app_detail, app_link, app_id)
+        if summarize is not None:
+            try:
+                app['ai_summary'] = await run(summary_slots, summarize, app)
+            except Exception as e:
+                logger.warning(f'앱 소개 요약 실패 ({app_id}): {e}')
+        return app
+
+    async def collect(app_id: str) -> Tuple[pd.DataFrame, List[Dict]]:
+        return await run(collect_slots, lambda: collect_reviews_with_cache(
+            scheduler, [app_id], max_reviews_per_app=max_reviews, months=months
+        ))
+
+    describe_tasks = [asyncio.ensure_future(describe(app_link, app_id)) for app_link, app_id in app_links]
+    collect_tasks = [asyncio.ensure_future(collect(app_id)) for _, app_id in app_links]
+    apps = await asyncio.gather(*describe_tasks)
+    collected = await asyncio.gather(*collect_tasks)
+    return list(apps), list(collected)
+
+
+def search_and_collect(
+    keyword: str,
+    max_apps: int = 10,
+    max_reviews: int = 150,
+    months: int = 6,
+    summarize: Optional[Callable[[Dict], str]] = None,
+    scheduler: Optional[RefreshScheduler] = None,
+    detail_workers: int = PIPELINE_DETAIL_WORKERS,
+    collect_workers: int = PIPELINE_COLLECT_WORKERS,
+    summary_workers: int = PIPELINE_SUMMARY_WORKERS
+) -> Tuple[List[Dict], pd.DataFrame, List[Dict]]:
+    """
+    키워드로 앱을 검색하고 앱별 상세 정보, 소개 요약, 리뷰를 파이프라인으로 수집
+
+    Args:
+        keyword: 검색 키워드
+        max_apps: 최대 앱 수
+        max_reviews: 앱당 최대 리뷰 수
+        months: 수집할 기간 (개월)
+        summarize: 앱 정보를 받아 ai_summary를 반환하는 함수 (None이면 요약하지 않음)
+        scheduler: 리뷰 갱신 스케줄러 (최근에 갱신된 앱은 리뷰 저장소에서 응답, refresh_scheduler.py 참고)
+        detail_workers / collect_workers / summary_workers: 단계별 동시 실행 수
+
+    Returns:
+        (검색 순위대로의 앱 정보 리스트,
+         모든 앱의 리뷰를 합친 데이터프레임 (app_id 컬럼 포함, 검색 순위 순서),
+         앱별 수집 결과 리스트 (collect_multiple_app_reviews와 같은 형식))
+    """
+    started = time.monotonic()
+    try:
+        app_links = search_app_links(keyword, max_results=max_apps)
+    except Exception as e:
+        logger.error(f'앱 검색 오류: {e}', exc_info=True)
+        app_links = []
+    if not app_links:
+        return [], pd.DataFrame(), []
+
+    limits = {
+        'detail': max(1, detail_workers),
+        'collect': max(1, collect_workers),
+        'summary': max(1, summary_workers),
+    }
+    with ThreadPoolExecutor(max_workers=sum(limits.values()), thread_name_prefix='collect-pipeline') as executor:
+        apps, collected = asyncio.run(_run_pipeline(
+            executor, app_links, max_reviews, months, summarize, scheduler, limits
+        ))
+
+    frames = [df for df, _ in collected if not df.empty]
+    reviews_df = pd.concat(frames, axis=0, ignore_index=True) if frames else pd.DataFrame()
+    report = [item for _, app_report in collected for item in app_report]
+    logger.info(f'검색 및 수집 파이프라인 완료: 앱 {len(apps)}개, 리뷰 {len(reviews_df)}개 '
+                f'({time.monotonic() - started:.2f}초)')
+    return apps, reviews_df, report
@@ -0,0 +1,168 @@
+"""
+리뷰 크롤링 상태 저장 모듈
+- (app_id, lang, country)별 마지막으로 본 최신 리뷰(reviewId, 작성 시각) 워터마크 저장
+- SQLite 파일 저장 (열 수 없으면 메모리 전용), thread-safe
+
+환경 변수:
+- CRAWL_STATE_ENABLED: 크롤링 상태 저장 사용 여부 (기본값: true)
+- CRAWL_STATE_PATH: 상태 파일 경로 (기본값: .cache/crawl_state.sqlite3)
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = ".cache/crawl_state.sqlite3"
+
+StateKey = Tuple[str, str, str]
+
+
+class CrawlStateStore:
+    """
+    앱별 리뷰 크롤링 상태 저장소
+
+    상태 항목:
+        newest_review_id: 지금까지 수집한 가장 최신 리뷰 ID
+        newest_at: 그 리뷰의 작성 시각 (datetime)
+        updated_at: 상태 갱신 시각 (epoch 초)
+
+    Args:
+        path: SQLite 파일 경로 (None이면 메모리 전용)
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_STATE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._memory: Dict[StateKey, Dict] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_state (
+                        app_id TEXT NOT NULL,
+                        lang TEXT NOT NULL,
+                        country TEXT NOT NULL,
+                        newest_review_id TEXT,
+                        newest_at TEXT,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (app_id, lang, country)
+                    )
+                """)
+                self._conn.commit()
+                logger.info(f"크롤링 상태 파일 로드: {path}")
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"크롤링 상태 파일을 열 수 없습니다 ({path}): {e}. 메모리에만 저장합니다.")
+                self._conn = None
+
+    def get(self, app_id: str, lang: str, country: str) -> Optional[Dict]:
+        """크롤링 상태 조회 (없으면 None)"""
+        key = (app_id, lang, country)
+        with self._lock:
+            if key in self._memory:
+                return dict(self._memory[key])
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT newest_review_id, newest_at, updated_at "
+                "FROM crawl_state WHERE app_id = ? AND lang = ? AND country = ?",
+                key
+            ).fetchone()
+            if row is None:
+                return None
+            state = {
+                'newest_review_id': row[0],
+                'newest_at': datetime.fromisoformat(row[1]) if row[1] else None,
+                'updated_at': row[2],
+            }
+            self._memory[key] = state
+            return dict(state)
+
+    def set(self, app_id: str, lang: str, country: str, newest_review_id: Optional[str],
+            newest_at: Optional[datetime]):
+        """크롤링 상태 저장 (기존 상태를 덮어씀)"""
+        key = (app_id, lang, country)
+        state = {
+            'newest_review_id': newest_review_id,
+            'newest_at': newest_at,
+            'updated_at': time.time(),
+        }
+        with self._lock:
+            self._memory[key] = state
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO crawl_state "
+                    "(app_id, lang, country, newest_review_id, newest_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    key + (
+                        newest_review_id,
+                        newest_at.isoformat() if newest_at is not None else None,
+                        state['updated_at']
+                    )
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"크롤링 상태 저장 실패 ({app_id}): {e}")
+
+    def reset(self, app_id: Optional[str] = None):
+        """크롤링 상태 삭제 (app_id가 None이면 전체 삭제, 다음 수집은 전체 수집)"""
+        with self._lock:
+            if app_id is None:
+                self._memory.clear()
+            else:
+                for key in [key for key in self._memory if key[0] == app_id]:
+                    del self._memory[key]
+            if self._conn is None:
+                return
+            if app_id is None:
+                self._conn.execute("DELETE FROM crawl_state")
+            else:
+                self._conn.execute("DELETE FROM crawl_state WHERE app_id = ?", (app_id,))
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """저장된 앱 상태 수"""
+        with self._lock:
+            count = len(self._memory)
+            if self._conn is not None:
+                count = self._conn.execute("SELECT COUNT(*) FROM crawl_state").fetchone()[0]
+            return {
+                'enabled': True,
+                'path': self.path if self._conn is not None else None,
+                'apps': count,
+            }
+
+
+_default_store: Optional[CrawlStateStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_crawl_state_store() -> Optional[CrawlStateStore]:
+    """
+    프로세스 공용 크롤링 상태 저장소 (환경 변수 설정 사용, 지연 생성)
+
+    Returns:
+        CrawlStateStore 또는 None (CRAWL_STATE_ENABLED=false인 경우)
+    """
+    global _default_store
+
+    if os.environ.get("CRAWL_STATE_ENABLED", "true").lower() != "true":
+        return None
+
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = CrawlStateStore(path=os.environ.get("CRAWL_STATE_PATH", DEFAULT_STATE_PATH))
+    return _default_store
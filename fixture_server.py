@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+플레이스토어 페이지 로컬 테스트 서버
+- fixtures/playstore의 저장된 HTML을 플레이스토어와 같은 경로로 제공
+  (/store/search → search.html, /store/apps/details → detail.html)
+- ETag / Last-Modified 응답 헤더, If-None-Match / If-Modified-Since 조건부 요청에 304 응답
+- 페이지별 응답 지연, 강제 오류 상태 코드 설정 가능 (HTTP 캐시 / 파이프라인 테스트용)
+
+사용법:
+    python fixture_server.py [--port 8766] [--delay 0.3]
+    PLAYSTORE_BASE_URL=http://127.0.0.1:8766 python api_server.py
+"""
+
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+import argparse
+import hashlib
+import os
+import threading
+import time
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'playstore')
+
+# 요청 경로 → 픽스처 파일
+ROUTES = {
+    '/store/search': 'search.html',
+    '/store/apps/details': 'detail.html',
+}
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    픽스처 HTML 서버
+
+    Args:
+        port: 포트 (0이면 임의의 빈 포트)
+        fixtures_dir: 픽스처 디렉터리
+        delay: 페이지 응답 지연 (초)
+
+    속성:
+        fail_status: 설정하면 모든 요청에 해당 상태 코드로 응답
+        send_etag / send_last_modified: 검증 헤더 전송 여부
+        requests: (경로, 응답 상태 코드) 요청 기록
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, fixtures_dir: str = FIXTURES_DIR, delay: float = 0.0):
+        super().__init__(('127.0.0.1', port), FixtureHandler)
+        self.fixtures_dir = fixtures_dir
+        self.delay = delay
+        self.fail_status: Optional[int] = None
+        self.send_etag = True
+        self.send_last_modified = True
+        self.requests: List[tuple] = []
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(self, path: str, status: int):
+        with self._lock:
+            self.requests.append((path, status))
+
+    def status_counts(self) -> Dict[int, int]:
+        """응답 상태 코드별 요청 수"""
+        with self._lock:
+            counts: Dict[int, int] = {}
+            for _, status in self.requests:
+                counts[status] = counts.get(status, 0) + 1
+            return counts
+
+    def start(self) -> 'FixtureServer':
+        """백그라운드 스레드에서 서버 실행"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server: FixtureServer = self.server
+        path = urlparse(self.path).path
+
+        if server.fail_status is not None:
+            self._send(server.fail_status, b'fixture server error', {})
+            return
+
+        filename = ROUTES.get(path)
+        fixture = Path(server.fixtures_dir, filename) if filename else None
+        if fixture is None or not fixture.is_file():
+            self._send(404, b'not found', {})
+            return
+
+        body = fixture.read_bytes()
+        mtime = int(fixture.stat().st_mtime)
+        headers = {'Content-Type': 'text/html; charset=utf-8'}
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if server.send_etag:
+            headers['ETag'] = etag
+        if server.send_last_modified:
+            headers['Last-Modified'] = formatdate(mtime, usegmt=True)
+
+        if self._not_modified(etag if server.send_etag else None,
+                              mtime if server.send_last_modified else None):
+            self._send(304, b'', headers)
+            return
+
+        if server.delay:
+            time.sleep(server.delay)
+        self._send(200, body, headers)
+
+    def _not_modified(self, etag: Optional[str], mtime: Optional[int]) -> bool:
+        """If-None-Match가 있으면 ETag로, 없으면 If-Modified-Since로 판단"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag is not None and etag in [tag.strip() for tag in if_none_match.split(',')]
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is not None and mtime is not None:
+            try:
+                return mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send(self, status: int, body: bytes, headers: Dict[str, str]):
+        self.server.record(self.path, status)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='플레이스토어 페이지 로컬 테스트 서버')
+    parser.add_argument('--port', type=int, default=8766, help='포트')
+    parser.add_argument('--delay', type=float, default=0.0, help='페이지 응답 지연 (초)')
+    parser.add_argument('--fixtures', type=str, default=FIXTURES_DIR, help='픽스처 디렉터리')
+    args = parser.parse_args()
+
+    server = FixtureServer(args.port, args.fixtures, args.delay)
+    print(f"픽스처 서버 실행: {server.base_url} (PLAYSTORE_BASE_URL로 지정)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+"""
+호스트별 요청 속도 제한 모듈 (플레이스토어 크롤링용)
+- 호스트마다 프로세스 공용 토큰 버킷 (requests / google_play_scraper 요청 공통)
+- 429 / 503 응답 시 지터가 포함된 지수 백오프 후 재시도 (같은 호스트의 다른 요청도 함께 대기)
+- 연속 실패 시 서킷 브레이커로 일정 시간 요청 차단 (즉시 CircuitOpenError)
+- 대기 중인 요청 수(queue depth) 등 통계 제공
+- thread-safe
+
+환경 변수:
+- PLAYSTORE_RATE_LIMIT: 호스트별 초당 요청 수 (기본값: 5)
+- PLAYSTORE_RATE_BURST: 호스트별 순간 최대 요청 수 (기본값: 10)
+- PLAYSTORE_MAX_RETRIES: 429 / 503 / 연결 오류 시 최대 재시도 횟수 (기본값: 3)
+- PLAYSTORE_BACKOFF_BASE / PLAYSTORE_BACKOFF_MAX: 백오프 기준 / 최대 대기 시간 (초, 기본값: 1 / 30)
+- PLAYSTORE_BREAKER_THRESHOLD: 서킷 브레이커가 열리는 연속 실패 횟수 (기본값: 5)
+- PLAYSTORE_BREAKER_COOLDOWN: 서킷 브레이커가 열린 뒤 다시 시도하기까지의 시간 (초, 기본값: 60)
+"""
+
+from typing import Any, Callable, Dict, Optional
+import logging
+import os
+import re
+import threading
+import time
+
+from rate_limit import TokenBucket, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUSES = frozenset({429, 503})
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_STATUS_IN_MESSAGE = re.compile(r"Status code (\d{3})")
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 요청을 보내지 않음"""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"{host} 요청이 차단되었습니다 (서킷 브레이커, {retry_after:.0f}초 후 재시도)")
+        self.host = host
+        self.retry_after = retry_after
+
+
+def throttle_status(value: Any) -> Optional[int]:
+    """
+    응답 또는 예외가 재시도 대상(429 / 503)이면 상태 코드 반환
+
+    - requests 응답: status_code
+    - requests 예외: response.status_code
+    - google_play_scraper 예외: 메시지의 상태 코드, PlayGatewayError(요청 한도 초과)는 429로 간주
+    """
+    status = getattr(value, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(value, 'response', None), 'status_code', None)
+    if status is None:
+        status = getattr(value, 'code', None)
+    if status is None and isinstance(value, Exception):
+        message = str(value)
+        if "PlayGatewayError" in message:
+            return 429
+        match = _STATUS_IN_MESSAGE.search(message)
+        if match:
+            status = int(match.group(1))
+    return status if isinstance(status, int) and status in RETRY_STATUSES else None
+
+
+class HostLimiter:
+    """
+    한 호스트의 요청 속도 제한기 (토큰 버킷 + 백오프 재시도 + 서킷 브레이커)
+
+    Args:
+        host: 호스트 이름 (로그 및 통계용)
+        rate: 초당 요청 수
+        burst: 순간 최대 요청 수
+        max_retries: 재시도 대상 응답/연결 오류 시 최대 재시도 횟수
+        base_delay / max_delay: 백오프 기준 / 최대 대기 시간 (초)
+        failure_threshold: 서킷 브레이커가 열리는 연속 실패 횟수
+        cooldown: 서킷 브레이커가 열린 뒤 시험 요청을 허용하기까지의 시간 (초)
+    """
+
+    def __init__(self, host: str, rate: float = 5.0, burst: float = 10.0, max_retries: int = 3,
+                 base_delay: float = 1.0, max_delay: float = 30.0,
+                 failure_threshold: int = 5, cooldown: float = 60.0):
+        self.host = host
+        self.bucket = TokenBucket(rate=rate, capacity=burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._consecutive_failures = 0
+        self._blocked_until = 0.0
+        self._backing_off = 0
+        self._in_flight = 0
+
+        self.stats_counters = {
+            'requests': 0,
+            'throttled': 0,
+            'retries': 0,
+            'failures': 0,
+            'rejected': 0,
+            'circuit_opens': 0,
+        }
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.stats_counters[name] += amount
+
+    def _before_request(self):
+        """서킷 브레이커 확인 (열려 있으면 CircuitOpenError)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == CIRCUIT_OPEN:
+                retry_after = self._opened_at + self.cooldown - now
+                if retry_after > 0:
+                    self.stats_counters['rejected'] += 1
+                    raise CircuitOpenError(self.host, retry_after)
+                self._state = CIRCUIT_HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN:
+                if self._trial_in_flight:
+                    self.stats_counters['rejected'] += 1
+                    raise CircuitOpenError(self.host, self.cooldown)
+                self._trial_in_flight = True
+
+    def _record_success(self):
+        with self._lock:
+            if self._state != CIRCUIT_CLOSED:
+                logger.info(f"{self.host} 서킷 브레이커 닫힘")
+            self._state = CIRCUIT_CLOSED
+            self._trial_in_flight = False
+            self._consecutive_failures = 0
+
+    def _record_failure(self):
+        with self._lock:
+            self.stats_counters['failures'] += 1
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN or (
+                    self._state == CIRCUIT_CLOSED and self._consecutive_failures >= self.failure_threshold):
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+                self.stats_counters['circuit_opens'] += 1
+                logger.warning(f"{self.host} 서킷 브레이커 열림 (연속 실패 {self._consecutive_failures}회, "
+                               f"{self.cooldown:.0f}초 동안 요청 차단)")
+
+    def _wait_for_backoff(self):
+        """다른 요청이 429 / 503을 받아 백오프 중이면 함께 대기"""
+        with self._lock:
+            delay = self._blocked_until - time.monotonic()
+            if delay <= 0:
+                return
+            self._backing_off += 1
+        try:
+            time.sleep(delay)
+        finally:
+            with self._lock:
+                self._backing_off -= 1
+
+    def _back_off(self, attempt: int, reason: str):
+        delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+        with self._lock:
+            self.stats_counters['retries'] += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        logger.warning(f"{self.host} {reason}, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+        self._wait_for_backoff()
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        속도 제한을 적용해 fn(*args, **kwargs) 호출
+
+        - 호출 전 토큰 획득 (토큰이 없으면 대기)
+        - 결과 응답이나 예외가 429 / 503이거나 연결 오류(OSError)이면 백오프 후 재시도
+        - 재시도를 모두 소진하면 마지막 응답을 반환하거나 마지막 예외를 다시 발생
+
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+        """
+        attempt = 0
+        while True:
+            self._before_request()
+            self._wait_for_backoff()
+            self.bucket.acquire()
+            with self._lock:
+                self.stats_counters['requests'] += 1
+                self._in_flight += 1
+            error: Optional[Exception] = None
+            result = None
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                error = e
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+            status = throttle_status(error if error is not None else result)
+            if status is None and (error is None or not isinstance(error, OSError)):
+                # 성공 또는 404 등 서버가 정상 응답한 오류는 실패로 집계하지 않음
+                self._record_success()
+                if error is not None:
+                    raise error
+                return result
+
+            if status is not None:
+                self._count('throttled')
+            self._record_failure()
+            if attempt >= self.max_retries or self._state == CIRCUIT_OPEN:
+                if error is not None:
+                    raise error
+                return result
+            self._back_off(attempt, f"응답 {status}" if status else f"요청 실패 ({type(error).__name__})")
+            attempt += 1
+
+    @property
+    def queue_depth(self) -> int:
+        """토큰 또는 백오프를 기다리는 요청 수"""
+        return self.bucket.waiting + self._backing_off
+
+    def stats(self) -> Dict:
+        """호스트별 요청 통계"""
+        with self._lock:
+            stats = dict(self.stats_counters)
+            stats.update({
+                'state': self._state,
+                'in_flight': self._in_flight,
+                'consecutive_failures': self._consecutive_failures,
+                'backoff_remaining': round(max(0.0, self._blocked_until - time.monotonic()), 2),
+            })
+        stats.update({
+            'rate': self.bucket.rate,
+            'burst': self.bucket.capacity,
+            'queue_depth': self.queue_depth,
+            'available_tokens': round(self.bucket.available, 2),
+        })
+        return stats
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> HostLimiter:
+    """
+    호스트별 프로세스 공용 속도 제한기 (환경 변수 설정 사용, 지연 생성)
+    """
+    limiter = _limiters.get(host)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(host)
+            if limiter is None:
+                limiter = HostLimiter(
+                    host,
+                    rate=float(os.environ.get("PLAYSTORE_RATE_LIMIT", 5)),
+                    burst=float(os.environ.get("PLAYSTORE_RATE_BURST", 10)),
+                    max_retries=int(os.environ.get("PLAYSTORE_MAX_RETRIES", 3)),
+                    base_delay=float(os.environ.get("PLAYSTORE_BACKOFF_BASE", 1.0)),
+                    max_delay=float(os.environ.get("PLAYSTORE_BACKOFF_MAX", 30.0)),
+                    failure_threshold=int(os.environ.get("PLAYSTORE_BREAKER_THRESHOLD", 5)),
+                    cooldown=float(os.environ.get("PLAYSTORE_BREAKER_COOLDOWN", 60)),
+                )
+                _limiters[host] = limiter
+    return limiter
+
+
+def host_limiter_stats() -> Dict[str, Dict]:
+    """생성된 모든 호스트 속도 제한기의 통계"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.host: limiter.stats() for limiter in limiters}
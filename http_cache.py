@@ -0,0 +1,264 @@
+"""
+HTTP 응답 캐시 모듈 (플레이스토어 페이지 크롤링용)
+- URL 기준으로 응답 본문을 SQLite 파일에 저장
+- 리소스 종류별 유효 기간(TTL) (검색 결과 / 앱 상세 페이지)
+- 유효 기간이 지나면 ETag / Last-Modified로 조건부 요청 (304 응답이면 저장된 본문 재사용)
+- 재검증 요청이 실패하면 (연결 오류, 429, 5xx) 유효 기간이 지난 저장 본문 반환 (stale-if-error)
+- 항목 수 / 전체 크기 기준 LRU 제거, 적중률 통계 제공
+- thread-safe
+
+환경 변수:
+- HTTP_CACHE_ENABLED: 캐시 사용 여부 (기본값: true)
+- HTTP_CACHE_PATH: 캐시 파일 경로 (기본값: .cache/http_cache.sqlite3)
+- HTTP_CACHE_MAX_ENTRIES: 최대 항목 수 (기본값: 5000)
+- HTTP_CACHE_MAX_MB: 최대 전체 크기 (MB, 기본값: 200)
+- HTTP_CACHE_TTL_SEARCH: 검색 결과 페이지 유효 기간 (초, 기본값: 1800)
+- HTTP_CACHE_TTL_DETAIL: 앱 상세 페이지 유효 기간 (초, 기본값: 21600)
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = ".cache/http_cache.sqlite3"
+
+# 리소스 종류별 기본 유효 기간 (초)
+DEFAULT_TTLS = {
+    'search': 30 * 60,
+    'detail': 6 * 3600,
+}
+DEFAULT_TTL = 30 * 60
+
+
+class HttpCache:
+    """
+    HTTP 응답 캐시 (SQLite)
+
+    Args:
+        path: SQLite 파일 경로 (":memory:"이면 메모리 전용)
+        ttls: 리소스 종류별 유효 기간 (초)
+        max_entries: 최대 항목 수
+        max_bytes: 최대 전체 본문 크기 (바이트)
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttls: Optional[Dict[str, float]] = None,
+                 max_entries: int = 5000, max_bytes: int = 200 * 1024 * 1024):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale = 0
+        self.writes = 0
+        self.evictions = 0
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                resource TEXT NOT NULL,
+                body TEXT NOT NULL,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache (accessed_at)")
+        self._conn.commit()
+        logger.info(f"HTTP 캐시 로드: {path}")
+
+    def ttl(self, resource: str) -> float:
+        """리소스 종류의 유효 기간 (초)"""
+        return self.ttls.get(resource, DEFAULT_TTL)
+
+    def _lookup(self, url: str) -> Optional[Tuple[str, Optional[str], Optional[str], float]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+    def _touch(self, url: str, refreshed: bool):
+        now = time.time()
+        with self._lock:
+            if refreshed:
+                self._conn.execute("UPDATE http_cache SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                                   (now, now, url))
+            else:
+                self._conn.execute("UPDATE http_cache SET accessed_at = ? WHERE url = ?", (now, url))
+            self._conn.commit()
+
+    def _store(self, url: str, resource: str, response):
+        body = response.text
+        size = len(body.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, resource, body, encoding, etag, last_modified, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, resource, body, response.encoding, response.headers.get('ETag'),
+                 response.headers.get('Last-Modified'), size, now, now)
+            )
+            self.writes += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """최대 항목 수 / 최대 크기를 넘으면 오래 사용되지 않은 항목부터 제거 (락 보유 상태에서 호출)"""
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        removed = 0
+        for url, size in self._conn.execute(
+                "SELECT url, size FROM http_cache ORDER BY accessed_at").fetchall():
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM http_cache WHERE url = ?", (url,))
+            count -= 1
+            total -= size
+            removed += 1
+        self.evictions += removed
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _serve_stale(self, url: str, body: str, error) -> str:
+        """재검증 실패 시 유효 기간이 지난 저장 본문 반환"""
+        logger.warning(f"재검증 실패, 저장된 응답 사용 ({url}): {error}")
+        self._count('stale')
+        self._touch(url, refreshed=False)
+        return body
+
+    def fetch(self, get: Callable, url: str, resource: str = 'page',
+              timeout: Union[float, Tuple[float, float], None] = None) -> str:
+        """
+        캐시를 거쳐 페이지 HTML 반환
+
+        - 유효 기간 내 항목: 요청 없이 저장된 본문 반환
+        - 유효 기간이 지난 항목: ETag / Last-Modified가 있으면 조건부 요청, 304면 저장된 본문 재사용
+        - 유효 기간이 지난 항목의 요청이 실패하면 (요청 예외, 429, 5xx) 저장된 본문 반환
+          (유효 기간은 갱신하지 않으므로 다음 호출에서 다시 요청)
+        - 그 외: 일반 요청 후 200 응답 저장
+
+        Args:
+            get: 요청 함수 (requests.Session.get과 같은 인터페이스)
+            url: 요청 URL
+            resource: 리소스 종류 ('search', 'detail' 등, 유효 기간 결정)
+            timeout: 요청 타임아웃
+
+        Raises:
+            requests.HTTPError 등 요청 오류 (캐시에 저장된 본문이 없거나, 404 등 5xx가 아닌 오류 응답)
+        """
+        cached = self._lookup(url)
+        headers = {}
+        if cached is not None:
+            body, etag, last_modified, fetched_at = cached
+            if time.time() - fetched_at < self.ttl(resource):
+                self._count('hits')
+                self._touch(url, refreshed=False)
+                return body
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        try:
+            response = get(url, timeout=timeout, headers=headers or None)
+        except Exception as e:
+            if cached is None:
+                raise
+            return self._serve_stale(url, cached[0], e)
+
+        if cached is not None and response.status_code == 304:
+            self._count('revalidated')
+            self._touch(url, refreshed=True)
+            return cached[0]
+        if cached is not None and (response.status_code == 429 or response.status_code >= 500):
+            return self._serve_stale(url, cached[0], f"HTTP {response.status_code}")
+
+        self._count('misses')
+        response.raise_for_status()
+        self._store(url, resource, response)
+        return response.text
+
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """적중률 통계 (revalidated: 304 응답으로 재사용한 횟수, stale: 재검증 실패로 재사용한 횟수)"""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache").fetchone()
+            served = self.hits + self.revalidated + self.stale
+            lookups = served + self.misses
+            return {
+                'enabled': True,
+                'path': self.path,
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'stale': self.stale,
+                'misses': self.misses,
+                'hit_rate': round(served / lookups, 4) if lookups else 0.0,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'entries': count,
+                'bytes': total,
+            }
+
+
+_default_cache: Optional[HttpCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    프로세스 공용 HTTP 캐시 (환경 변수 설정 사용, 지연 생성)
+
+    Returns:
+        HttpCache 또는 None (HTTP_CACHE_ENABLED=false이거나 파일을 열 수 없는 경우)
+    """
+    global _default_cache
+
+    if os.environ.get("HTTP_CACHE_ENABLED", "true").lower() != "true":
+        return None
+
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                path = os.environ.get("HTTP_CACHE_PATH", DEFAULT_CACHE_PATH)
+                try:
+                    _default_cache = HttpCache(
+                        path=path,
+                        ttls={
+                            'search': float(os.environ.get("HTTP_CACHE_TTL_SEARCH", DEFAULT_TTLS['search'])),
+                            'detail': float(os.environ.get("HTTP_CACHE_TTL_DETAIL", DEFAULT_TTLS['detail'])),
+                        },
+                        max_entries=int(os.environ.get("HTTP_CACHE_MAX_ENTRIES", 5000)),
+                        max_bytes=int(float(os.environ.get("HTTP_CACHE_MAX_MB", 200)) * 1024 * 1024),
+                    )
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"HTTP 캐시를 열 수 없습니다 ({path}): {e}")
+                    return None
+    return _default_cache
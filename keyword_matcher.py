@@ -0,0 +1,174 @@
+"""
+다중 키워드 매칭 모듈 (Aho-Corasick)
+- 키워드 목록으로 오토마톤을 한 번만 구성
+- 리뷰 텍스트를 한 번만 스캔하여 모든 (키워드, 그룹, 위치) 매칭 반환
+- 동일한 키워드 목록에 대한 오토마톤은 프로세스 내에서 캐시
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+import re
+
+try:
+    # re.IGNORECASE가 단순 소문자 변환 외에 같은 문자로 보는 소문자 묶음 (ſ/s, ı/i, ς/σ 등)
+    from re._casefix import _EXTRA_CASES
+except ImportError:  # Python 3.10 이하
+    from sre_compile import _ignorecase_fixes as _EXTRA_CASES
+
+logger = logging.getLogger(__name__)
+
+# 추가 동치 묶음의 문자를 묶음에서 가장 작은 문자로 변환 (ASCII 문자는 그대로)
+_EXTRA_CASE_TABLE = {
+    lower: min((lower,) + tuple(others)) for lower, others in _EXTRA_CASES.items()
+    if min((lower,) + tuple(others)) != lower
+}
+_EXTRA_CASE_RE = re.compile('[' + ''.join(map(chr, _EXTRA_CASE_TABLE)) + ']')
+
+
+def _fold_case(text: str) -> str:
+    """
+    대소문자 무시 비교를 위한 문자 단위 변환 (re.IGNORECASE와 같은 동치 관계)
+    - 문자마다 단순 소문자로 바꾸고, re가 추가로 같은 문자로 보는 묶음(ſ/s, ı/i, ς/σ, K/k 등)은 대표 문자 하나로 통일
+    - 문자 단위 매핑을 유지하여 매칭 위치(offset)가 원문과 일치하도록 함
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # 'İ'처럼 소문자가 두 글자가 되는 문자는 re와 같이 단순 소문자(첫 글자)만 사용
+        lowered = ''.join(ch.lower()[0] for ch in text)
+    if not lowered.isascii() and _EXTRA_CASE_RE.search(lowered):
+        lowered = lowered.translate(_EXTRA_CASE_TABLE)
+    return lowered
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 오토마톤 기반 다중 키워드 매처
+
+    기존 `str.contains(re.escape(kw), case=False)` 부분 문자열 매칭과
+    동일한 매칭 결과를 리뷰당 한 번의 스캔으로 계산합니다.
+
+    Args:
+        entries: (keyword, keyword_group) 튜플 시퀀스. keyword_group은 None 가능.
+            같은 키워드가 여러 번 등장하면 각 항목이 별도로 매칭됩니다.
+    """
+
+    def __init__(self, entries: Sequence[Tuple[str, Optional[str]]]):
+        self.entries: List[Tuple[str, Optional[str]]] = [
+            (str(keyword), group) for keyword, group in entries
+        ]
+
+        # 상태 0은 루트
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 각 상태에서 끝나는 (패턴 길이, entry_id 목록)
+        self._output: List[List[Tuple[int, Tuple[int, ...]]]] = [[]]
+
+        patterns: Dict[str, List[int]] = {}
+        for entry_id, (keyword, _) in enumerate(self.entries):
+            if not keyword:
+                continue
+            patterns.setdefault(_fold_case(keyword), []).append(entry_id)
+
+        for pattern, entry_ids in patterns.items():
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][ch] = next_state
+                state = next_state
+            self._output[state].append((len(pattern), tuple(entry_ids)))
+
+        self._build_failure_links()
+        logger.debug(f"키워드 오토마톤 생성 완료: 키워드 {len(self.entries)}개, 상태 {len(self._goto)}개")
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크를 계산하고 출력 목록을 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int]]:
+        """
+        텍스트 내 모든 매칭을 (entry_id, 시작 위치) 형태로 반환
+
+        Args:
+            text: 검색할 텍스트
+
+        Returns:
+            (entry_id, offset) 이터레이터 (중복 등장 시 모든 위치 포함)
+        """
+        if not isinstance(text, str) or not text:
+            return
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for pos, ch in enumerate(_fold_case(text)):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for length, entry_ids in output[state]:
+                    start = pos - length + 1
+                    for entry_id in entry_ids:
+                        yield entry_id, start
+
+    def find_all(self, text: str) -> List[Tuple[str, Optional[str], int]]:
+        """
+        텍스트 내 모든 매칭을 (keyword, keyword_group, offset) 리스트로 반환
+        """
+        return [
+            (self.entries[entry_id][0], self.entries[entry_id][1], offset)
+            for entry_id, offset in self.iter_matches(text)
+        ]
+
+    def matched_entries(self, text: str) -> List[int]:
+        """
+        텍스트에 한 번 이상 등장하는 entry_id 목록 (정렬, 중복 제거)
+        """
+        return sorted({entry_id for entry_id, _ in self.iter_matches(text)})
+
+    def match_texts(self, texts: Iterable[str]) -> Dict[int, List[int]]:
+        """
+        여러 텍스트를 각각 한 번씩 스캔하여 entry_id별 매칭된 텍스트 위치 목록 반환
+
+        Args:
+            texts: 텍스트 시퀀스 (NaN/비문자열은 매칭 없음으로 처리)
+
+        Returns:
+            {entry_id: [텍스트 위치, ...]} (위치는 오름차순)
+        """
+        hits: Dict[int, List[int]] = {}
+        for position, text in enumerate(texts):
+            for entry_id in self.matched_entries(text):
+                hits.setdefault(entry_id, []).append(position)
+        return hits
+
+
+@lru_cache(maxsize=16)
+def _cached_matcher(entries: Tuple[Tuple[str, Optional[str]], ...]) -> KeywordMatcher:
+    return KeywordMatcher(entries)
+
+
+def get_keyword_matcher(entries: Iterable[Tuple[str, Optional[str]]]) -> KeywordMatcher:
+    """
+    (keyword, keyword_group) 목록에 대한 매처를 반환 (동일 목록이면 캐시 재사용)
+
+    `/analyze` 요청마다 같은 KEYWORD_GROUPS로 오토마톤을 다시 만들지 않도록
+    프로세스 단위로 캐시합니다.
+    """
+    return _cached_matcher(tuple((str(keyword), group) for keyword, group in entries))
@@ -3,15 +3,40 @@
 - 앱 검색
 - 앱 정보 수집
 - 리뷰 수집
+
+환경 변수:
+- PLAYSTORE_CONNECT_TIMEOUT / PLAYSTORE_READ_TIMEOUT: 요청 타임아웃 (초, 기본값: 5 / 15)
+- PLAYSTORE_DETAIL_WORKERS: 앱 상세 정보 동시 요청 수 (기본값: 8)
+- PLAYSTORE_HTTP_POOL_SIZE: HTTP 커넥션 풀 크기 (기본값: 16)
+- PLAYSTORE_COLLECT_WORKERS: 리뷰를 동시에 수집할 앱 수 (기본값: 4)
+- PLAYSTORE_APP_TIMEOUT: 앱별 리뷰 수집 제한 시간 (초, 0이면 제한 없음, 기본값: 90)
+- PLAYSTORE_REVIEW_PAGE_SIZE: 리뷰 페이지당 최소 리뷰 수, 증분 수집 시 페이지 크기 (기본값: 40)
+- PLAYSTORE_MAX_REVIEW_PAGE_SIZE: 리뷰 페이지당 최대 리뷰 수 (기본값: 200)
+- PLAYSTORE_BASE_URL: 검색/상세 페이지 기본 URL (기본값: https://play.google.com, 로컬 테스트 서버 지정용)
+- HTTP_CACHE_*: 검색/상세 페이지 응답 캐시 설정 (http_cache.py 참고)
+- PLAYSTORE_RATE_LIMIT / PLAYSTORE_RATE_BURST / PLAYSTORE_MAX_RETRIES / PLAYSTORE_BREAKER_*: 호스트별 요청 속도 제한,
+  재시도 및 서킷 브레이커 설정 (host_limiter.py 참고)
+- PLAYSTORE_HTML_PARSER: 검색/상세 페이지 파싱 백엔드 ('lxml' 또는 'bs4', playstore_html.py 참고)
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from google_play_scraper import Sort, reviews, app as get_app_info
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
 import logging
+import os
+import threading
+import time
+
+from crawl_state import get_crawl_state_store
+from http_cache import get_http_cache
+from host_limiter import get_host_limiter
+from playstore_html import parse_app_detail_fields, parse_search_links
+from review_store import get_review_store
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +52,187 @@ def mask_username(name: str) -> str:
         return name[0] + "*" * (len(name) - 1)
 
 
+# HTTP 설정 (환경 변수로 조정 가능)
+HTTP_CONNECT_TIMEOUT = float(os.environ.get('PLAYSTORE_CONNECT_TIMEOUT', 5))
+HTTP_READ_TIMEOUT = float(os.environ.get('PLAYSTORE_READ_TIMEOUT', 15))
+DETAIL_WORKERS = int(os.environ.get('PLAYSTORE_DETAIL_WORKERS', 8))
+HTTP_POOL_SIZE = int(os.environ.get('PLAYSTORE_HTTP_POOL_SIZE', 16))
+COLLECT_WORKERS = int(os.environ.get('PLAYSTORE_COLLECT_WORKERS', 4))
+APP_COLLECT_TIMEOUT = float(os.environ.get('PLAYSTORE_APP_TIMEOUT', 90)) or None
+REVIEW_PAGE_SIZE = int(os.environ.get('PLAYSTORE_REVIEW_PAGE_SIZE', 40))
+MAX_REVIEW_PAGE_SIZE = int(os.environ.get('PLAYSTORE_MAX_REVIEW_PAGE_SIZE', 200))
+PLAYSTORE_BASE_URL = os.environ.get('PLAYSTORE_BASE_URL', 'https://play.google.com').rstrip('/')
+# google_play_scraper가 리뷰를 요청하는 호스트 (PLAYSTORE_BASE_URL과 무관)
+SCRAPER_HOST = 'play.google.com'
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    프로세스 공용 HTTP 세션 (커넥션 풀 재사용, 지연 생성)
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _http_session = session
+    return _http_session
+
+
+def _http_get(url: str, **kwargs) -> requests.Response:
+    """공용 세션 GET 요청 (호스트별 속도 제한, 429 / 503 백오프 재시도, 서킷 브레이커 적용)"""
+    return get_host_limiter(urlparse(url).netloc).call(get_http_session().get, url, **kwargs)
+
+
+def _fetch_html(url: str, resource: str = 'page') -> str:
+    """
+    공용 세션으로 페이지를 가져와 HTML 반환 (타임아웃 적용, HTTP 오류 시 예외 발생)
+    
+    HTTP 캐시가 켜져 있으면 resource('search', 'detail') 종류별 유효 기간 동안 저장된 응답을 사용
+    """
+    timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    cache = get_http_cache()
+    if cache is not None:
+        return cache.fetch(_http_get, url, resource=resource, timeout=timeout)
+    response = _http_get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+def _placeholder_app_info(app_id: str) -> Dict:
+    """상세 정보 수집 실패 시 사용하는 기본 앱 정보"""
+    return {
+        'app_id': app_id,
+        'title': '알 수 없음',
+        'img_link': '',
+        'intro': '',
+        'rate': '0',
+        'download': '0'
+    }
+
+
+def _parse_app_detail(html: str, app_id: str) -> Dict:
+    """앱 상세 페이지 HTML에서 앱 정보 추출 (파싱 백엔드: PLAYSTORE_HTML_PARSER)"""
+    fields = parse_app_detail_fields(html)
+    
+    # 앱 정보 추출
+    title = fields['title'] if fields['title'] is not None else '알 수 없음'
+    img_link = fields['img_src'] or ''
+    intro = fields['intro'] if fields['intro'] is not None else ''
+    
+    # 평점 및 다운로드 수 추출
+    stats = fields['stats']
+    grade = '0'
+    d_num = '0'
+    
+    if len(stats) >= 1:
+        grade_text = stats[0]
+        if 'star' in grade_text:
+            grade = grade_text.split('star')[0].strip()
+    if len(stats) >= 2:
+        download_text = stats[1]
+        if '+' in download_text:
+            d_num = download_text.split('+')[0].strip()
+    
+    return {
+        'app_id': app_id,
+        'title': title,
+        'img_link': img_link,
+        'intro': intro,
+        'rate': grade,
+        'download': d_num
+    }
+
+
+def get_app_detail(app_link: str, app_id: str) -> Dict:
+    """앱 상세 정보 수집 (오류가 발생해도 기본 정보 반환)"""
+    try:
+        return _parse_app_detail(_fetch_html(app_link, resource='detail'), app_id)
+    except Exception as e:
+        logger.error(f'앱 정보 수집 오류 ({app_id}): {e}')
+        # 오류가 발생해도 기본 정보는 추가
+        return _placeholder_app_info(app_id)
+
+
+def get_app_details(app_links: List[Tuple[str, str]], max_workers: int = DETAIL_WORKERS) -> List[Dict]:
+    """
+    여러 앱의 상세 정보를 동시에 수집
+    
+    Args:
+        app_links: (상세 페이지 URL, app_id) 리스트
+        max_workers: 동시 요청 수 (기본값: PLAYSTORE_DETAIL_WORKERS)
+    
+    Returns:
+        입력 순서대로의 앱 정보 리스트 (수집 실패한 앱은 기본 정보)
+    """
+    if not app_links:
+        return []
+    
+    started = time.monotonic()
+    workers = max(1, min(max_workers, len(app_links)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='playstore-detail') as executor:
+        # map은 입력 순서대로 결과를 반환하므로 검색 순위가 유지됨
+        result = list(executor.map(lambda pair: get_app_detail(*pair), app_links))
+    
+    logger.info(f'앱 정보 수집 완료: {len(result)}개 ({time.monotonic() - started:.2f}초, 동시 요청 {workers}개)')
+    return result
+
+
+def search_app_links(keyword: str, max_results: int = 30) -> List[Tuple[str, str]]:
+    """
+    구글 플레이 스토어 검색 결과에서 앱 ID와 상세 페이지 URL만 추출 (상세 정보는 수집하지 않음)
+    
+    Args:
+        keyword: 검색 키워드
+        max_results: 최대 결과 수 (기본값: 30)
+    
+    Returns:
+        검색 순위대로의 (상세 페이지 URL, app_id) 리스트
+    
+    Raises:
+        검색 페이지 요청 오류
+    """
+    url = PLAYSTORE_BASE_URL
+    link = f"{url}/store/search?q={keyword}&c=apps"
+    
+    logger.info(f'앱 검색 시작: keyword={keyword}')
+    
+    html = _fetch_html(link, resource='search')
+    hrefs = parse_search_links(html)
+    
+    # 앱 리스트 컨테이너 찾기
+    if hrefs is None:
+        logger.warning('앱 리스트를 찾을 수 없습니다.')
+        return []
+    
+    app_links = []
+    
+    for href in hrefs:
+        try:
+            if not href:
+                continue
+            
+            # app_id 추출 (상세 페이지 링크와 짝을 맞춰 보관)
+            if 'id=' in href:
+                app_id = href.split('id=')[1].split('&')[0]
+                app_links.append((url + href, app_id))
+        except Exception as e:
+            logger.warning(f'앱 링크 파싱 오류: {e}')
+            continue
+    
+    # 최대 결과 수만큼만 가져오기
+    app_links = app_links[:max_results]
+    
+    logger.info(f'앱 ID 추출 완료: {len(app_links)}개')
+    return app_links
+
+
 def search_apps(keyword: str, max_results: int = 30) -> List[Dict]:
     """
     구글 플레이 스토어에서 키워드로 앱 검색
@@ -39,111 +245,12 @@ def search_apps(keyword: str, max_results: int = 30) -> List[Dict]:
         앱 정보 리스트 (app_id, title, img_link, intro, rate, download 포함)
     """
     try:
-        url = "https://play.google.com"
-        link = f"https://play.google.com/store/search?q={keyword}&c=apps"
-        
-        logger.info(f'앱 검색 시작: keyword={keyword}')
-        
-        response = requests.get(link)
-        response.raise_for_status()
-        
-        html = response.text
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # 앱 리스트 컨테이너 찾기
-        app_list = soup.find('div', attrs={'class': 'fUEl2e NIkkXb'})
-        if not app_list:
-            logger.warning('앱 리스트를 찾을 수 없습니다.')
+        app_links = search_app_links(keyword, max_results=max_results)
+        if not app_links:
             return []
         
-        g_list = app_list.find_all('div', attrs={'class': 'ULeU3b'})
-        
-        link_list = []
-        app_ids = []
-        
-        for item in g_list:
-            try:
-                link_tag = item.find('a')
-                if not link_tag or 'href' not in link_tag.attrs:
-                    continue
-                    
-                href = link_tag['href']
-                g_link = url + href
-                link_list.append(g_link)
-                
-                # app_id 추출
-                if 'id=' in href:
-                    app_id = href.split('id=')[1].split('&')[0]
-                    app_ids.append(app_id)
-            except Exception as e:
-                logger.warning(f'앱 링크 파싱 오류: {e}')
-                continue
-        
-        # 최대 결과 수만큼만 가져오기
-        link_list = link_list[:max_results]
-        app_ids = app_ids[:max_results]
-        
-        logger.info(f'앱 ID 추출 완료: {len(app_ids)}개')
-        
-        # 각 앱의 상세 정보 수집
-        result = []
-        for idx, (app_link, app_id) in enumerate(zip(link_list, app_ids), 1):
-            try:
-                logger.info(f'앱 정보 수집 중 ({idx}/{len(app_ids)}): {app_id}')
-                
-                response = requests.get(app_link)
-                response.raise_for_status()
-                
-                html = response.text
-                soup = BeautifulSoup(html, 'lxml')
-                
-                # 앱 정보 추출
-                title_elem = soup.find('span', attrs={'class': 'AfwdI'})
-                title = title_elem.text if title_elem else '알 수 없음'
-                
-                img_elem = soup.select_one('div > img')
-                img_link = img_elem['src'] if img_elem and 'src' in img_elem.attrs else ''
-                
-                intro_elem = soup.find('div', attrs={'class': 'bARER'})
-                intro = intro_elem.text if intro_elem else ''
-                
-                # 평점 및 다운로드 수 추출
-                box = soup.find('div', attrs={'class': 'w7Iutd'})
-                grade = '0'
-                d_num = '0'
-                
-                if box:
-                    wvq_ob = box.find_all('div', attrs={'class': 'wVqUob'})
-                    if len(wvq_ob) >= 1:
-                        grade_text = wvq_ob[0].text
-                        if 'star' in grade_text:
-                            grade = grade_text.split('star')[0].strip()
-                    if len(wvq_ob) >= 2:
-                        download_text = wvq_ob[1].text
-                        if '+' in download_text:
-                            d_num = download_text.split('+')[0].strip()
-                
-                result.append({
-                    'app_id': app_id,
-                    'title': title,
-                    'img_link': img_link,
-                    'intro': intro,
-                    'rate': grade,
-                    'download': d_num
-                })
-                
-            except Exception as e:
-                logger.error(f'앱 정보 수집 오류 ({app_id}): {e}')
-                # 오류가 발생해도 기본 정보는 추가
-                result.append({
-                    'app_id': app_id,
-                    'title': '알 수 없음',
-                    'img_link': '',
-                    'intro': '',
-                    'rate': '0',
-                    'download': '0'
-                })
-                continue
+        # 각 앱의 상세 정보 수집 (동시 요청, 검색 순위 유지)
+        result = get_app_details(app_links)
         
         logger.info(f'앱 검색 완료: {len(result)}개')
         return result
@@ -158,7 +265,8 @@ def get_app_reviews(
     lang: str = 'ko',
     country: str = 'kr',
     max_reviews: int = 150,
-    months: int = 6
+    months: int = 6,
+    incremental: bool = False
 ) -> pd.DataFrame:
     """
     앱의 리뷰를 수집
@@ -169,83 +277,222 @@ def get_app_reviews(
         country: 국가 (기본값: 'kr')
         max_reviews: 최대 리뷰 수 (기본값: 150)
         months: 수집할 기간 (개월, 기본값: 6)
+        incremental: 증분 수집 여부 (기본값: False)
+            True이면 (app_id, lang, country)별로 저장된 마지막 리뷰 이후의 새 리뷰만 수집
+            (첫 수집은 전체 수집 후 상태 저장, crawl_state.py 참고)
     
     Returns:
         리뷰 데이터프레임 (reviewId, content, score, date 포함)
     """
     try:
-        logger.info(f'리뷰 수집 시작: app_id={app_id}, max_reviews={max_reviews}, months={months}')
+        return _fetch_app_reviews(app_id, lang=lang, country=country, max_reviews=max_reviews,
+                                  months=months, incremental=incremental)
         
-        # 날짜 기준 계산
-        target_date = datetime.now() - timedelta(days=months * 30)
-        
-        # 리뷰 수집 (최대 300개까지 가져와서 필터링)
-        review_count = max_reviews * 2  # 필터링을 위해 더 많이 수집
-        review_list, _ = reviews(
+    except Exception as e:
+        logger.error(f'리뷰 수집 오류 ({app_id}): {e}', exc_info=True)
+        return pd.DataFrame(columns=['reviewId', 'content', 'score', 'date'])
+
+
+def _iter_review_pages(app_id: str, lang: str, country: str, page_size: int):
+    """
+    최신순 리뷰를 continuation token으로 한 페이지씩 가져오는 제너레이터
+    
+    Yields:
+        (리뷰 리스트, 다음 페이지 continuation token)
+    """
+    limiter = get_host_limiter(SCRAPER_HOST)
+    token = None
+    while True:
+        page, token = limiter.call(
+            reviews,
             app_id,
             lang=lang,
             country=country,
             sort=Sort.NEWEST,
-            count=review_count
+            count=page_size,
+            continuation_token=token
         )
-        
+        yield page, token
+        if not page or token is None or token.token is None:
+            return
+
+
+def _fetch_new_reviews(
+    app_id: str,
+    lang: str,
+    country: str,
+    state: Dict,
+    max_count: int
+) -> List[Dict]:
+    """
+    마지막으로 본 리뷰(워터마크)보다 새로운 리뷰만 최신순으로 페이지 단위 수집
+    워터마크 리뷰 ID 또는 그보다 오래된 리뷰를 만나면 페이지 요청을 멈춤
+    """
+    new_reviews: List[Dict] = []
+    pages = 0
+    for page, _ in _iter_review_pages(app_id, lang, country, REVIEW_PAGE_SIZE):
+        pages += 1
+        for review in page:
+            review_at = review.get('at')
+            if (review.get('reviewId') == state['newest_review_id'] or
+                    (state['newest_at'] is not None and review_at is not None and review_at < state['newest_at'])):
+                logger.info(f'증분 수집: 새 리뷰 {len(new_reviews)}개 ({pages}페이지에서 기존 리뷰 도달)')
+                return new_reviews
+            new_reviews.append(review)
+        if len(new_reviews) >= max_count:
+            break
+    
+    logger.info(f'증분 수집: 새 리뷰 {len(new_reviews)}개 ({pages}페이지, 기존 리뷰 미도달)')
+    return new_reviews[:max_count]
+
+
+def _collect_reviews_in_window(
+    app_id: str,
+    lang: str,
+    country: str,
+    max_reviews: int,
+    oldest_date: datetime
+):
+    """
+    최신순 리뷰를 페이지 단위로 수집하다가 조건을 만족하면 바로 중단
+    - oldest_date 이후 리뷰가 max_reviews개 모이면 중단 (개수 목표 달성)
+    - 페이지의 가장 오래된 리뷰가 oldest_date보다 오래되면 중단 (기간 벗어남)
+    
+    Returns:
+        수집한 리뷰 리스트 (최신순)
+    """
+    # 첫 페이지에서 목표 개수를 한 번에 요청 (리뷰가 많은 앱은 한 번의 요청으로 끝남)
+    page_size = min(max(max_reviews, REVIEW_PAGE_SIZE), MAX_REVIEW_PAGE_SIZE)
+    collected: List[Dict] = []
+    in_window = 0
+    pages = 0
+    for page, _ in _iter_review_pages(app_id, lang, country, page_size):
+        pages += 1
+        collected.extend(page)
+        in_window += sum(1 for review in page if review.get('at') is not None and review['at'] >= oldest_date)
+        if in_window >= max_reviews:
+            break
+        page_dates = [review['at'] for review in page if review.get('at') is not None]
+        if page_dates and min(page_dates) < oldest_date:
+            break
+    
+    logger.info(f'리뷰 페이지 수집: {len(collected)}개 ({pages}페이지, 기간 내 {in_window}개)')
+    return collected
+
+
+def _save_crawl_state(store, app_id: str, lang: str, country: str, review_list: List[Dict],
+                      previous: Optional[Dict] = None):
+    """가장 최신 리뷰를 워터마크로 저장 (이전 워터마크보다 새로운 리뷰가 있을 때만)"""
+    dated = [review for review in review_list if review.get('at') is not None]
+    if not dated:
+        return
+    newest = max(dated, key=lambda review: review['at'])
+    if previous is not None and previous['newest_at'] is not None and newest['at'] <= previous['newest_at']:
+        return
+    
+    store.set(app_id, lang, country, newest.get('reviewId'), newest['at'])
+
+
+def _fetch_app_reviews(
+    app_id: str,
+    lang: str = 'ko',
+    country: str = 'kr',
+    max_reviews: int = 150,
+    months: int = 6,
+    incremental: bool = False,
+    record_state: bool = False
+) -> pd.DataFrame:
+    """
+    앱의 리뷰를 수집 (get_app_reviews와 같지만 오류 시 예외 발생)
+    
+    record_state가 True이면 증분 수집이 아니어도 수집한 최신 리뷰를 워터마크로 저장
+    """
+    logger.info(f'리뷰 수집 시작: app_id={app_id}, max_reviews={max_reviews}, months={months}, incremental={incremental}')
+    
+    # 날짜 기준 계산 (기본 기간, 리뷰가 부족할 때 확장할 기간)
+    target_date = datetime.now() - timedelta(days=months * 30)
+    fallback_date = datetime.now() - timedelta(days=max(365, months * 30))
+    
+    # 증분 모드: 이전 수집 상태가 있으면 새 리뷰만 수집
+    state_store = get_crawl_state_store() if incremental or record_state else None
+    state = state_store.get(app_id, lang, country) if incremental and state_store is not None else None
+    
+    if state is not None and state['newest_review_id']:
+        review_list = _fetch_new_reviews(app_id, lang, country, state, max_reviews)
+        _save_crawl_state(state_store, app_id, lang, country, review_list, previous=state)
         if not review_list:
-            logger.warning(f'리뷰를 찾을 수 없습니다: {app_id}')
+            logger.info(f'새 리뷰가 없습니다: {app_id}')
             return pd.DataFrame(columns=['reviewId', 'content', 'score', 'date'])
-        
-        df = pd.DataFrame(review_list)
-        
-        # 날짜 컬럼 추가 및 변환
-        df["date"] = df["at"].apply(lambda x: x.strftime("%Y-%m-%d") if pd.notnull(x) else None)
-        df["at"] = pd.to_datetime(df["at"])
-        
-        # 날짜 필터링 (6개월 또는 1년)
-        filtered_df = df[df["at"] >= target_date]
-        
-        # 6개월 내 리뷰가 150개 미만이면 1년치로 확장
-        if len(filtered_df) < max_reviews:
-            one_year_ago = datetime.now() - timedelta(days=365)
-            filtered_df = df[df["at"] >= one_year_ago]
-            logger.info(f'6개월 내 리뷰 부족, 1년치로 확장: {len(filtered_df)}개')
-        
-        # 최대 개수만큼만 선택
-        final_df = filtered_df.head(max_reviews) if len(filtered_df) > max_reviews else filtered_df
-        
-        # 필요한 컬럼만 선택
-        if 'reviewId' in final_df.columns:
-            final_df = final_df[["reviewId", "content", "date", "score"]]
-        else:
-            # 컬럼명이 다른 경우 대응
-            column_mapping = {
-                'reviewId': 'reviewId',
-                'content': 'content',
-                'score': 'score',
-                'date': 'date'
-            }
-            available_cols = [col for col in column_mapping.values() if col in final_df.columns]
-            final_df = final_df[available_cols]
-        
-        # 사용자명 마스킹 (userName 컬럼이 있는 경우)
-        if "userName" in final_df.columns:
-            final_df["userName"] = final_df["userName"].apply(mask_username)
-        
-        logger.info(f'리뷰 수집 완료: {len(final_df)}개')
-        return final_df
-        
-    except Exception as e:
-        logger.error(f'리뷰 수집 오류 ({app_id}): {e}', exc_info=True)
+    else:
+        # 확장 기간까지 필요한 만큼만 페이지 수집 (기간 확장 시 다시 요청하지 않음)
+        review_list = _collect_reviews_in_window(app_id, lang, country, max_reviews, fallback_date)
+        if state_store is not None:
+            _save_crawl_state(state_store, app_id, lang, country, review_list)
+    
+    if not review_list:
+        logger.warning(f'리뷰를 찾을 수 없습니다: {app_id}')
         return pd.DataFrame(columns=['reviewId', 'content', 'score', 'date'])
+    
+    df = pd.DataFrame(review_list)
+    
+    # 날짜 컬럼 추가 및 변환
+    df["date"] = df["at"].apply(lambda x: x.strftime("%Y-%m-%d") if pd.notnull(x) else None)
+    df["at"] = pd.to_datetime(df["at"])
+    
+    # 수집한 리뷰를 리뷰 저장소에 저장 (저장 실패는 수집 결과에 영향 없음)
+    review_store = get_review_store()
+    if review_store is not None:
+        try:
+            review_store.upsert_reviews(df, app_id=app_id, lang=lang, country=country)
+        except Exception as e:
+            logger.warning(f'리뷰 저장소 저장 실패 ({app_id}): {e}')
+    
+    # 날짜 필터링 (6개월 또는 1년)
+    filtered_df = df[df["at"] >= target_date]
+    
+    # 6개월 내 리뷰가 150개 미만이면 1년치로 확장 (이미 수집한 리뷰에서 선택)
+    if len(filtered_df) < max_reviews and state is None:
+        filtered_df = df[df["at"] >= fallback_date]
+        logger.info(f'6개월 내 리뷰 부족, 1년치로 확장: {len(filtered_df)}개')
+    
+    # 최대 개수만큼만 선택
+    final_df = filtered_df.head(max_reviews) if len(filtered_df) > max_reviews else filtered_df
+    
+    # 필요한 컬럼만 선택
+    if 'reviewId' in final_df.columns:
+        final_df = final_df[["reviewId", "content", "date", "score"]]
+    else:
+        # 컬럼명이 다른 경우 대응
+        column_mapping = {
+            'reviewId': 'reviewId',
+            'content': 'content',
+            'score': 'score',
+            'date': 'date'
+        }
+        available_cols = [col for col in column_mapping.values() if col in final_df.columns]
+        final_df = final_df[available_cols]
+    
+    # 사용자명 마스킹 (userName 컬럼이 있는 경우)
+    if "userName" in final_df.columns:
+        final_df["userName"] = final_df["userName"].apply(mask_username)
+    
+    logger.info(f'리뷰 수집 완료: {len(final_df)}개')
+    return final_df
 
 
-def get_multiple_app_reviews(
+def collect_multiple_app_reviews(
     app_ids: List[str],
     lang: str = 'ko',
     country: str = 'kr',
     max_reviews_per_app: int = 150,
-    months: int = 6
-) -> pd.DataFrame:
+    months: int = 6,
+    max_workers: int = COLLECT_WORKERS,
+    app_timeout: Optional[float] = APP_COLLECT_TIMEOUT,
+    incremental: bool = False,
+    record_state: bool = False
+) -> Tuple[pd.DataFrame, List[Dict]]:
     """
-    여러 앱의 리뷰를 일괄 수집
+    여러 앱의 리뷰를 동시에 수집하고 앱별 수집 결과를 보고
     
     Args:
         app_ids: 앱 ID 리스트
@@ -253,28 +500,118 @@ def get_multiple_app_reviews(
         country: 국가 (기본값: 'kr')
         max_reviews_per_app: 앱당 최대 리뷰 수 (기본값: 150)
         months: 수집할 기간 (개월, 기본값: 6)
+        max_workers: 동시에 수집할 앱 수 (기본값: PLAYSTORE_COLLECT_WORKERS)
+        app_timeout: 앱별 수집 제한 시간 (초, 수집 시작 시점 기준, None이면 제한 없음)
+        incremental: 증분 수집 여부 (get_app_reviews 참고)
+        record_state: 증분 수집이 아니어도 앱별 최신 리뷰를 워터마크로 저장
+            (이후 incremental=True 수집은 새 리뷰만 수집, 리뷰 갱신 스케줄러의 즉시 수집에서 사용)
     
     Returns:
-        모든 앱의 리뷰를 합친 데이터프레임 (app_id 컬럼 포함)
+        (모든 앱의 리뷰를 합친 데이터프레임 (app_id 컬럼 포함, app_ids 순서),
+         앱별 수집 결과 리스트 [{app_id, status, review_count, elapsed, error}])
+        status: ok / empty / failed / timeout
     """
-    df_final = pd.DataFrame()
+    if not app_ids:
+        return pd.DataFrame(), []
     
-    for idx, app_id in enumerate(app_ids, start=1):
-        logger.info(f'앱 리뷰 수집 중 ({idx}/{len(app_ids)}): {app_id}')
-        
-        df = get_app_reviews(
+    started_at: Dict[str, float] = {}
+    reports: Dict[str, Dict] = {}
+    frames: Dict[str, pd.DataFrame] = {}
+    
+    def collect(app_id: str) -> pd.DataFrame:
+        started_at[app_id] = time.monotonic()
+        return _fetch_app_reviews(
             app_id=app_id,
             lang=lang,
             country=country,
             max_reviews=max_reviews_per_app,
-            months=months
+            months=months,
+            incremental=incremental,
+            record_state=record_state
         )
-        
-        if not df.empty:
-            df["app_id"] = app_id
-            df_final = pd.concat([df_final, df], axis=0, ignore_index=True)
     
-    logger.info(f'전체 리뷰 수집 완료: {len(df_final)}개')
+    def elapsed(app_id: str) -> float:
+        return round(time.monotonic() - started_at.get(app_id, time.monotonic()), 2)
+    
+    started = time.monotonic()
+    workers = max(1, min(max_workers, len(app_ids)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='playstore-reviews')
+    try:
+        futures = {executor.submit(collect, app_id): app_id for app_id in app_ids}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                app_id = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    logger.error(f'리뷰 수집 오류 ({app_id}): {e}')
+                    reports[app_id] = {'app_id': app_id, 'status': 'failed', 'review_count': 0,
+                                       'elapsed': elapsed(app_id), 'error': str(e)}
+                    continue
+                if not df.empty:
+                    df["app_id"] = app_id
+                    frames[app_id] = df
+                reports[app_id] = {'app_id': app_id, 'status': 'ok' if not df.empty else 'empty',
+                                   'review_count': len(df), 'elapsed': elapsed(app_id)}
+                logger.info(f'앱 리뷰 수집 완료 ({len(reports)}/{len(app_ids)}): {app_id}, {len(df)}개')
+            
+            # 제한 시간을 넘긴 앱은 기다리지 않음 (결과는 버림)
+            if app_timeout is not None:
+                now = time.monotonic()
+                for future in list(pending):
+                    app_id = futures[future]
+                    if app_id in started_at and now - started_at[app_id] > app_timeout:
+                        logger.warning(f'리뷰 수집 제한 시간 초과 ({app_timeout}초): {app_id}')
+                        reports[app_id] = {'app_id': app_id, 'status': 'timeout', 'review_count': 0,
+                                           'elapsed': elapsed(app_id), 'error': f'{app_timeout}초 초과'}
+                        pending.discard(future)
+    finally:
+        # 제한 시간을 넘긴 작업은 백그라운드에서 끝나도록 두고 바로 반환
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # 한 번만 합침 (app_ids 순서 유지)
+    ordered = [frames[app_id] for app_id in app_ids if app_id in frames]
+    df_final = pd.concat(ordered, axis=0, ignore_index=True) if ordered else pd.DataFrame()
+    report = [reports[app_id] for app_id in app_ids if app_id in reports]
+    
+    failed = sum(1 for item in report if item['status'] in ('failed', 'timeout'))
+    logger.info(f'전체 리뷰 수집 완료: {len(df_final)}개 ({time.monotonic() - started:.2f}초, '
+                f'앱 {len(app_ids)}개 중 실패 {failed}개, 동시 수집 {workers}개)')
+    return df_final, report
+
+
+def get_multiple_app_reviews(
+    app_ids: List[str],
+    lang: str = 'ko',
+    country: str = 'kr',
+    max_reviews_per_app: int = 150,
+    months: int = 6,
+    incremental: bool = False
+) -> pd.DataFrame:
+    """
+    여러 앱의 리뷰를 일괄 수집 (collect_multiple_app_reviews로 동시 수집)
+    
+    Args:
+        app_ids: 앱 ID 리스트
+        lang: 언어 (기본값: 'ko')
+        country: 국가 (기본값: 'kr')
+        max_reviews_per_app: 앱당 최대 리뷰 수 (기본값: 150)
+        months: 수집할 기간 (개월, 기본값: 6)
+        incremental: 증분 수집 여부 (get_app_reviews 참고)
+    
+    Returns:
+        모든 앱의 리뷰를 합친 데이터프레임 (app_id 컬럼 포함)
+    """
+    df_final, _ = collect_multiple_app_reviews(
+        app_ids,
+        lang=lang,
+        country=country,
+        max_reviews_per_app=max_reviews_per_app,
+        months=months,
+        incremental=incremental
+    )
     return df_final
 
 
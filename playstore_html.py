@@ -0,0 +1,261 @@
+"""
+플레이스토어 검색/상세 페이지 HTML 파싱 모듈
+- 필요한 요소(검색 결과 목록, 앱 제목/아이콘/소개/평점·다운로드 수)만 추출
+- 'lxml' 백엔드: lxml 스트리밍 파서(target 인터페이스)로 트리를 만들지 않고 필요한 요소의 텍스트만 수집,
+  필요한 요소를 모두 찾으면 나머지 HTML은 파싱하지 않음
+- 'bs4' 백엔드: BeautifulSoup으로 전체 트리를 만든 뒤 find (기존 방식, 결과 비교용)
+- 두 백엔드의 추출 결과는 동일
+
+환경 변수:
+- PLAYSTORE_HTML_PARSER: 파싱 백엔드 ('lxml' 또는 'bs4', 기본값: lxml)
+"""
+
+from typing import Dict, List, Optional
+import logging
+import os
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSERS = ('lxml', 'bs4')
+DEFAULT_HTML_PARSER = os.environ.get('PLAYSTORE_HTML_PARSER', 'lxml').lower()
+if DEFAULT_HTML_PARSER not in HTML_PARSERS:
+    logger.warning(f"알 수 없는 PLAYSTORE_HTML_PARSER 값입니다: {DEFAULT_HTML_PARSER}. lxml을 사용합니다.")
+    DEFAULT_HTML_PARSER = 'lxml'
+
+# 스트리밍 파서에 한 번에 넣는 HTML 크기 (찾을 요소를 모두 찾으면 이후 조각은 넣지 않음)
+FEED_CHUNK_SIZE = 64 * 1024
+
+# 검색 결과 목록 / 항목, 상세 페이지 요소 class
+SEARCH_LIST_CLASS = 'fUEl2e NIkkXb'
+SEARCH_ITEM_CLASS = 'ULeU3b'
+TITLE_CLASS = 'AfwdI'
+INTRO_CLASS = 'bARER'
+STATS_BOX_CLASS = 'w7Iutd'
+STATS_ITEM_CLASS = 'wVqUob'
+
+# 텍스트를 수집하지 않는 태그 (BeautifulSoup의 .text도 이 태그 안의 문자열은 제외)
+NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+
+
+def _has_class(attrib, name: str) -> bool:
+    """BeautifulSoup의 class 검색과 같은 규칙 (class 하나와 같거나 전체 class 문자열과 같음)"""
+    tokens = (attrib.get('class') or '').split()
+    return name in tokens or ' '.join(tokens) == name
+
+
+class _Capture:
+    """요소 하나의 텍스트 수집 (하위 요소 텍스트 포함)"""
+
+    __slots__ = ('depth', 'parts')
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.parts: List[str] = []
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.parts)
+
+
+class _StreamingTarget:
+    """
+    lxml 파서 target 기본 클래스
+
+    태그 스택 깊이를 추적하고, 열린 _Capture에 텍스트를 누적
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.parents: List[str] = []
+        self.captures: List[_Capture] = []
+        self.non_text_depth = 0
+        self.done = False
+
+    def start(self, tag, attrib):
+        self.depth += 1
+        self.on_start(tag, attrib)
+        self.parents.append(tag)
+        if tag in NON_TEXT_TAGS:
+            self.non_text_depth += 1
+
+    def end(self, tag):
+        if self.parents.pop() in NON_TEXT_TAGS:
+            self.non_text_depth -= 1
+        if self.captures:
+            self.captures = [capture for capture in self.captures if capture.depth != self.depth]
+        self.on_end(tag)
+        self.depth -= 1
+
+    def data(self, data):
+        if self.non_text_depth:
+            return
+        for capture in self.captures:
+            capture.parts.append(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return self
+
+    def capture(self) -> _Capture:
+        capture = _Capture(self.depth)
+        self.captures.append(capture)
+        return capture
+
+    def on_start(self, tag, attrib):
+        pass
+
+    def on_end(self, tag):
+        pass
+
+
+class _SearchTarget(_StreamingTarget):
+    """검색 결과 목록에서 항목별 첫 번째 링크 수집"""
+
+    def __init__(self):
+        super().__init__()
+        self.list_depth: Optional[int] = None
+        self.items: List[Dict] = []
+        self.open_items: List[Dict] = []
+
+    def on_start(self, tag, attrib):
+        if self.done:
+            return
+        if self.list_depth is None:
+            if tag == 'div' and _has_class(attrib, SEARCH_LIST_CLASS):
+                self.list_depth = self.depth
+            return
+        if tag == 'a':
+            for item in self.open_items:
+                if not item['found']:
+                    item['found'] = True
+                    item['href'] = attrib.get('href')
+        if tag == 'div' and _has_class(attrib, SEARCH_ITEM_CLASS):
+            item = {'depth': self.depth, 'found': False, 'href': None}
+            self.items.append(item)
+            self.open_items.append(item)
+
+    def on_end(self, tag):
+        if self.list_depth is None or self.done:
+            return
+        if self.open_items and self.open_items[-1]['depth'] == self.depth:
+            self.open_items.pop()
+        if self.depth == self.list_depth:
+            self.done = True
+
+
+class _DetailTarget(_StreamingTarget):
+    """상세 페이지에서 제목, 아이콘, 소개, 평점/다운로드 수 텍스트 수집"""
+
+    def __init__(self):
+        super().__init__()
+        self.title: Optional[_Capture] = None
+        self.intro: Optional[_Capture] = None
+        self.img_src: Optional[str] = None
+        self.img_found = False
+        self.box_depth: Optional[int] = None
+        self.box_done = False
+        self.stats: List[_Capture] = []
+
+    def on_start(self, tag, attrib):
+        if tag == 'img':
+            if not self.img_found and self.parents and self.parents[-1] == 'div':
+                self.img_found = True
+                self.img_src = attrib.get('src')
+        elif tag == 'span':
+            if self.title is None and _has_class(attrib, TITLE_CLASS):
+                self.title = self.capture()
+        elif tag == 'div':
+            if self.intro is None and _has_class(attrib, INTRO_CLASS):
+                self.intro = self.capture()
+            if self.box_depth is not None and _has_class(attrib, STATS_ITEM_CLASS):
+                self.stats.append(self.capture())
+            if self.box_depth is None and not self.box_done and _has_class(attrib, STATS_BOX_CLASS):
+                self.box_depth = self.depth
+
+    def on_end(self, tag):
+        if self.box_depth is not None and self.depth == self.box_depth:
+            self.box_depth = None
+            self.box_done = True
+        self.done = (self.img_found and self.box_done and not self.captures
+                     and self.title is not None and self.intro is not None)
+
+
+def _stream_parse(html: str, target: _StreamingTarget) -> _StreamingTarget:
+    """HTML을 조각 단위로 스트리밍 파싱 (target.done이면 중단)"""
+    parser = etree.HTMLParser(target=target, recover=True)
+    for start in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[start:start + FEED_CHUNK_SIZE])
+        if target.done:
+            break
+    if not target.done:
+        parser.close()
+    return target
+
+
+def parse_search_links(html: str, parser: Optional[str] = None) -> Optional[List[Optional[str]]]:
+    """
+    검색 결과 페이지에서 항목별 첫 번째 링크 추출
+
+    Args:
+        html: 검색 결과 페이지 HTML
+        parser: 파싱 백엔드 ('lxml' / 'bs4', None이면 PLAYSTORE_HTML_PARSER)
+
+    Returns:
+        검색 순서대로의 href 리스트 (링크가 없거나 href가 없는 항목은 None),
+        검색 결과 목록을 찾지 못하면 None
+    """
+    if (parser or DEFAULT_HTML_PARSER) == 'bs4':
+        soup = BeautifulSoup(html, 'lxml')
+        app_list = soup.find('div', attrs={'class': SEARCH_LIST_CLASS})
+        if not app_list:
+            return None
+        links = []
+        for item in app_list.find_all('div', attrs={'class': SEARCH_ITEM_CLASS}):
+            link_tag = item.find('a')
+            links.append(link_tag.get('href') if link_tag else None)
+        return links
+
+    target = _stream_parse(html, _SearchTarget())
+    if target.list_depth is None:
+        return None
+    return [item['href'] for item in target.items]
+
+
+def parse_app_detail_fields(html: str, parser: Optional[str] = None) -> Dict:
+    """
+    앱 상세 페이지에서 필요한 요소의 텍스트 추출
+
+    Args:
+        html: 앱 상세 페이지 HTML
+        parser: 파싱 백엔드 ('lxml' / 'bs4', None이면 PLAYSTORE_HTML_PARSER)
+
+    Returns:
+        title / intro: 제목 / 소개 텍스트 (요소가 없으면 None)
+        img_src: 첫 번째 div > img의 src (없으면 None)
+        stats: 평점·다운로드 수 박스의 항목 텍스트 리스트 (박스가 없으면 빈 리스트)
+    """
+    if (parser or DEFAULT_HTML_PARSER) == 'bs4':
+        soup = BeautifulSoup(html, 'lxml')
+        title_elem = soup.find('span', attrs={'class': TITLE_CLASS})
+        img_elem = soup.select_one('div > img')
+        intro_elem = soup.find('div', attrs={'class': INTRO_CLASS})
+        box = soup.find('div', attrs={'class': STATS_BOX_CLASS})
+        return {
+            'title': title_elem.text if title_elem else None,
+            'img_src': img_elem.get('src') if img_elem else None,
+            'intro': intro_elem.text if intro_elem else None,
+            'stats': [elem.text for elem in box.find_all('div', attrs={'class': STATS_ITEM_CLASS})] if box else [],
+        }
+
+    target = _stream_parse(html, _DetailTarget())
+    return {
+        'title': target.title.text if target.title is not None else None,
+        'img_src': target.img_src,
+        'intro': target.intro.text if target.intro is not None else None,
+        'stats': [capture.text for capture in target.stats],
+    }
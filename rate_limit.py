@@ -0,0 +1,106 @@
+"""
+요청 속도 제한 모듈
+- 토큰 버킷 (thread-safe, 대기 중인 요청 수 집계)
+- 지터가 포함된 지수 백오프 계산
+"""
+
+from typing import Optional
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    Args:
+        rate: 초당 충전되는 토큰 수
+        capacity: 버킷 최대 토큰 수 (순간 최대 허용량)
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate와 capacity는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._waiting = 0
+
+    @classmethod
+    def per_minute(cls, amount: float) -> "TokenBucket":
+        """분당 amount 만큼 허용하는 버킷 (최대 1분치까지 누적)"""
+        return cls(rate=amount / 60.0, capacity=amount)
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def try_acquire(self, amount: float = 1.0) -> float:
+        """
+        토큰을 즉시 획득 시도
+
+        Returns:
+            0.0 (획득 성공) 또는 토큰이 충전될 때까지 기다려야 하는 시간(초)
+        """
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate
+
+    def acquire(self, amount: float = 1.0, deadline: Optional[float] = None) -> bool:
+        """
+        토큰을 획득할 때까지 대기
+
+        Args:
+            amount: 필요한 토큰 수 (capacity보다 크면 capacity로 제한)
+            deadline: time.monotonic() 기준 대기 마감 시각 (None이면 무제한)
+
+        Returns:
+            획득 성공 여부 (마감 시각까지 획득하지 못하면 False)
+        """
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                wait = self.try_acquire(amount)
+                if wait <= 0:
+                    return True
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    return False
+                time.sleep(min(wait, 1.0))
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    @property
+    def waiting(self) -> int:
+        """토큰을 기다리는 중인 요청 수"""
+        return self._waiting
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
+    """
+    지터가 포함된 지수 백오프 대기 시간 (full jitter)
+
+    Args:
+        attempt: 재시도 횟수 (0부터 시작)
+        base_delay: 첫 재시도 기준 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
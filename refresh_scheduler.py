@@ -0,0 +1,492 @@
+"""
+리뷰 백그라운드 갱신 스케줄러
+- 리뷰 수집 API로 요청된 앱을 추적 앱 목록에 등록 (앱별 요청 빈도, 마지막 갱신 시각 등, SQLite 저장)
+- 백그라운드 스레드가 갱신이 필요한 앱을 오래된 정도와 요청 빈도 순으로 골라 증분 수집 (리뷰 저장소에 저장)
+- 전체 수집 예산(시간당 갱신 앱 수) 안에서만 갱신 (토큰 버킷)
+- 최근에 갱신된 앱은 리뷰 저장소에서 바로 응답하고, 그 외 앱만 즉시 수집 (collect_reviews_with_cache)
+- 백그라운드 스레드는 모듈 import 시점이 아니라 get_refresh_scheduler()를 처음 호출할 때 시작
+- thread-safe
+
+환경 변수:
+- REFRESH_SCHEDULER_ENABLED: 백그라운드 갱신 및 저장소 응답 사용 여부 (기본값: true)
+- REFRESH_REGISTRY_PATH: 추적 앱 목록 파일 경로 (기본값: .cache/tracked_apps.sqlite3)
+- REFRESH_INTERVAL: 마지막 갱신 후 다시 갱신할 때까지의 시간 (초, 기본값: 1800)
+- REFRESH_MAX_AGE: 리뷰 저장소에서 바로 응답할 수 있는 마지막 갱신 후 경과 시간 (초, 기본값: 3600)
+- REFRESH_BUDGET_PER_HOUR: 시간당 최대 갱신 앱 수 (기본값: 120, 프로세스별 예산이며
+  프로세스가 다시 시작되면 최근 갱신 시도 기록으로 이미 사용한 예산을 복원)
+- REFRESH_TICK: 갱신 대상 확인 간격 (초, 기본값: 15)
+- REFRESH_MAX_APPS: 최대 추적 앱 수 (넘으면 요청 빈도가 낮은 앱부터 제외, 기본값: 500)
+- REFRESH_IDLE_DAYS: 이 기간 동안 요청되지 않은 앱은 추적 중단 (일, 기본값: 7)
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from playstore_crawler import collect_multiple_app_reviews
+from rate_limit import TokenBucket
+from review_store import get_review_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_PATH = ".cache/tracked_apps.sqlite3"
+
+# 요청 빈도 반감기 (초): 하루 전 요청은 지금 요청의 절반으로 계산
+HIT_HALF_LIFE = 24 * 3600
+
+# 갱신 실패 후 다시 시도할 때까지의 최소 시간 (초)
+RETRY_DELAY = 300
+
+AppKey = Tuple[str, str, str]
+
+_FIELDS = ('max_reviews', 'months', 'hits', 'last_requested_at', 'last_refreshed_at', 'last_attempt_at',
+           'covered_reviews', 'covered_months', 'last_status', 'last_review_count')
+
+
+class RefreshScheduler:
+    """
+    추적 앱 목록 관리 및 백그라운드 갱신
+
+    앱 항목:
+        max_reviews / months: 지금까지 요청된 최대 리뷰 수 / 기간 (갱신 시 사용)
+        hits: 요청 빈도 (HIT_HALF_LIFE 반감기로 감쇠하는 요청 횟수)
+        last_requested_at / last_refreshed_at / last_attempt_at: 마지막 요청 / 갱신 성공 / 갱신 시도 시각
+        covered_reviews / covered_months: 리뷰 저장소에 수집된 범위 (이 범위 안의 요청만 저장소에서 응답)
+        last_status / last_review_count: 마지막 갱신 결과
+
+    Args:
+        path: 추적 앱 목록 SQLite 파일 경로 (None이면 메모리 전용)
+        interval: 다시 갱신할 때까지의 시간 (초)
+        max_age: 리뷰 저장소에서 응답할 수 있는 마지막 갱신 후 경과 시간 (초)
+        budget_per_hour: 시간당 최대 갱신 앱 수 (프로세스별 예산, 생성 시 추적 앱 목록의 최근 갱신 시도로 사용량 복원)
+        tick: 갱신 대상 확인 간격 (초)
+        max_apps: 최대 추적 앱 수
+        idle_seconds: 이 시간 동안 요청되지 않은 앱은 추적 중단
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_REGISTRY_PATH, interval: float = 1800,
+                 max_age: float = 3600, budget_per_hour: float = 120, tick: float = 15,
+                 max_apps: int = 500, idle_seconds: float = 7 * 24 * 3600):
+        self.path = path
+        self.interval = interval
+        self.max_age = max_age
+        self.tick = tick
+        self.max_apps = max_apps
+        self.idle_seconds = idle_seconds
+        # 시간당 예산, 최대 5분치까지 누적
+        self.budget = TokenBucket(rate=budget_per_hour / 3600.0, capacity=max(1.0, budget_per_hour / 12.0))
+
+        self._lock = threading.Lock()
+        self._apps: Dict[AppKey, Dict] = {}
+        self._in_progress: set = set()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.served = 0
+        self.missed = 0
+        self.refreshed = 0
+        self.refresh_failures = 0
+        self.last_tick_at: Optional[float] = None
+
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS tracked_apps (
+                        app_id TEXT NOT NULL,
+                        lang TEXT NOT NULL,
+                        country TEXT NOT NULL,
+                        max_reviews INTEGER NOT NULL,
+                        months INTEGER NOT NULL,
+                        hits REAL NOT NULL,
+                        last_requested_at REAL NOT NULL,
+                        last_refreshed_at REAL,
+                        last_attempt_at REAL,
+                        covered_reviews INTEGER,
+                        covered_months INTEGER,
+                        last_status TEXT,
+                        last_review_count INTEGER,
+                        PRIMARY KEY (app_id, lang, country)
+                    )
+                """)
+                self._conn.commit()
+                for row in self._conn.execute(
+                        f"SELECT app_id, lang, country, {', '.join(_FIELDS)} FROM tracked_apps").fetchall():
+                    self._apps[tuple(row[:3])] = dict(zip(_FIELDS, row[3:]))
+                logger.info(f"추적 앱 목록 로드: {path} ({len(self._apps)}개)")
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"추적 앱 목록 파일을 열 수 없습니다 ({path}): {e}. 메모리에만 저장합니다.")
+                self._conn = None
+        self._restore_budget()
+
+    def _restore_budget(self):
+        """
+        예산 버킷이 한 번 가득 차는 동안 갱신을 시도한 앱 수만큼 예산을 미리 사용
+        (gunicorn --max-requests 등으로 프로세스가 다시 시작될 때마다 예산이 가득 찬 상태로 시작하지 않도록,
+         즉시 수집 기록도 포함하므로 실제 사용량보다 보수적)
+        """
+        now = time.time()
+        window = self.budget.capacity / self.budget.rate
+        recent = sum(1 for entry in self._apps.values()
+                     if entry['last_attempt_at'] is not None and now - entry['last_attempt_at'] < window)
+        if recent:
+            self.budget.try_acquire(recent)
+
+    # ------------------------------------------------------------------
+    # 추적 앱 목록
+    # ------------------------------------------------------------------
+
+    def _save(self, key: AppKey):
+        """앱 항목 저장 (락 보유 상태에서 호출)"""
+        if self._conn is None:
+            return
+        entry = self._apps.get(key)
+        try:
+            if entry is None:
+                self._conn.execute("DELETE FROM tracked_apps WHERE app_id = ? AND lang = ? AND country = ?", key)
+            else:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO tracked_apps (app_id, lang, country, {', '.join(_FIELDS)}) "
+                    f"VALUES ({', '.join('?' * (3 + len(_FIELDS)))})",
+                    key + tuple(entry[field] for field in _FIELDS)
+                )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"추적 앱 목록 저장 실패 ({key[0]}): {e}")
+
+    def track(self, app_ids: List[str], lang: str = 'ko', country: str = 'kr',
+              max_reviews: int = 150, months: int = 6):
+        """요청된 앱을 추적 앱 목록에 등록하고 요청 빈도 갱신"""
+        now = time.time()
+        with self._lock:
+            for app_id in app_ids:
+                key = (app_id, lang, country)
+                entry = self._apps.get(key)
+                if entry is None:
+                    entry = dict.fromkeys(_FIELDS)
+                    entry.update({'max_reviews': max_reviews, 'months': months, 'hits': 0.0})
+                    self._apps[key] = entry
+                else:
+                    entry['max_reviews'] = max(entry['max_reviews'], max_reviews)
+                    entry['months'] = max(entry['months'], months)
+                    entry['hits'] *= 0.5 ** ((now - entry['last_requested_at']) / HIT_HALF_LIFE)
+                entry['hits'] += 1.0
+                entry['last_requested_at'] = now
+                self._save(key)
+            self._trim(now)
+
+    def _trim(self, now: float):
+        """오래 요청되지 않은 앱 및 최대 앱 수를 넘는 앱 제외 (락 보유 상태에서 호출)"""
+        removed = [key for key, entry in self._apps.items() if now - entry['last_requested_at'] > self.idle_seconds]
+        overflow = len(self._apps) - len(removed) - self.max_apps
+        if overflow > 0:
+            idle = set(removed)
+            remaining = sorted((key for key in self._apps if key not in idle),
+                               key=lambda key: (self._decayed_hits(self._apps[key], now),
+                                                self._apps[key]['last_requested_at']))
+            removed.extend(remaining[:overflow])
+        for key in removed:
+            del self._apps[key]
+            self._save(key)
+
+    def mark_refreshed(self, app_id: str, lang: str, country: str, max_reviews: int, months: int,
+                       status: str, review_count: int = 0):
+        """수집 결과 기록 (status가 ok / empty이면 갱신 성공, 수집 범위 갱신)"""
+        now = time.time()
+        key = (app_id, lang, country)
+        with self._lock:
+            entry = self._apps.get(key)
+            if entry is None:
+                return
+            entry['last_attempt_at'] = now
+            entry['last_status'] = status
+            entry['last_review_count'] = review_count
+            if status in ('ok', 'empty'):
+                entry['last_refreshed_at'] = now
+                entry['covered_reviews'] = max(entry['covered_reviews'] or 0, max_reviews)
+                entry['covered_months'] = max(entry['covered_months'] or 0, months)
+            self._save(key)
+
+    def record_requests(self, served: int, collected: int):
+        """저장소 응답 / 즉시 수집 앱 수 집계"""
+        with self._lock:
+            self.served += served
+            self.missed += collected
+
+    @staticmethod
+    def _decayed_hits(entry: Dict, now: float) -> float:
+        return entry['hits'] * 0.5 ** ((now - entry['last_requested_at']) / HIT_HALF_LIFE)
+
+    def is_fresh(self, app_id: str, lang: str, country: str, max_reviews: int, months: int) -> bool:
+        """리뷰 저장소의 리뷰가 최근에 갱신되었고 요청 범위를 포함하는지 여부"""
+        with self._lock:
+            entry = self._apps.get((app_id, lang, country))
+            if entry is None or entry['last_refreshed_at'] is None:
+                return False
+            return (time.time() - entry['last_refreshed_at'] < self.max_age
+                    and (entry['covered_reviews'] or 0) >= max_reviews
+                    and (entry['covered_months'] or 0) >= months)
+
+    def due_apps(self, now: Optional[float] = None) -> List[AppKey]:
+        """
+        갱신이 필요한 앱 (우선순위 순)
+
+        우선순위: 마지막 갱신 후 경과 시간 / 갱신 간격 × (1 + log(1 + 요청 빈도)), 한 번도 갱신하지 않은 앱 우선
+        """
+        now = time.time() if now is None else now
+        candidates = []
+        with self._lock:
+            for key, entry in self._apps.items():
+                if key in self._in_progress:
+                    continue
+                if entry['last_attempt_at'] is not None and now - entry['last_attempt_at'] < min(self.interval,
+                                                                                                 RETRY_DELAY):
+                    continue
+                hits = self._decayed_hits(entry, now)
+                if entry['last_refreshed_at'] is None:
+                    priority = math.inf
+                else:
+                    staleness = (now - entry['last_refreshed_at']) / self.interval
+                    if staleness < 1:
+                        continue
+                    priority = staleness * (1 + math.log1p(hits))
+                candidates.append((priority, hits, key))
+        candidates.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [key for _, _, key in candidates]
+
+    # ------------------------------------------------------------------
+    # 저장소 응답
+    # ------------------------------------------------------------------
+
+    def cached_reviews(self, app_id: str, lang: str = 'ko', country: str = 'kr',
+                       max_reviews: int = 150, months: int = 6) -> Optional[pd.DataFrame]:
+        """
+        최근에 갱신된 앱이면 리뷰 저장소에서 get_app_reviews와 같은 형식의 리뷰 반환 (아니면 None)
+
+        get_app_reviews와 같은 기간 규칙 적용: 최근 months개월, 리뷰가 max_reviews개 미만이면 1년치로 확장, 최신순 max_reviews개
+        """
+        if not self.is_fresh(app_id, lang, country, max_reviews, months):
+            return None
+        store = get_review_store()
+        if store is None:
+            return None
+
+        target_date = (datetime.now() - timedelta(days=months * 30)).strftime('%Y-%m-%d')
+        fallback_date = (datetime.now() - timedelta(days=max(365, months * 30))).strftime('%Y-%m-%d')
+        df = store.load_reviews([app_id], start_date=fallback_date)
+        filtered = df[df['date'] >= target_date]
+        if len(filtered) < max_reviews:
+            filtered = df
+        return filtered.head(max_reviews)[["reviewId", "content", "date", "score"]].reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # 백그라운드 갱신
+    # ------------------------------------------------------------------
+
+    def run_once(self) -> int:
+        """
+        갱신이 필요한 앱을 예산 안에서 증분 수집
+
+        Returns:
+            갱신을 시도한 앱 수
+        """
+        self.last_tick_at = time.time()
+        with self._lock:
+            self._trim(self.last_tick_at)
+
+        selected: List[AppKey] = []
+        for key in self.due_apps(self.last_tick_at):
+            if self.budget.try_acquire() > 0:
+                break
+            selected.append(key)
+        if not selected:
+            return 0
+
+        # 같은 수집 조건끼리 묶어서 동시 수집
+        groups: Dict[Tuple, List[str]] = {}
+        with self._lock:
+            for key in selected:
+                self._in_progress.add(key)
+                entry = self._apps.get(key)
+                if entry is not None:
+                    groups.setdefault((key[1], key[2], entry['max_reviews'], entry['months']), []).append(key[0])
+
+        try:
+            for (lang, country, max_reviews, months), app_ids in groups.items():
+                logger.info(f'백그라운드 리뷰 갱신: {app_ids}')
+                _, report = collect_multiple_app_reviews(
+                    app_ids=app_ids,
+                    lang=lang,
+                    country=country,
+                    max_reviews_per_app=max_reviews,
+                    months=months,
+                    incremental=True
+                )
+                reported = {item['app_id']: item for item in report}
+                for app_id in app_ids:
+                    item = reported.get(app_id, {'status': 'failed', 'review_count': 0})
+                    self.mark_refreshed(app_id, lang, country, max_reviews, months,
+                                        item['status'], item['review_count'])
+                    if item['status'] in ('ok', 'empty'):
+                        self.refreshed += 1
+                    else:
+                        self.refresh_failures += 1
+        finally:
+            with self._lock:
+                self._in_progress.difference_update(selected)
+        return len(selected)
+
+    def _loop(self):
+        while not self._stop_event.wait(self.tick):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f'백그라운드 리뷰 갱신 오류: {e}', exc_info=True)
+
+    def start(self):
+        """백그라운드 갱신 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._loop, name='review-refresh', daemon=True)
+            self._thread.start()
+        logger.info(f'백그라운드 리뷰 갱신 시작 (간격 {self.interval:.0f}초, 시간당 예산 {self.budget.rate * 3600:.0f}개)')
+
+    def stop(self, timeout: Optional[float] = None):
+        """백그라운드 갱신 스레드 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict:
+        """추적 앱 수, 저장소 응답/수집 횟수, 갱신 현황"""
+        now = time.time()
+        due = len(self.due_apps(now))
+        with self._lock:
+            fresh = sum(1 for entry in self._apps.values()
+                        if entry['last_refreshed_at'] is not None and now - entry['last_refreshed_at'] < self.max_age)
+            return {
+                'enabled': True,
+                'running': self._thread is not None and self._thread.is_alive(),
+                'tracked_apps': len(self._apps),
+                'fresh_apps': fresh,
+                'due_apps': due,
+                'in_progress': len(self._in_progress),
+                'served_from_store': self.served,
+                'collected_inline': self.missed,
+                'refreshed': self.refreshed,
+                'refresh_failures': self.refresh_failures,
+                'budget_available': round(self.budget.available, 2),
+                'last_tick_at': datetime.fromtimestamp(self.last_tick_at).isoformat() if self.last_tick_at else None,
+            }
+
+
+def collect_reviews_with_cache(
+    scheduler: Optional[RefreshScheduler],
+    app_ids: List[str],
+    lang: str = 'ko',
+    country: str = 'kr',
+    max_reviews_per_app: int = 150,
+    months: int = 6
+) -> Tuple[pd.DataFrame, List[Dict]]:
+    """
+    최근에 갱신된 앱은 리뷰 저장소에서 응답하고 나머지 앱만 즉시 수집 (collect_multiple_app_reviews와 같은 반환 형식)
+
+    요청한 앱은 모두 추적 앱 목록에 등록되어 이후 백그라운드에서 갱신됨.
+    저장소에서 응답한 앱의 collection_report status는 'cached'.
+    scheduler가 None이면 collect_multiple_app_reviews와 동일.
+    """
+    if scheduler is None:
+        return collect_multiple_app_reviews(app_ids=app_ids, lang=lang, country=country,
+                                            max_reviews_per_app=max_reviews_per_app, months=months)
+
+    scheduler.track(app_ids, lang, country, max_reviews_per_app, months)
+
+    frames: Dict[str, pd.DataFrame] = {}
+    reports: Dict[str, Dict] = {}
+    misses = []
+    for app_id in app_ids:
+        try:
+            df = scheduler.cached_reviews(app_id, lang, country, max_reviews_per_app, months)
+        except Exception as e:
+            logger.warning(f'리뷰 저장소 조회 실패 ({app_id}): {e}')
+            df = None
+        if df is None:
+            misses.append(app_id)
+            continue
+        if not df.empty:
+            df["app_id"] = app_id
+            frames[app_id] = df
+        reports[app_id] = {'app_id': app_id, 'status': 'cached', 'review_count': len(df), 'elapsed': 0.0}
+    scheduler.record_requests(served=len(app_ids) - len(misses), collected=len(misses))
+
+    if misses:
+        # 전체 수집이지만 워터마크를 기록하여 이후 백그라운드 갱신은 새 리뷰만 증분 수집
+        df_collected, collected_report = collect_multiple_app_reviews(
+            app_ids=misses, lang=lang, country=country,
+            max_reviews_per_app=max_reviews_per_app, months=months, record_state=True
+        )
+        for item in collected_report:
+            reports[item['app_id']] = item
+            scheduler.mark_refreshed(item['app_id'], lang, country, max_reviews_per_app, months,
+                                     item['status'], item['review_count'])
+        if not df_collected.empty:
+            for app_id, df in df_collected.groupby('app_id', sort=False):
+                frames[app_id] = df
+
+    ordered = [frames[app_id] for app_id in app_ids if app_id in frames]
+    df_final = pd.concat(ordered, axis=0, ignore_index=True) if ordered else pd.DataFrame()
+    report = [reports[app_id] for app_id in app_ids if app_id in reports]
+    logger.info(f'리뷰 응답: 저장소 {len(app_ids) - len(misses)}개 앱, 즉시 수집 {len(misses)}개 앱')
+    return df_final, report
+
+
+_default_scheduler: Optional[RefreshScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_refresh_scheduler(start: bool = True) -> Optional[RefreshScheduler]:
+    """
+    프로세스 공용 갱신 스케줄러 (환경 변수 설정 사용, 지연 생성)
+
+    Args:
+        start: 백그라운드 갱신 스레드가 실행 중이 아니면 시작 (통계 조회 등에서는 False)
+
+    Returns:
+        RefreshScheduler 또는 None (REFRESH_SCHEDULER_ENABLED=false이거나 리뷰 저장소를 사용할 수 없는 경우)
+    """
+    global _default_scheduler
+
+    if os.environ.get("REFRESH_SCHEDULER_ENABLED", "true").lower() != "true":
+        return None
+    if get_review_store() is None:
+        return None
+
+    if _default_scheduler is None:
+        with _default_scheduler_lock:
+            if _default_scheduler is None:
+                scheduler = RefreshScheduler(
+                    path=os.environ.get("REFRESH_REGISTRY_PATH", DEFAULT_REGISTRY_PATH),
+                    interval=float(os.environ.get("REFRESH_INTERVAL", 1800)),
+                    max_age=float(os.environ.get("REFRESH_MAX_AGE", 3600)),
+                    budget_per_hour=float(os.environ.get("REFRESH_BUDGET_PER_HOUR", 120)),
+                    tick=float(os.environ.get("REFRESH_TICK", 15)),
+                    max_apps=int(os.environ.get("REFRESH_MAX_APPS", 500)),
+                    idle_seconds=float(os.environ.get("REFRESH_IDLE_DAYS", 7)) * 24 * 3600,
+                )
+                _default_scheduler = scheduler
+    if start:
+        _default_scheduler.start()
+    return _default_scheduler
@@ -0,0 +1,232 @@
+"""
+리뷰 저장소 모듈
+- 수집한 리뷰를 reviewId 기준으로 SQLite 파일에 저장 (일괄 upsert)
+- 앱 ID, 내용, 별점, 작성일, 수집 메타데이터(lang, country, 처음/마지막 수집 시각) 보관
+- 분석에 사용한 감정 스코어 저장 (리뷰 내용이 바뀌면 초기화)
+- 앱 ID + 기간으로 리뷰 조회 (/analyze에서 CSV 업로드 대신 사용)
+- thread-safe
+
+환경 변수:
+- REVIEW_STORE_ENABLED: 리뷰 저장소 사용 여부 (기본값: true)
+- REVIEW_STORE_PATH: 저장소 파일 경로 (기본값: .cache/reviews.sqlite3)
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = ".cache/reviews.sqlite3"
+
+# 조회 결과 컬럼 (크롤러 수집 결과와 같은 이름)
+REVIEW_COLUMNS = ["reviewId", "content", "score", "date", "app_id"]
+
+
+def _to_iso(value) -> Optional[str]:
+    """작성 시각을 ISO 문자열로 변환 (없으면 None)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, str):
+        return value
+    return pd.Timestamp(value).isoformat()
+
+
+class ReviewStore:
+    """
+    리뷰 저장소 (SQLite)
+
+    Args:
+        path: SQLite 파일 경로 (":memory:"이면 메모리 전용)
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.upserts = 0
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS reviews (
+                review_id TEXT PRIMARY KEY,
+                app_id TEXT NOT NULL,
+                content TEXT,
+                score INTEGER,
+                review_at TEXT,
+                date TEXT,
+                lang TEXT,
+                country TEXT,
+                sentiment_score REAL,
+                sentiment_scorer TEXT,
+                first_seen_at REAL NOT NULL,
+                last_seen_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_reviews_app_date ON reviews (app_id, date)")
+        self._conn.commit()
+        logger.info(f"리뷰 저장소 로드: {path}")
+
+    def upsert_reviews(self, reviews: pd.DataFrame, app_id: Optional[str] = None,
+                       lang: Optional[str] = None, country: Optional[str] = None) -> int:
+        """
+        리뷰 일괄 저장 (같은 reviewId가 있으면 내용/별점/작성일과 마지막 수집 시각 갱신)
+
+        Args:
+            reviews: reviewId, content, score 컬럼과 at 또는 date 컬럼을 가진 DataFrame
+            app_id: 앱 ID (None이면 reviews의 app_id 컬럼 사용)
+            lang / country: 수집 언어 및 국가
+
+        Returns:
+            저장한 리뷰 수
+        """
+        if reviews.empty or 'reviewId' not in reviews.columns:
+            return 0
+
+        now = time.time()
+        n = len(reviews)
+
+        def column(name: str) -> List:
+            return reviews[name].tolist() if name in reviews.columns else [None] * n
+
+        app_ids = column('app_id') if app_id is None else [app_id] * n
+        review_at = [_to_iso(value) for value in column('at')]
+        dates = column('date')
+        dates = [date if date is not None else (at[:10] if at else None) for date, at in zip(dates, review_at)]
+        scores = [int(score) if score is not None and not pd.isna(score) else None for score in column('score')]
+
+        rows = [
+            (str(review_id), str(row_app_id), content, score, at, date, lang, country, now, now)
+            for review_id, row_app_id, content, score, at, date
+            in zip(column('reviewId'), app_ids, column('content'), scores, review_at, dates)
+            if review_id is not None and row_app_id is not None
+        ]
+
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO reviews (review_id, app_id, content, score, review_at, date, lang, country,
+                                     first_seen_at, last_seen_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(review_id) DO UPDATE SET
+                    app_id = excluded.app_id,
+                    score = excluded.score,
+                    review_at = COALESCE(excluded.review_at, reviews.review_at),
+                    date = COALESCE(excluded.date, reviews.date),
+                    lang = COALESCE(excluded.lang, reviews.lang),
+                    country = COALESCE(excluded.country, reviews.country),
+                    sentiment_score = CASE WHEN excluded.content IS reviews.content
+                                           THEN reviews.sentiment_score END,
+                    sentiment_scorer = CASE WHEN excluded.content IS reviews.content
+                                            THEN reviews.sentiment_scorer END,
+                    content = excluded.content,
+                    last_seen_at = excluded.last_seen_at
+            """, rows)
+            self._conn.commit()
+            self.upserts += len(rows)
+        return len(rows)
+
+    def load_reviews(self, app_ids: List[str], start_date: Optional[str] = None,
+                     end_date: Optional[str] = None, include_sentiment: bool = False) -> pd.DataFrame:
+        """
+        앱 ID와 기간으로 리뷰 조회 (앱 ID 순서, 앱 내에서는 최신순)
+
+        Args:
+            app_ids: 앱 ID 리스트
+            start_date / end_date: 조회 기간 (YYYY-MM-DD, 양 끝 포함, None이면 제한 없음)
+            include_sentiment: 저장된 감정 스코어(sentiment_score, sentiment_scorer) 포함 여부
+
+        Returns:
+            reviewId, content, score, date, app_id 컬럼의 DataFrame
+        """
+        columns = REVIEW_COLUMNS + (["sentiment_score", "sentiment_scorer"] if include_sentiment else [])
+        if not app_ids:
+            return pd.DataFrame(columns=columns)
+
+        conditions = [f"app_id IN ({', '.join('?' * len(app_ids))})"]
+        params: List = list(app_ids)
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(end_date)
+
+        select = "review_id, content, score, date, app_id"
+        if include_sentiment:
+            select += ", sentiment_score, sentiment_scorer"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {select} FROM reviews WHERE {' AND '.join(conditions)} "
+                f"ORDER BY review_at DESC, review_id",
+                params
+            ).fetchall()
+
+        df = pd.DataFrame(rows, columns=columns)
+        order = {app_id: i for i, app_id in enumerate(app_ids)}
+        df = df.sort_values("app_id", key=lambda s: s.map(order), kind="stable").reset_index(drop=True)
+        return df
+
+    def update_sentiment(self, scores: Dict[str, float], scorer: str) -> int:
+        """분석한 감정 스코어 저장 ({reviewId: 스코어})"""
+        rows = [(float(score), scorer, str(review_id)) for review_id, score in scores.items()
+                if score is not None and not pd.isna(score)]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE reviews SET sentiment_score = ?, sentiment_scorer = ? WHERE review_id = ?", rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def stats(self) -> Dict:
+        """저장된 리뷰 수 및 앱 수"""
+        with self._lock:
+            reviews, apps, last_seen = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT app_id), MAX(last_seen_at) FROM reviews"
+            ).fetchone()
+            return {
+                'enabled': True,
+                'path': self.path,
+                'reviews': reviews,
+                'apps': apps,
+                'upserts': self.upserts,
+                'last_crawled_at': datetime.fromtimestamp(last_seen).isoformat() if last_seen else None,
+            }
+
+
+_default_store: Optional[ReviewStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_review_store() -> Optional[ReviewStore]:
+    """
+    프로세스 공용 리뷰 저장소 (환경 변수 설정 사용, 지연 생성)
+
+    Returns:
+        ReviewStore 또는 None (REVIEW_STORE_ENABLED=false이거나 파일을 열 수 없는 경우)
+    """
+    global _default_store
+
+    if os.environ.get("REVIEW_STORE_ENABLED", "true").lower() != "true":
+        return None
+
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                path = os.environ.get("REVIEW_STORE_PATH", DEFAULT_STORE_PATH)
+                try:
+                    _default_store = ReviewStore(path)
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"리뷰 저장소를 열 수 없습니다 ({path}): {e}")
+                    return None
+    return _default_store
@@ -0,0 +1,92 @@
+import { NextRequest, NextResponse } from 'next/server';
+
+// Python API 서버 URL (환경 변수에서 가져오거나 기본값 사용)
+// URL에 프로토콜이 없으면 자동으로 https:// 추가
+function getPythonApiUrl(): string {
+  const url = process.env.PYTHON_API_URL || 'http://localhost:5001';
+  // 프로토콜이 없으면 https:// 추가
+  if (url && !url.startsWith('http://') && !url.startsWith('https://')) {
+    return `https://${url}`;
+  }
+  return url;
+}
+
+const PYTHON_API_URL = getPythonApiUrl();
+
+// 분석 작업 요청을 Python API 서버로 전달 (GET: 상태 조회, DELETE: 취소)
+async function forwardJobRequest(id: string, method: 'GET' | 'DELETE') {
+  try {
+    const response = await fetch(`${PYTHON_API_URL}/analyze/jobs/${encodeURIComponent(id)}`, {
+      method,
+      cache: 'no-store',
+    });
+
+    const responseText = await response.text();
+
+    let data;
+    try {
+      data = JSON.parse(responseText);
+    } catch (jsonError) {
+      console.error('JSON 파싱 실패:', jsonError);
+      return NextResponse.json(
+        {
+          error: 'Python API 서버 응답을 파싱할 수 없습니다.',
+          details: responseText.substring(0, 500),
+          status: response.status,
+        },
+        { status: 500 }
+      );
+    }
+
+    if (!response.ok) {
+      return NextResponse.json(
+        {
+          error: data.error || 'Python API 서버 오류',
+          details: data.details || `HTTP ${response.status}`,
+        },
+        { status: response.status }
+      );
+    }
+
+    // 작업 상태 그대로 전달 (succeeded인 경우 result에 분석 결과 포함)
+    return NextResponse.json(data);
+
+  } catch (fetchError: any) {
+    console.error('Python API 호출 실패:', fetchError);
+
+    // 네트워크 오류인 경우
+    if (fetchError.code === 'ECONNREFUSED' || fetchError.message.includes('fetch failed')) {
+      return NextResponse.json(
+        {
+          error: 'Python API 서버에 연결할 수 없습니다.',
+          details: `서버 URL: ${PYTHON_API_URL}`,
+        },
+        { status: 503 }
+      );
+    }
+
+    return NextResponse.json(
+      {
+        error: 'Python API 서버 호출 중 오류가 발생했습니다.',
+        details: fetchError.message,
+      },
+      { status: 500 }
+    );
+  }
+}
+
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  const { id } = await params;
+  return forwardJobRequest(id, 'GET');
+}
+
+export async function DELETE(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  const { id } = await params;
+  return forwardJobRequest(id, 'DELETE');
+}
@@ -32,15 +32,15 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Python API 서버로 요청 전달
-    console.log('Python API 서버로 요청 전송 중...', PYTHON_API_URL);
+    // Python API 서버에 분석 작업 생성 요청 (결과는 /api/analyze/jobs/[id]로 폴링)
+    console.log('Python API 서버로 분석 작업 생성 요청 중...', PYTHON_API_URL);
     
     // FormData 생성
     const pythonFormData = new FormData();
     pythonFormData.append('reviews_data', reviewsFile);
 
     try {
-      const response = await fetch(`${PYTHON_API_URL}/analyze`, {
+      const response = await fetch(`${PYTHON_API_URL}/analyze/jobs`, {
         method: 'POST',
         body: pythonFormData,
         // CORS 헤더는 Python 서버에서 처리
@@ -78,12 +78,16 @@ export async function POST(request: NextRequest) {
         );
       }
 
-      // 성공 응답 그대로 전달
-      return NextResponse.json({
-        success: data.success || true,
-        data: data.data,
-        message: data.message || '분석이 완료되었습니다.',
-      });
+      // 작업 ID 전달 (분석은 Python API 서버의 백그라운드 워커에서 진행)
+      return NextResponse.json(
+        {
+          success: data.success || true,
+          job_id: data.job_id,
+          status: data.status,
+          message: '분석 작업이 시작되었습니다.',
+        },
+        { status: 202 }
+      );
 
     } catch (fetchError: any) {
       console.error('Python API 호출 실패:', fetchError);
@@ -10,6 +10,8 @@ import { AppCard } from '../components/comparison/AppCard';
 
 // Python API 서버 URL
 const PYTHON_API_URL = process.env.NEXT_PUBLIC_PYTHON_API_URL || 'http://localhost:5001';
+// 분석 작업 상태 조회 간격 (ms)
+const ANALYSIS_POLL_INTERVAL_MS = 2000;
 import {
   BarChart3,
   TrendingUp,
@@ -115,7 +117,7 @@ export default function Home() {
       const formData = new FormData();
       formData.append('reviews_data', blob, 'reviews.csv');
 
-      // 4. 분석 API 호출
+      // 4. 분석 작업 생성 (분석은 서버 백그라운드에서 진행)
       const analyzeResponse = await fetch('/api/analyze', {
         method: 'POST',
         body: formData,
@@ -126,14 +128,35 @@ export default function Home() {
         throw new Error(errorData.error || `분석 실패: ${analyzeResponse.status}`);
       }
 
-      const analyzeData = await analyzeResponse.json();
+      const { job_id: jobId } = await analyzeResponse.json();
+      if (!jobId) {
+        throw new Error('분석 작업을 시작하지 못했습니다.');
+      }
+
+      // 작업이 끝날 때까지 상태 폴링
+      let job: any = null;
+      while (true) {
+        await new Promise((resolve) => setTimeout(resolve, ANALYSIS_POLL_INTERVAL_MS));
+
+        const jobResponse = await fetch(`/api/analyze/jobs/${jobId}`, { cache: 'no-store' });
+        if (!jobResponse.ok) {
+          const errorData = await jobResponse.json().catch(() => ({}));
+          throw new Error(errorData.error || `분석 상태 조회 실패: ${jobResponse.status}`);
+        }
+
+        job = await jobResponse.json();
+        if (job.status === 'succeeded') break;
+        if (job.status === 'failed') throw new Error(job.error || '분석 중 오류가 발생했습니다.');
+        if (job.status === 'cancelled') throw new Error('분석 작업이 취소되었습니다.');
+      }
 
-      if (!analyzeData.success || !analyzeData.data || analyzeData.data.length === 0) {
+      const analysisData = job.result || [];
+      if (analysisData.length === 0) {
         throw new Error('분석 결과가 없습니다.');
       }
 
       // 5. 분석 결과를 UI 형식에 맞게 변환
-      const analysisResults: AnalysisResult[] = analyzeData.data.map((item: any) => ({
+      const analysisResults: AnalysisResult[] = analysisData.map((item: any) => ({
         keyword_group: item.keyword_group || item.keyword || '기타',
         keyword: item.keyword || item.keyword_group || '기타',
         total_reviews: item.total_reviews || 0,
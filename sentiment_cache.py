@@ -0,0 +1,311 @@
+"""
+감정 스코어 캐시 모듈
+- (clean_text 해시, scorer, 모델명, 프롬프트 버전) 키로 텍스트 감정 스코어 저장
+- 메모리 LRU + SQLite 디스크 저장소 2단 구조
+- TTL 및 최대 항목 수 기반 제거, 적중/미스 카운터 제공
+- CLI(analyse.py)와 API 서버(gunicorn 스레드)에서 함께 사용 (thread-safe)
+
+환경 변수:
+- SENTIMENT_CACHE_ENABLED: 캐시 사용 여부 (기본값: true)
+- SENTIMENT_CACHE_PATH: 디스크 캐시 파일 경로 (기본값: .cache/sentiment_cache.sqlite3)
+- SENTIMENT_CACHE_TTL_DAYS: 항목 유효 기간 (일, 기본값: 30)
+- SENTIMENT_CACHE_MAX_ENTRIES: 디스크 최대 항목 수 (기본값: 500000)
+- SENTIMENT_CACHE_MEMORY_ENTRIES: 메모리 LRU 최대 항목 수 (기본값: 20000)
+- SENTIMENT_CACHE_PURGE_INTERVAL: 만료 항목 삭제 및 디스크 항목 수 재계산 주기 (초, 기본값: 3600)
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = ".cache/sentiment_cache.sqlite3"
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def text_hash(text: str) -> str:
+    """캐시 키로 사용할 텍스트 해시 (SHA-256)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class SentimentCache:
+    """
+    감정 스코어 캐시 (메모리 LRU + SQLite)
+
+    Args:
+        path: SQLite 파일 경로 (None이면 메모리 전용)
+        ttl_seconds: 항목 유효 기간 (초)
+        max_entries: 디스크 최대 항목 수 (초과 시 오래 사용되지 않은 항목부터 제거)
+        memory_entries: 메모리 LRU 최대 항목 수
+        purge_interval: 만료 항목 삭제 및 디스크 항목 수(COUNT(*)) 재계산 주기 (초)
+            (테이블 전체를 훑는 작업이라 저장마다 실행하지 않고, 그 사이에는 새로 추가한 행 수로 항목 수를 유지)
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH, ttl_seconds: float = 30 * 86400,
+                 max_entries: int = 500_000, memory_entries: int = 20_000, purge_interval: float = 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.purge_interval = purge_interval
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[CacheKey, Tuple[float, float]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        # 디스크 항목 수 (다음 만료 삭제 때 COUNT(*)로 다시 맞춤, 다른 프로세스가 추가한 행도 그때 반영)
+        self._disk_entries: Optional[int] = None
+        self._next_purge = 0.0
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS sentiment_cache (
+                        text_hash TEXT NOT NULL,
+                        scorer TEXT NOT NULL,
+                        model TEXT NOT NULL,
+                        prompt_version TEXT NOT NULL,
+                        score REAL NOT NULL,
+                        created_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL,
+                        PRIMARY KEY (text_hash, scorer, model, prompt_version)
+                    )
+                """)
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_sentiment_cache_accessed ON sentiment_cache (accessed_at)"
+                )
+                self._conn.commit()
+                logger.info(f"감정 스코어 캐시 로드: {path}")
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"디스크 캐시를 열 수 없습니다 ({path}): {e}. 메모리 캐시만 사용합니다.")
+                self._conn = None
+
+    def _remember(self, key: CacheKey, score: float, created_at: float):
+        """메모리 LRU에 항목 추가 (락 보유 상태에서 호출)"""
+        self._memory[key] = (score, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, texts: Iterable[str], scorer: str, model: str,
+                 prompt_version: str) -> Dict[str, float]:
+        """
+        캐시된 감정 스코어 조회
+
+        Returns:
+            {텍스트: 스코어} (캐시에 있는 텍스트만 포함)
+        """
+        now = time.time()
+        expire_before = now - self.ttl_seconds
+        found: Dict[str, float] = {}
+        missing: Dict[CacheKey, str] = {}
+
+        with self._lock:
+            for text in set(texts):
+                key = (text_hash(text), scorer, model, prompt_version)
+                cached = self._memory.get(key)
+                if cached is not None and cached[1] >= expire_before:
+                    self._memory.move_to_end(key)
+                    found[text] = cached[0]
+                    self.memory_hits += 1
+                else:
+                    missing[key] = text
+
+            if missing and self._conn is not None:
+                keys = list(missing.keys())
+                try:
+                    # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+                    for start in range(0, len(keys), 200):
+                        chunk = keys[start:start + 200]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows = self._conn.execute(
+                            f"SELECT text_hash, score, created_at FROM sentiment_cache "
+                            f"WHERE scorer = ? AND model = ? AND prompt_version = ? "
+                            f"AND created_at >= ? AND text_hash IN ({placeholders})",
+                            [scorer, model, prompt_version, expire_before] + [key[0] for key in chunk]
+                        ).fetchall()
+                        for hash_value, score, created_at in rows:
+                            key = (hash_value, scorer, model, prompt_version)
+                            found[missing.pop(key)] = score
+                            self._remember(key, score, created_at)
+                            self._conn.execute(
+                                "UPDATE sentiment_cache SET accessed_at = ? WHERE text_hash = ? "
+                                "AND scorer = ? AND model = ? AND prompt_version = ?",
+                                (now, hash_value, scorer, model, prompt_version)
+                            )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"감정 스코어 캐시 조회 실패: {e}")
+
+            self.hits += len(found)
+            self.misses += len(missing)
+
+        return found
+
+    def set_many(self, scores: Dict[str, float], scorer: str, model: str, prompt_version: str):
+        """감정 스코어 저장 (None 스코어는 저장하지 않음)"""
+        now = time.time()
+        rows = [
+            (text_hash(text), scorer, model, prompt_version, float(score), now, now)
+            for text, score in scores.items() if score is not None
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            for row in rows:
+                self._remember(row[:4], row[4], now)
+            self.writes += len(rows)
+
+            if self._conn is None:
+                return
+            try:
+                new_rows = len(rows) - self._count_existing([row[0] for row in rows], scorer, model, prompt_version)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache "
+                    "(text_hash, scorer, model, prompt_version, score, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._evict(now, new_rows)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"감정 스코어 캐시 저장 실패: {e}")
+
+    def _count_existing(self, hashes: List[str], scorer: str, model: str, prompt_version: str) -> int:
+        """디스크에 이미 있는 키 수 (기본 키 인덱스 조회, 락 보유 상태에서 호출)"""
+        existing = 0
+        unique_hashes = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique_hashes), 200):
+            chunk = unique_hashes[start:start + 200]
+            placeholders = ",".join("?" * len(chunk))
+            existing += self._conn.execute(
+                f"SELECT COUNT(*) FROM sentiment_cache "
+                f"WHERE scorer = ? AND model = ? AND prompt_version = ? AND text_hash IN ({placeholders})",
+                [scorer, model, prompt_version] + chunk
+            ).fetchone()[0]
+        return existing
+
+    def _evict(self, now: float, new_rows: int):
+        """
+        만료 항목 및 최대 항목 수 초과분 제거 (락 보유 상태에서 호출)
+        만료 삭제와 COUNT(*)는 purge_interval마다 한 번만 실행하고, 초과분은 accessed_at 인덱스 순으로 제거
+        (만료 항목은 삭제 전에도 get_many에서 조회되지 않음)
+        """
+        if self._disk_entries is None or now >= self._next_purge:
+            cursor = self._conn.execute(
+                "DELETE FROM sentiment_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+            self._disk_entries = self._conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0]
+            self._next_purge = now + self.purge_interval
+        else:
+            self._disk_entries += new_rows
+
+        overflow = self._disk_entries - self.max_entries
+        if overflow > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM sentiment_cache WHERE rowid IN ("
+                "SELECT rowid FROM sentiment_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+            self._disk_entries -= max(cursor.rowcount, 0)
+
+    def stats(self) -> Dict:
+        """적중/미스 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': True,
+                'path': self.path if self._conn is not None else None,
+                'hits': self.hits,
+                'memory_hits': self.memory_hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'memory_entries': len(self._memory),
+            }
+
+
+def score_texts_cached(texts: List[str], score_fn: Callable[[List[str]], List[Optional[float]]],
+                       scorer: str, model: str, prompt_version: str,
+                       cache: Optional[SentimentCache] = None) -> List[Optional[float]]:
+    """
+    캐시를 먼저 조회하고, 캐시에 없는 고유 텍스트만 score_fn으로 분석
+    (캐시를 사용하지 않아도 같은 텍스트는 한 번만 분석하고 결과를 입력 순서대로 broadcast)
+
+    Args:
+        texts: 분석할 텍스트 리스트 (clean_text)
+        score_fn: 텍스트 리스트를 받아 같은 순서의 스코어 리스트를 반환하는 함수
+        scorer: 분석기 식별자 (예: 'hf', 'claude')
+        model: 모델 이름
+        prompt_version: 프롬프트/후처리 버전
+        cache: 사용할 캐시 (None이면 캐시 없이 분석)
+
+    Returns:
+        입력 순서대로의 스코어 리스트 (분석 실패 시 None)
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    if cache is None:
+        scores = dict(zip(unique_texts, score_fn(unique_texts)))
+        return [scores[text] for text in texts]
+
+    found = cache.get_many(unique_texts, scorer, model, prompt_version)
+    missing = [text for text in unique_texts if text not in found]
+
+    if missing:
+        logger.info(f"감정 스코어 캐시: 적중 {len(found)}개, 신규 분석 {len(missing)}개")
+        new_scores = dict(zip(missing, score_fn(missing)))
+        cache.set_many(new_scores, scorer, model, prompt_version)
+        found.update({text: score for text, score in new_scores.items() if score is not None})
+    else:
+        logger.info(f"감정 스코어 캐시: 모든 텍스트 적중 ({len(found)}개)")
+
+    return [found.get(text) for text in texts]
+
+
+_default_cache: Optional[SentimentCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_sentiment_cache() -> Optional[SentimentCache]:
+    """
+    프로세스 공용 감정 스코어 캐시 (환경 변수 설정 사용, 지연 생성)
+
+    Returns:
+        SentimentCache 또는 None (SENTIMENT_CACHE_ENABLED=false인 경우)
+    """
+    global _default_cache
+
+    if os.environ.get("SENTIMENT_CACHE_ENABLED", "true").lower() != "true":
+        return None
+
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = SentimentCache(
+                    path=os.environ.get("SENTIMENT_CACHE_PATH", DEFAULT_CACHE_PATH),
+                    ttl_seconds=float(os.environ.get("SENTIMENT_CACHE_TTL_DAYS", 30)) * 86400,
+                    max_entries=int(os.environ.get("SENTIMENT_CACHE_MAX_ENTRIES", 500_000)),
+                    memory_entries=int(os.environ.get("SENTIMENT_CACHE_MEMORY_ENTRIES", 20_000)),
+                    purge_interval=float(os.environ.get("SENTIMENT_CACHE_PURGE_INTERVAL", 3600)),
+                )
+    return _default_cache
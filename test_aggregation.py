@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+키워드 / 키워드 그룹 감정 집계 동등성 테스트
+- aggregate_by_keyword / aggregate_by_keyword_group의 JSON 출력이
+  기존 lambda 기반 집계(bench_aggregation.legacy_aggregate)와 바이트 단위로 같은지 확인
+- 소수 둘째 자리 스코어(평균이 소수 셋째 자리 반올림 경계에 자주 걸림), 결측 스코어 / 리뷰 ID, 문자열 리뷰 ID 포함
+- python test_aggregation.py 또는 pytest로 실행
+"""
+import os
+import sys
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from analyse import aggregate_by_keyword, aggregate_by_keyword_group
+from bench_aggregation import legacy_aggregate, synthetic_matches
+
+FRAMES = 1000
+
+
+def to_json(summary: pd.DataFrame) -> str:
+    return summary.to_json(orient="records", force_ascii=False, indent=2)
+
+
+def random_matches(seed: int) -> pd.DataFrame:
+    """반올림 경계에 걸리기 쉬운 작은 매칭 결과"""
+    rng = np.random.default_rng(seed)
+    rows = int(rng.integers(1, 60))
+    scores = np.round(rng.uniform(-1, 1, rows), 2)
+    scores[rng.random(rows) < 0.05] = np.nan
+    review_ids = rng.integers(0, max(rows // 2, 1), rows).astype(object)
+    if seed % 3 == 0:
+        review_ids = np.array([f"gp:{value}" for value in review_ids], dtype=object)
+    review_ids[rng.random(rows) < 0.05] = None
+    return pd.DataFrame({
+        "keyword_group": rng.choice(["성능", "광고", "결제"], rows),
+        "keyword": rng.choice(["렉", "버벅임", "광고", "결제 오류"], rows),
+        "review_id": review_ids,
+        "sentiment_score": scores,
+    })
+
+
+def assert_same(kw_df: pd.DataFrame, label: str):
+    assert to_json(aggregate_by_keyword(kw_df)) == to_json(legacy_aggregate(kw_df, ["keyword"])), f"{label}: keyword"
+    assert to_json(aggregate_by_keyword_group(kw_df)) == \
+        to_json(legacy_aggregate(kw_df, ["keyword_group", "keyword"])), f"{label}: keyword_group"
+
+
+def test_rounding_tie():
+    """반올림 경계: [-0.08, 0.51, 0.60, -0.24]의 groupby 평균은 0.197"""
+    kw_df = pd.DataFrame({
+        "keyword_group": ["성능"] * 4,
+        "keyword": ["렉"] * 4,
+        "review_id": [1, 2, 3, 4],
+        "sentiment_score": [-0.08, 0.51, 0.60, -0.24],
+    })
+    assert aggregate_by_keyword(kw_df)["avg_sentiment"].tolist() == [0.197]
+    assert_same(kw_df, "tie")
+
+
+def test_random_tie_prone_frames():
+    """소수 둘째 자리 스코어의 작은 매칭 결과 FRAMES개"""
+    for seed in range(FRAMES):
+        assert_same(random_matches(seed), f"seed {seed}")
+
+
+def test_synthetic_matches():
+    """벤치마크와 같은 합성 데이터 (키워드 그룹 전체)"""
+    assert_same(synthetic_matches(20000), "synthetic")
+
+
+def test_empty():
+    """빈 매칭 결과는 컬럼만 있는 빈 DataFrame"""
+    summary = aggregate_by_keyword(pd.DataFrame())
+    assert summary.empty and list(summary.columns)[0] == "keyword"
+
+
+def main():
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_') and callable(value)]
+    print("=" * 60)
+    print("키워드 감정 집계 동등성 테스트")
+    print("=" * 60)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__} {e}")
+    print("=" * 60)
+    print(f"{len(tests) - failed}/{len(tests)}개 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
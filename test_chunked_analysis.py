@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+청크 단위 스트리밍 분석(KeywordAggregate / analyze_in_chunks) 동등성 테스트
+- KeywordAggregate.update / merge / result가 전체 매칭 결과의 aggregate_by_keyword와 같은지
+  (평균이 소수 셋째 자리 반올림 경계에 걸리는 경우 포함)
+- CSV를 청크로 읽은 analyze_in_chunks 결과가 한 번에 읽은 분석 결과와 같은지
+- 워커 프로세스로 나누어 분석한 결과(aggregate_shards, analyze_in_chunks --workers)가 직렬 분석과 같은지
+- python test_chunked_analysis.py 또는 pytest로 실행 (모델 없이 별점 기반 스코어 사용)
+"""
+import os
+import random
+import sys
+import tempfile
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from analyse import (
+    KeywordAggregate,
+    aggregate_by_keyword,
+    aggregate_shards,
+    analyze_in_chunks,
+    analyze_reviews,
+    get_app_name,
+    load_data,
+    split_reviews,
+)
+from test_aggregation import random_matches, to_json
+
+KEYWORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keywords.csv')
+WORDS = ['렉', '버벅임', '로딩', '오래', '걸림', '광고', '결제', '오류', '좋아요', '별로', '화면', '업데이트']
+
+
+def chunked_aggregate(kw_df: pd.DataFrame, chunk_count: int) -> KeywordAggregate:
+    """매칭 결과를 행 순서대로 나누어 청크별 부분 집계를 합침"""
+    aggregate = KeywordAggregate()
+    for rows in np.array_split(np.arange(len(kw_df)), chunk_count):
+        part = KeywordAggregate()
+        part.update(kw_df.iloc[rows])
+        aggregate.merge(part)
+    return aggregate
+
+
+def write_reviews_csv(path: str, rows: int, seed: int = 0):
+    """키워드가 섞인 합성 리뷰 CSV (소수 둘째 자리 별점, 빈 텍스트 / 중복 리뷰 ID 포함)"""
+    rng = random.Random(seed)
+    pd.DataFrame({
+        'review_id': [rng.randint(1, rows * 3 // 4) for _ in range(rows)],
+        'app_id': [rng.choice(['com.example.a', 'com.example.b', 'com.example.a']) for _ in range(rows)],
+        'text': [None if rng.random() < 0.02 else ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 8)))
+                 for _ in range(rows)],
+        'rating': [round(rng.uniform(1, 5), 2) for _ in range(rows)],
+    }).to_csv(path, index=False)
+
+
+def test_rounding_tie():
+    """반올림 경계: 리뷰 하나씩 나누어 합쳐도 [-0.08, 0.51, 0.60, -0.24]의 평균은 0.197"""
+    kw_df = pd.DataFrame({
+        "keyword": ["렉"] * 4,
+        "review_id": [1, 2, 3, 4],
+        "sentiment_score": [-0.08, 0.51, 0.60, -0.24],
+    })
+    assert chunked_aggregate(kw_df, 4).result()["avg_sentiment"].tolist() == [0.197]
+
+
+def test_keyword_aggregate_matches_aggregate_by_keyword():
+    """반올림 경계에 걸리기 쉬운 매칭 결과를 1 / 2 / 3 / 7개 청크로 나누어 집계"""
+    for seed in range(300):
+        kw_df = random_matches(seed)
+        expected = to_json(aggregate_by_keyword(kw_df))
+        for chunk_count in (1, 2, 3, 7):
+            actual = to_json(chunked_aggregate(kw_df, min(chunk_count, len(kw_df))).result())
+            assert actual == expected, f"seed {seed}, 청크 {chunk_count}개"
+
+
+def test_sequential_updates():
+    """한 집계에 청크를 차례로 update해도 같은 결과"""
+    kw_df = random_matches(7)
+    aggregate = KeywordAggregate()
+    for rows in np.array_split(np.arange(len(kw_df)), 5):
+        aggregate.update(kw_df.iloc[rows])
+    assert to_json(aggregate.result()) == to_json(aggregate_by_keyword(kw_df))
+
+
+def test_empty_aggregate():
+    """업데이트가 없으면 aggregate_by_keyword(빈 DataFrame)와 같은 빈 결과"""
+    assert to_json(KeywordAggregate().result()) == to_json(aggregate_by_keyword(pd.DataFrame()))
+
+
+def test_analyze_in_chunks_matches_full_load():
+    """CSV 청크 분석 결과와 앱 이름이 전체 로드 분석과 같음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'reviews.csv')
+        write_reviews_csv(path, 20000)
+        reviews, keywords = load_data(path, KEYWORDS_PATH)
+        expected = to_json(aggregate_by_keyword(analyze_reviews(reviews, keywords)))
+        for chunksize in (999, 5000, 50000):
+            aggregate, app_name = analyze_in_chunks(path, keywords, chunksize)
+            assert to_json(aggregate.result()) == expected, f"chunksize {chunksize}"
+            assert app_name == get_app_name(reviews)
+
+
+def test_workers_match_serial():
+    """워커 2 / 3개로 샤드를 나누어 분석해도 직렬 분석과 같음 (샤드 크기가 달라 끝나는 순서가 섞임)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'reviews.csv')
+        write_reviews_csv(path, 20000, seed=1)
+        reviews, keywords = load_data(path, KEYWORDS_PATH)
+        expected = to_json(aggregate_by_keyword(analyze_reviews(reviews, keywords)))
+
+        shards = [reviews.iloc[start:end] for start, end in ((0, 9000), (9000, 9500), (9500, 15000), (15000, 20000))]
+        assert to_json(aggregate_shards(shards, keywords, workers=2).result()) == expected
+        assert to_json(aggregate_shards(split_reviews(reviews, 12), keywords, workers=3).result()) == expected
+
+        aggregate, app_name = analyze_in_chunks(path, keywords, 1500, workers=3)
+        assert to_json(aggregate.result()) == expected
+        assert app_name == get_app_name(reviews)
+
+
+def main():
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_') and callable(value)]
+    print("=" * 60)
+    print("청크 단위 스트리밍 분석 동등성 테스트")
+    print("=" * 60)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__} {e}")
+    print("=" * 60)
+    print(f"{len(tests) - failed}/{len(tests)}개 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
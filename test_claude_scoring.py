@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Claude 동시 감정 분석 엔진(claude_scoring.py) 오프라인 테스트
+- 실제 API 대신 가짜 score_fn / batch_score_fn으로 재시도, 마감 시간, 배치 분할, 결과 순서 확인
+- 네트워크나 API 키 없이 실행 가능 (python test_claude_scoring.py 또는 pytest)
+"""
+import os
+import sys
+import threading
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from claude_scoring import NO_DEADLINE, ClaudeScoringEngine, get_claude_rate_buckets, parse_score_array, scoring_deadline
+from rate_limit import TokenBucket
+
+
+class FakeAPIError(Exception):
+    """anthropic SDK의 APIStatusError와 같은 속성(status_code, response.headers)을 가진 가짜 오류"""
+
+    def __init__(self, status_code: int, retry_after: str = None):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = type('FakeResponse', (), {
+            'status_code': status_code,
+            'headers': {'retry-after': retry_after} if retry_after else {},
+        })()
+
+
+def fake_score(text: str) -> float:
+    """텍스트마다 다른 결정적 스코어 (결과 순서 확인용)"""
+    return round((len(text) % 20) / 10 - 1, 2)
+
+
+def make_engine(score_fn, **overrides) -> ClaudeScoringEngine:
+    """테스트용 엔진 (속도 제한 없음, 짧은 백오프)"""
+    config = dict(workers=4, requests_per_minute=60000, tokens_per_minute=10 ** 9,
+                  max_retries=3, base_delay=0.01, max_delay=0.05, deadline_seconds=None, batch_size=1)
+    config.update(overrides)
+    return ClaudeScoringEngine(score_fn, **config)
+
+
+def test_retries_on_429_and_5xx():
+    """429 / 5xx는 백오프 후 재시도하고 성공 결과를 반환"""
+    failures = {'429': 2, '529': 1}
+    lock = threading.Lock()
+
+    def score_fn(text, timeout):
+        with lock:
+            if failures.get(text, 0) > 0:
+                failures[text] -= 1
+                raise FakeAPIError(int(text), retry_after='0.01' if text == '429' else None)
+        return 0.5
+
+    engine = make_engine(score_fn)
+    assert engine.score(['429', '529', 'ok']) == [0.5, 0.5, 0.5]
+    assert engine.stats['retries'] == 3
+    assert engine.stats['succeeded'] == 3
+
+
+def test_no_retry_on_client_error_and_retry_exhaustion():
+    """400은 재시도하지 않고, 재시도를 모두 소진하면 None"""
+    calls = {'400': 0, '503': 0}
+
+    def score_fn(text, timeout):
+        calls[text] += 1
+        raise FakeAPIError(int(text))
+
+    engine = make_engine(score_fn, max_retries=2, workers=1)
+    assert engine.score(['400', '503']) == [None, None]
+    assert calls == {'400': 1, '503': 3}
+    assert engine.stats['failed'] == 2
+
+
+def test_deadline_skips_requests():
+    """마감 시각까지 토큰을 얻지 못하는 요청은 보내지 않고 None (deadline_skipped)"""
+    sent = []
+
+    def score_fn(text, timeout):
+        sent.append(text)
+        return 0.1
+
+    # 분당 2회 (버킷에 2개) → 세 번째 요청부터는 30초를 기다려야 하므로 0.3초 마감 안에 불가
+    engine = make_engine(score_fn, workers=1, request_bucket=TokenBucket(rate=2 / 60, capacity=2))
+    started = time.monotonic()
+    scores = engine.score([f'text{i}' for i in range(5)], deadline=time.monotonic() + 0.3)
+    assert scores[:2] == [0.1, 0.1] and scores[2:] == [None, None, None]
+    assert len(sent) == 2
+    assert engine.stats['deadline_skipped'] == 3
+    assert time.monotonic() - started < 1.0
+
+
+def test_shared_deadline_across_calls():
+    """분석 실행 전체 마감 시각을 넘기면 나누어 호출해도 마감이 다시 시작되지 않음"""
+    engine = make_engine(lambda text, timeout: 0.2, deadline_seconds=60)
+    deadline = time.monotonic() + 0.2
+    assert engine.score(['a', 'b'], deadline=deadline) == [0.2, 0.2]
+    time.sleep(0.25)
+    assert engine.score(['c'], deadline=deadline) == [None]
+
+
+def test_no_deadline_waits_for_tokens():
+    """NO_DEADLINE이면 deadline_seconds보다 오래 토큰을 기다려도 요청을 보냄 (백그라운드 작업용)"""
+    assert scoring_deadline(0) == NO_DEADLINE
+    engine = make_engine(lambda text, timeout: 0.3, workers=1, deadline_seconds=0.05,
+                         request_bucket=TokenBucket(rate=20, capacity=1))
+    assert engine.score(['a', 'b', 'c', 'd'], deadline=NO_DEADLINE) == [0.3] * 4
+    assert engine.stats['deadline_skipped'] == 0
+
+
+def test_deadline_skipped_texts_counts_batch_items():
+    """배치 요청을 마감 초과로 보내지 못하면 배치의 리뷰 수만큼 deadline_skipped_texts 증가"""
+    def batch_score_fn(items, timeout):
+        return {item_id: 0.1 for item_id, _ in items}
+
+    engine = make_engine(lambda text, timeout: 0.1, batch_score_fn=batch_score_fn, batch_size=3,
+                         batch_max_tokens=10 ** 6, workers=1, request_bucket=TokenBucket(rate=1 / 60, capacity=1))
+    scores = engine.score([f'리뷰 {i}' for i in range(9)], deadline=time.monotonic() + 0.2)
+    assert scores.count(0.1) == 3 and scores.count(None) == 6
+    assert (engine.stats['deadline_skipped'], engine.stats['deadline_skipped_texts']) == (2, 6)
+
+
+def test_batch_split_on_parse_failure_and_missing_ids():
+    """배치 응답 파싱 실패 시 반으로 나누고, 누락된 id만 다시 요청"""
+    texts = [f'리뷰 {i} ' + '가' * i for i in range(10)]
+    batch_sizes = []
+
+    def batch_score_fn(items, timeout):
+        batch_sizes.append(len(items))
+        if len(items) > 4:
+            return None  # 큰 배치는 파싱 실패
+        # 여러 리뷰를 묶은 배치는 첫 번째 항목이 응답에서 누락
+        return {item_id: fake_score(text) for item_id, text in (items[1:] if len(items) > 1 else items)}
+
+    def score_fn(text, timeout):
+        raise AssertionError("배치 모드에서는 개별 프롬프트를 사용하지 않아야 합니다.")
+
+    engine = make_engine(score_fn, batch_score_fn=batch_score_fn, batch_size=10, batch_max_tokens=10 ** 6)
+    assert engine.score(texts) == [fake_score(text) for text in texts]
+    assert batch_sizes[0] == 10 and 1 in batch_sizes
+    assert engine.stats['batch_splits'] > 0
+
+
+def test_single_item_batch_parse_failure():
+    """리뷰 1개짜리 배치도 배치 프롬프트로 요청하고, 응답에 스코어가 없으면 더 나누지 않고 None"""
+    calls = []
+
+    def batch_score_fn(items, timeout):
+        calls.append(len(items))
+        return None if items[0][1] == 'bad' else {items[0][0]: 0.4}
+
+    engine = make_engine(lambda text, timeout: 0.9, batch_score_fn=batch_score_fn, batch_size=5)
+    assert engine.score(['bad']) == [None]
+    assert engine.score(['ok']) == [0.4]
+    assert calls == [1, 1]
+
+
+def test_output_order_with_concurrent_workers():
+    """동시 요청이 늦게 끝나도 결과는 입력 순서대로"""
+    texts = ['x' * n for n in range(30, 0, -1)]
+
+    def score_fn(text, timeout):
+        # 앞쪽 텍스트일수록 늦게 끝남
+        time.sleep(len(text) / 1000)
+        return fake_score(text)
+
+    engine = make_engine(score_fn, workers=8)
+    assert engine.score(texts) == [fake_score(text) for text in texts]
+
+
+def test_batches_keep_order():
+    """배치 요청도 결과는 입력 순서대로"""
+    texts = [f'앱 리뷰 {i}' * (i % 4 + 1) for i in range(57)]
+
+    def batch_score_fn(items, timeout):
+        time.sleep(0.001 * (len(items) % 3))
+        response = '[' + ','.join(f'{{"id": {item_id}, "score": {fake_score(text)}}}' for item_id, text in reversed(items)) + ']'
+        return parse_score_array(response, [item_id for item_id, _ in items])
+
+    engine = make_engine(lambda text, timeout: fake_score(text), batch_score_fn=batch_score_fn, batch_size=7)
+    assert engine.score(texts) == [fake_score(text) for text in texts]
+    assert engine.stats['batch_requests'] >= 57 // 7
+
+
+def test_from_env_shares_rate_buckets():
+    """from_env로 만든 엔진은 프로세스 공용 RPM / TPM 버킷을 함께 사용"""
+    first = ClaudeScoringEngine.from_env(lambda text, timeout: 0.0)
+    second = ClaudeScoringEngine.from_env(lambda text, timeout: 0.0)
+    request_bucket, token_bucket = get_claude_rate_buckets()
+    assert first.request_bucket is second.request_bucket is request_bucket
+    assert first.token_bucket is second.token_bucket is token_bucket
+
+
+def main():
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_') and callable(value)]
+    print("=" * 60)
+    print("Claude 동시 감정 분석 엔진 테스트")
+    print("=" * 60)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__} {e}")
+    print("=" * 60)
+    print(f"{len(tests) - failed}/{len(tests)}개 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
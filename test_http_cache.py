@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+HTTP 응답 캐시(http_cache.py) 오프라인 테스트
+- fixture_server.py의 로컬 서버(fixtures/playstore 페이지, ETag / Last-Modified / 304)로
+  적중, 미적중, 유효 기간 만료, 조건부 재검증, 재검증 실패 시 저장 본문 사용, LRU 제거 확인
+- 네트워크 없이 실행 가능 (python test_http_cache.py 또는 pytest)
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from fixture_server import FIXTURES_DIR, FixtureServer
+from http_cache import HttpCache
+
+
+def detail_url(server: FixtureServer, app_id: str) -> str:
+    return f"{server.base_url}/store/apps/details?id={app_id}"
+
+
+def run_with_server(test):
+    """테스트마다 새 픽스처 서버와 메모리 캐시 사용"""
+    server = FixtureServer().start()
+    try:
+        test(server)
+    finally:
+        server.stop()
+
+
+def check_hit_and_miss(server):
+    cache = HttpCache(':memory:')
+    url = f"{server.base_url}/store/search?q=game&c=apps"
+    first = cache.fetch(requests.get, url, resource='search')
+    second = cache.fetch(requests.get, url, resource='search')
+    assert first == second == Path(FIXTURES_DIR, 'search.html').read_text(encoding='utf-8')
+    assert server.status_counts() == {200: 1}
+    stats = cache.stats()
+    assert (stats['misses'], stats['hits'], stats['entries']) == (1, 1, 1)
+    assert stats['hit_rate'] == 0.5
+
+
+def check_revalidate_with_etag(server):
+    cache = HttpCache(':memory:', ttls={'detail': 0})
+    url = detail_url(server, 'com.example.app')
+    body = cache.fetch(requests.get, url, resource='detail')
+    assert cache.fetch(requests.get, url, resource='detail') == body
+    assert server.status_counts() == {200: 1, 304: 1}
+    assert cache.stats()['revalidated'] == 1
+
+
+def check_revalidate_with_last_modified(server):
+    server.send_etag = False
+    cache = HttpCache(':memory:', ttls={'detail': 0})
+    url = detail_url(server, 'com.example.app')
+    body = cache.fetch(requests.get, url, resource='detail')
+    assert cache.fetch(requests.get, url, resource='detail') == body
+    assert server.status_counts() == {200: 1, 304: 1}
+
+
+def check_ttl_expiry_without_validators(server):
+    server.send_etag = False
+    server.send_last_modified = False
+    cache = HttpCache(':memory:', ttls={'detail': 0.2})
+    url = detail_url(server, 'com.example.app')
+    cache.fetch(requests.get, url, resource='detail')
+    cache.fetch(requests.get, url, resource='detail')
+    assert server.status_counts() == {200: 1}
+    time.sleep(0.25)
+    cache.fetch(requests.get, url, resource='detail')
+    assert server.status_counts() == {200: 2}
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['writes']) == (1, 2, 2)
+
+
+def check_stale_on_error(server):
+    cache = HttpCache(':memory:', ttls={'detail': 0})
+    url = detail_url(server, 'com.example.app')
+    body = cache.fetch(requests.get, url, resource='detail')
+
+    server.fail_status = 503
+    assert cache.fetch(requests.get, url, resource='detail') == body
+
+    # 4xx는 저장 본문을 쓰지 않고 예외
+    server.fail_status = 404
+    try:
+        cache.fetch(requests.get, url, resource='detail')
+        raise AssertionError("404 응답에서 예외가 발생하지 않았습니다.")
+    except requests.HTTPError:
+        pass
+
+    # 연결 오류
+    def refuse(url, **kwargs):
+        raise requests.ConnectionError("connection refused")
+    assert cache.fetch(refuse, url, resource='detail') == body
+    assert cache.stats()['stale'] == 2
+
+    # 저장된 본문이 없으면 그대로 예외
+    try:
+        cache.fetch(refuse, detail_url(server, 'com.other.app'), resource='detail')
+        raise AssertionError("저장된 본문 없이 연결 오류가 무시되었습니다.")
+    except requests.ConnectionError:
+        pass
+
+
+def check_lru_eviction_by_count(server):
+    cache = HttpCache(':memory:', max_entries=2)
+    urls = [detail_url(server, app_id) for app_id in ('a', 'b', 'c')]
+    cache.fetch(requests.get, urls[0], resource='detail')
+    time.sleep(0.01)
+    cache.fetch(requests.get, urls[1], resource='detail')
+    time.sleep(0.01)
+    cache.fetch(requests.get, urls[0], resource='detail')  # a를 최근 사용으로
+    time.sleep(0.01)
+    cache.fetch(requests.get, urls[2], resource='detail')  # 가장 오래 사용되지 않은 b 제거
+    stats = cache.stats()
+    assert (stats['entries'], stats['evictions']) == (2, 1)
+    assert cache._lookup(urls[1]) is None
+    assert cache._lookup(urls[0]) is not None and cache._lookup(urls[2]) is not None
+
+
+def check_lru_eviction_by_bytes(server):
+    cache = HttpCache(':memory:')
+    cache.fetch(requests.get, detail_url(server, 'probe'), resource='detail')
+    page_size = cache.stats()['bytes']
+
+    cache = HttpCache(':memory:', max_bytes=int(page_size * 2.5))
+    urls = [detail_url(server, app_id) for app_id in ('a', 'b', 'c', 'd')]
+    for url in urls:
+        cache.fetch(requests.get, url, resource='detail')
+        time.sleep(0.01)
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['bytes'] <= cache.max_bytes
+    assert stats['evictions'] == 2
+    assert cache._lookup(urls[0]) is None and cache._lookup(urls[3]) is not None
+
+    # 최대 크기보다 큰 본문은 저장하지 않음
+    tiny = HttpCache(':memory:', max_bytes=page_size - 1)
+    tiny.fetch(requests.get, urls[0], resource='detail')
+    assert tiny.stats()['entries'] == 0
+
+
+CHECKS = [
+    check_hit_and_miss,
+    check_revalidate_with_etag,
+    check_revalidate_with_last_modified,
+    check_ttl_expiry_without_validators,
+    check_stale_on_error,
+    check_lru_eviction_by_count,
+    check_lru_eviction_by_bytes,
+]
+
+
+def test_http_cache():
+    for check in CHECKS:
+        run_with_server(check)
+
+
+def main():
+    print("=" * 60)
+    print("HTTP 응답 캐시 테스트 (로컬 픽스처 서버)")
+    print("=" * 60)
+    failed = 0
+    for check in CHECKS:
+        try:
+            run_with_server(check)
+            print(f"✓ {check.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {check.__name__}: {type(e).__name__} {e}")
+    print("=" * 60)
+    print(f"{len(CHECKS) - failed}/{len(CHECKS)}개 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+다중 키워드 매처(keyword_matcher.py) 동등성 테스트
+- KeywordMatcher의 매칭 결과와 위치가 기존 방식(re.escape(키워드) + re.IGNORECASE 부분 문자열 검색)과 같은지 확인
+- 대소문자가 있는 모든 유니코드 문자 (ı/İ/ſ/K(켈빈 기호)/ς 등 re가 특별히 취급하는 문자 포함)
+- python test_keyword_matcher.py 또는 pytest로 실행
+"""
+import os
+import random
+import re
+import sys
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_matcher import KeywordMatcher
+
+# 대소문자 변환이 있는 모든 문자
+CASED_CHARS = [
+    ch for ch in map(chr, range(0x110000))
+    if not 0xD800 <= ord(ch) < 0xE000 and (ch.lower() != ch or ch.upper() != ch or ch.casefold() != ch)
+]
+TRICKY = ['i', 'I', 'ı', 'İ', 's', 'S', 'ſ', 'k', 'K', 'K', 'σ', 'ς', 'Σ', 'µ', 'μ', 'ß', 'ǅ', 'ǆ', 'ﬅ', 'ﬆ',
+          'u', 'U', '렉', '광고', ' ']
+
+
+def regex_matches(keywords, text):
+    """기존 방식: 키워드별 re.IGNORECASE 검색 (겹치는 등장 위치 포함)"""
+    return {
+        (entry_id, match.start())
+        for entry_id, keyword in enumerate(keywords) if keyword
+        for match in re.finditer(f"(?={re.escape(keyword)})", text, re.IGNORECASE)
+    }
+
+
+def test_review_examples():
+    """리뷰에 쓰일 만한 키워드 (ſ / ı / İ / 켈빈 기호 포함)"""
+    keywords = ['UI', 's', 'ads', '렉', '로딩 오래', 'OK']
+    texts = ['uı가 불편해요', 'ſuper', 'ADS 너무 많음 ads', '렉렉 로딩 오래 걸림', 'İyi ui', 'oK 좋아요', '', 'ΟΔΟΣ']
+    matcher = KeywordMatcher([(keyword, None) for keyword in keywords])
+    for text in texts:
+        assert set(matcher.iter_matches(text)) == regex_matches(keywords, text), text
+    assert matcher.matched_entries('uı') == [0]
+    assert matcher.matched_entries('ſ') == [1]
+
+
+def test_every_cased_character():
+    """대소문자가 있는 문자 하나짜리 키워드마다 모든 대소문자 문자를 나열한 텍스트에서 같은 위치 매칭"""
+    text = '\n'.join(CASED_CHARS)
+    matcher = KeywordMatcher([(ch, None) for ch in CASED_CHARS])
+    assert set(matcher.iter_matches(text)) == regex_matches(CASED_CHARS, text)
+
+
+def test_random_keywords_and_texts():
+    """헷갈리기 쉬운 문자로 만든 무작위 키워드 / 텍스트"""
+    rng = random.Random(0)
+    for _ in range(300):
+        keywords = [''.join(rng.choice(TRICKY) for _ in range(rng.randint(0, 3))) for _ in range(rng.randint(1, 6))]
+        matcher = KeywordMatcher([(keyword, None) for keyword in keywords])
+        for _ in range(10):
+            text = ''.join(rng.choice(TRICKY) for _ in range(rng.randint(0, 20)))
+            assert set(matcher.iter_matches(text)) == regex_matches(keywords, text), (keywords, text)
+
+
+def main():
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_') and callable(value)]
+    print("=" * 60)
+    print("다중 키워드 매처 동등성 테스트")
+    print("=" * 60)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__} {e}")
+    print("=" * 60)
+    print(f"{len(tests) - failed}/{len(tests)}개 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
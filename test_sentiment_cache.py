@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+감정 스코어 캐시(sentiment_cache.py) 테스트
+- 저장마다 COUNT(*) 없이 유지하는 디스크 항목 수가 실제 행 수와 같은지 (새 항목 / 덮어쓰기 섞임)
+- 최대 항목 수 초과 시 오래 사용되지 않은 항목부터 제거, 만료 항목은 purge_interval마다 삭제
+- python test_sentiment_cache.py 또는 pytest로 실행
+"""
+import os
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sentiment_cache import SentimentCache
+
+KEY = ('claude', 'test-model', 'v1')
+
+
+def disk_rows(cache: SentimentCache) -> int:
+    return cache._conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0]
+
+
+def test_running_count_matches_rows():
+    """새 항목과 덮어쓰기가 섞여도 유지하는 항목 수는 실제 행 수와 같음"""
+    cache = SentimentCache(':memory:', max_entries=10 ** 6, purge_interval=3600)
+    cache.set_many({f'리뷰 {i}': 0.1 for i in range(50)}, *KEY)
+    cache.set_many({f'리뷰 {i}': 0.2 for i in range(25, 80)}, *KEY)
+    cache.set_many({f'리뷰 {i}': 0.3 for i in range(10)}, 'claude', 'test-model', 'v2')
+    assert cache._disk_entries == disk_rows(cache) == 90
+
+
+def test_evicts_least_recently_used():
+    """최대 항목 수를 넘으면 accessed_at이 오래된 항목부터 제거"""
+    cache = SentimentCache(':memory:', max_entries=5, memory_entries=0, purge_interval=3600)
+    cache.set_many({f'a{i}': 0.5 for i in range(5)}, *KEY)
+    time.sleep(0.01)
+    assert cache.get_many(['a0', 'a1'], *KEY) == {'a0': 0.5, 'a1': 0.5}
+    time.sleep(0.01)
+    cache.set_many({'b0': -0.5, 'b1': -0.5}, *KEY)
+    assert cache._disk_entries == disk_rows(cache) == 5
+    assert cache.evictions == 2
+    assert set(cache.get_many(['a0', 'a1', 'a2', 'a3', 'a4', 'b0', 'b1'], *KEY)) == {'a0', 'a1', 'a4', 'b0', 'b1'}
+
+
+def test_expired_rows_purged_on_interval():
+    """만료 항목은 조회되지 않고, purge_interval이 지난 뒤 저장할 때 삭제"""
+    cache = SentimentCache(':memory:', ttl_seconds=0.05, memory_entries=0, purge_interval=0.2)
+    cache.set_many({'old': 0.5}, *KEY)
+    time.sleep(0.1)
+    cache.set_many({'new': 0.5}, *KEY)
+    assert cache.get_many(['old', 'new'], *KEY) == {'new': 0.5}
+    assert disk_rows(cache) == 2
+
+    time.sleep(0.2)
+    cache.set_many({'newer': 0.5}, *KEY)
+    assert cache._disk_entries == disk_rows(cache) == 1
+
+
+def main():
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_') and callable(value)]
+    print("=" * 60)
+    print("감정 스코어 캐시 테스트")
+    print("=" * 60)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__} {e}")
+    print("=" * 60)
+    print(f"{len(tests) - failed}/{len(tests)}개 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()